@@ -11,8 +11,10 @@ import pytest
 
 # Add the project root directory to Python path
 # This allows imports like "from src.parsers import ..."
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# (pytest.ini's `pythonpath = .` usually adds it already; don't add it twice)
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 
 # ========== Pytest Configuration ==========
@@ -57,6 +59,19 @@ def pytest_collection_modifyitems(config, items):
 
 # ========== Test Environment Setup ==========
 
+# (key, default) pairs; real values from the environment take precedence
+_TEST_ENV_DEFAULTS = (
+    ("QDRANT_URL", "http://localhost:6333"),
+    ("QDRANT_API_KEY", "test-api-key"),
+    ("OPENAI_API_KEY", "test-openai-key"),
+    ("AWS_ACCESS_KEY_ID", "test-access-key"),
+    ("AWS_SECRET_ACCESS_KEY", "test-secret-key"),
+    ("AWS_REGION", "us-east-1"),
+    ("VECTOR_SIZE", "1536"),
+    ("DYNAMODB_TABLE", "leh_evidence_test"),
+)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """
@@ -64,20 +79,8 @@ def setup_test_environment():
     Uses mock/test values for external services.
     """
     # Set test environment variables if not already set
-    test_env_vars = {
-        "QDRANT_URL": os.environ.get("QDRANT_URL", "http://localhost:6333"),
-        "QDRANT_API_KEY": os.environ.get("QDRANT_API_KEY", "test-api-key"),
-        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "test-openai-key"),
-        "AWS_ACCESS_KEY_ID": os.environ.get("AWS_ACCESS_KEY_ID", "test-access-key"),
-        "AWS_SECRET_ACCESS_KEY": os.environ.get("AWS_SECRET_ACCESS_KEY", "test-secret-key"),
-        "AWS_REGION": os.environ.get("AWS_REGION", "us-east-1"),
-        "VECTOR_SIZE": os.environ.get("VECTOR_SIZE", "1536"),
-        "DYNAMODB_TABLE": os.environ.get("DYNAMODB_TABLE", "leh_evidence_test"),
-    }
-
-    for key, value in test_env_vars.items():
-        if key not in os.environ:
-            os.environ[key] = value
+    for key, value in _TEST_ENV_DEFAULTS:
+        os.environ.setdefault(key, value)
 
     yield
 
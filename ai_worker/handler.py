@@ -10,22 +10,20 @@ Storage Architecture (Lambda Compatible):
 import json
 import logging
 import os
+import tempfile
 import urllib.parse
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import boto3
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 # Import AI Pipeline modules
-from src.parsers import (
-    ImageVisionParser,
-    PDFParser,
-    AudioParser,
-    VideoParser
-)
-from src.parsers.text import TextParser
+from src import parsers
+from src.parsers.text import TextParser  # noqa: F401 - route_parser looks it up via globals()
 from src.storage.metadata_store import MetadataStore
 from src.storage.vector_store import VectorStore
 from src.storage.schemas import EvidenceFile
@@ -37,6 +35,38 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 logger.addFilter(SensitiveDataFilter())
 
+# 한 이벤트의 여러 S3 레코드를 동시에 처리할 최대 스레드 수
+MAX_RECORD_WORKERS = 8
+
+
+# 확장자(소문자) → 파서 클래스 이름
+# 이름으로 보관하여 호출 시 모듈 전역에서 조회 (patch('handler.PDFParser') 호환)
+_PARSER_BY_EXT = MappingProxyType({
+    # 이미지 파일 - Vision API 우선 사용 (감정/맥락 분석)
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.gif', '.bmp'), 'ImageVisionParser'),
+    # PDF 파일
+    '.pdf': 'PDFParser',
+    # 오디오 파일
+    **dict.fromkeys(('.mp3', '.wav', '.m4a', '.aac'), 'AudioParser'),
+    # 비디오 파일
+    **dict.fromkeys(('.mp4', '.avi', '.mov', '.mkv'), 'VideoParser'),
+    # 텍스트 파일 (카톡 포함)
+    **dict.fromkeys(('.txt', '.csv', '.json'), 'TextParser'),
+})
+
+# PyPDF2, pytesseract, ffmpeg, openai 등 무거운 의존성을 가진 파서는
+# 해당 확장자가 처음 들어올 때 로드
+_LAZY_PARSERS = frozenset({'ImageVisionParser', 'PDFParser', 'AudioParser', 'VideoParser'})
+
+
+def __getattr__(name: str) -> Any:
+    """파서 클래스 지연 로딩 (PEP 562). 로드된 클래스는 모듈 전역에 캐시"""
+    if name in _LAZY_PARSERS:
+        value = getattr(parsers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def route_parser(file_extension: str) -> Optional[Any]:
     """
@@ -49,40 +79,32 @@ def route_parser(file_extension: str) -> Optional[Any]:
         적절한 파서 인스턴스 또는 None
     """
     ext = file_extension.lower()
+    parser_name = _PARSER_BY_EXT.get(ext)
 
-    # 이미지 파일
-    if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-        # Vision API 우선 사용 (감정/맥락 분석)
-        return ImageVisionParser()
-
-    # PDF 파일
-    elif ext == '.pdf':
-        return PDFParser()
-
-    # 오디오 파일
-    elif ext in ['.mp3', '.wav', '.m4a', '.aac']:
-        return AudioParser()
-
-    # 비디오 파일
-    elif ext in ['.mp4', '.avi', '.mov', '.mkv']:
-        return VideoParser()
-
-    # 텍스트 파일 (카톡 포함)
-    elif ext in ['.txt', '.csv', '.json']:
-        return TextParser()
-
-    else:
+    if parser_name is None:
         logger.warning(f"Unsupported file type: {ext}")
         return None
 
+    parser_class = globals().get(parser_name) or __getattr__(parser_name)
+    return parser_class()
 
-def route_and_process(bucket_name: str, object_key: str) -> Dict[str, Any]:
+
+def route_and_process(
+    bucket_name: str,
+    object_key: str,
+    s3_client: Any = None,
+    metadata_store: Optional[MetadataStore] = None,
+    vector_store: Optional[VectorStore] = None
+) -> Dict[str, Any]:
     """
     S3 파일을 파싱하고 분석하는 메인 처리 함수
 
     Args:
         bucket_name: S3 버킷 이름
         object_key: S3 객체 키 (파일 경로)
+        s3_client: 공유 S3 클라이언트 (None이면 새로 생성)
+        metadata_store: 공유 MetadataStore (None이면 새로 생성)
+        vector_store: 공유 VectorStore (None이면 새로 생성)
 
     Returns:
         처리 결과 딕셔너리
@@ -111,18 +133,19 @@ def route_and_process(bucket_name: str, object_key: str) -> Dict[str, Any]:
             }
 
         # S3에서 파일 다운로드
-        s3_client = boto3.client('s3')
-        local_path = f"/tmp/{file_path.name}"
-
-        # 임시 디렉토리가 없으면 생성
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        if s3_client is None:
+            s3_client = boto3.client('s3')
+        # 레코드가 병렬 처리되므로 같은 파일명이 겹치지 않도록 요청별 디렉토리 사용.
+        # Lambda의 /tmp는 warm 호출 간에 유지되므로 파싱 후 디렉토리째 삭제
+        with tempfile.TemporaryDirectory(dir="/tmp") as tmp_dir:
+            local_path = os.path.join(tmp_dir, file_path.name)
 
-        s3_client.download_file(bucket_name, object_key, local_path)
-        logger.info(f"Downloaded {object_key} to {local_path}")
+            s3_client.download_file(bucket_name, object_key, local_path)
+            logger.info(f"Downloaded {object_key} to {local_path}")
 
-        # 파서 실행
-        parsed_result = parser.parse(local_path)
-        logger.info(f"Parsed {object_key} with {parser.__class__.__name__}")
+            # 파서 실행
+            parsed_result = parser.parse(local_path)
+            logger.info(f"Parsed {object_key} with {parser.__class__.__name__}")
 
         # case_id 추출 (object_key에서 첫 번째 디렉토리 또는 bucket_name)
         # 예: cases/{case_id}/raw/ev_xxx_file.txt → case_id 추출
@@ -137,10 +160,12 @@ def route_and_process(bucket_name: str, object_key: str) -> Dict[str, Any]:
         source_type = parsed_result[0].metadata.get("source_type", "unknown") if parsed_result else "unknown"
 
         # 메타데이터 저장 (DynamoDB)
-        metadata_store = MetadataStore()
+        if metadata_store is None:
+            metadata_store = MetadataStore()
 
         # 벡터 임베딩 및 저장 (Qdrant)
-        vector_store = VectorStore()
+        if vector_store is None:
+            vector_store = VectorStore()
         chunk_ids = []
 
         for idx, message in enumerate(parsed_result):
@@ -305,6 +330,66 @@ def _extract_evidence_id_from_s3_key(object_key: str) -> Optional[str]:
     return None
 
 
+def _build_shared_clients() -> Dict[str, Any]:
+    """
+    레코드 병렬 처리 전에 S3/DynamoDB/Qdrant 클라이언트를 한 번만 생성
+
+    boto3 기본 세션에서의 클라이언트 생성은 스레드 안전하지 않으므로
+    워커 스레드가 아닌 호출 스레드에서 만들고, 생성된 클라이언트를 공유함.
+
+    Returns:
+        route_and_process에 넘길 키워드 인자 딕셔너리
+    """
+    metadata_store = MetadataStore()
+    _ = metadata_store.client  # 지연 생성되는 DynamoDB 클라이언트를 미리 생성
+    clients = {
+        "s3_client": boto3.client('s3'),
+        "metadata_store": metadata_store,
+    }
+
+    # QDRANT_URL 누락 등은 기존처럼 레코드별 실패 결과로 남도록 공유하지 않음
+    # (VectorStore 생성은 boto3를 사용하지 않음)
+    try:
+        clients["vector_store"] = VectorStore()
+    except ValueError as e:
+        logger.warning(f"VectorStore not shared across records: {e}")
+
+    return clients
+
+
+def _process_record(record: Dict[str, Any], clients: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    S3 이벤트 레코드 1건 처리 (예외는 실패 결과로 변환)
+
+    Args:
+        record: S3 이벤트 레코드
+        clients: _build_shared_clients()로 만든 공유 클라이언트 (None이면 레코드별 생성)
+
+    Returns:
+        처리 결과 딕셔너리
+    """
+    try:
+        # 1. S3 이벤트에서 버킷과 키(파일 경로) 추출
+        s3 = record.get("s3", {})
+        bucket_name = s3.get("bucket", {}).get("name")
+        object_key = s3.get("object", {}).get("key")
+
+        # URL Decoding (공백 등이 + 또는 %20으로 들어올 수 있음)
+        # 인코딩 문자가 없는 일반적인 키는 디코딩 생략
+        if object_key and ('%' in object_key or '+' in object_key):
+            object_key = urllib.parse.unquote_plus(object_key)
+
+        logger.info(f"Processing file: s3://{bucket_name}/{object_key}")
+
+        # 2. 파일 처리 로직 실행 (Strategy Pattern 적용)
+        return route_and_process(bucket_name, object_key, **(clients or {}))
+
+    except Exception as e:
+        logger.error(f"Error processing record: {e}", exc_info=True)
+        # 실제 운영 시에는 여기서 DLQ로 보내거나 에러를 다시 raise 해야 함
+        return {"error": str(e), "status": "failed"}
+
+
 def handle(event, context):
     """
     AWS Lambda Entrypoint.
@@ -316,31 +401,41 @@ def handle(event, context):
     if "Records" not in event:
         return {"status": "ignored", "reason": "No S3 Records found"}
 
-    results = []
+    records = event["Records"]
 
-    for record in event["Records"]:
-        try:
-            # 1. S3 이벤트에서 버킷과 키(파일 경로) 추출
-            s3 = record.get("s3", {})
-            bucket_name = s3.get("bucket", {}).get("name")
-            object_key = s3.get("object", {}).get("key")
-
-            # URL Decoding (공백 등이 + 또는 %20으로 들어올 수 있음)
-            if object_key:
-                object_key = urllib.parse.unquote_plus(object_key)
-
-            logger.info(f"Processing file: s3://{bucket_name}/{object_key}")
-
-            # 2. 파일 처리 로직 실행 (Strategy Pattern 적용)
-            result = route_and_process(bucket_name, object_key)
-            results.append(result)
-
-        except Exception as e:
-            logger.error(f"Error processing record: {e}", exc_info=True)
-            # 실제 운영 시에는 여기서 DLQ로 보내거나 에러를 다시 raise 해야 함
-            results.append({"error": str(e), "status": "failed"})
+    # 레코드별 처리는 S3 다운로드 등 I/O 위주이므로 여러 건이면 스레드로 병렬 처리
+    if len(records) <= 1:
+        results = [_process_record(record) for record in records]
+    else:
+        clients = _build_shared_clients()
+        with ThreadPoolExecutor(max_workers=min(len(records), MAX_RECORD_WORKERS)) as executor:
+            results = list(executor.map(lambda record: _process_record(record, clients), records))
 
     return {
         "statusCode": 200,
         "body": json.dumps({"results": results})
     }
+
+
+def _prewarm_parsers() -> None:
+    """
+    자주 쓰이는 파서 클래스를 미리 로드 (Lambda INIT 단계용)
+
+    첫 요청이 부담하던 파서 import 비용을 콜드 스타트 초기화 구간으로 옮김.
+    대상 확장자는 PARSER_PREWARM_EXTS 환경변수(쉼표 구분)로 조정 가능.
+    """
+    exts = os.environ.get('PARSER_PREWARM_EXTS', '.pdf,.jpg,.png,.txt')
+
+    for ext in exts.split(','):
+        parser_name = _PARSER_BY_EXT.get(ext.strip().lower())
+        if parser_name is None or parser_name in globals():
+            continue
+        try:
+            __getattr__(parser_name)
+        except ImportError as e:
+            logger.warning(f"Parser prewarm failed for {ext}: {e}")
+
+
+# Lambda 환경에서만 미리 로드 (로컬 테스트/CI는 지연 로딩 유지)
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    _prewarm_parsers()
@@ -29,6 +29,18 @@ class Article840Category(str, Enum):
     GENERAL = "general"  # 일반 증거 (특정 조항에 해당하지 않음)
 
 
+# 분류 이유에 쓰는 카테고리 표시명 (호출마다 dict를 새로 만들지 않도록 모듈 상수)
+_CATEGORY_NAMES = {
+    Article840Category.ADULTERY: "Adultery (Article 840-1)",
+    Article840Category.DESERTION: "Malicious Desertion (Article 840-2)",
+    Article840Category.MISTREATMENT_BY_INLAWS: "Mistreatment by In-laws (Article 840-3)",
+    Article840Category.HARM_TO_OWN_PARENTS: "Harm to Own Parents (Article 840-4)",
+    Article840Category.UNKNOWN_WHEREABOUTS: "Unknown Whereabouts (Article 840-5)",
+    Article840Category.IRRECONCILABLE_DIFFERENCES: "Irreconcilable Differences (Article 840-6)",
+    Article840Category.GENERAL: "General Evidence"
+}
+
+
 class TaggingResult(BaseModel):
     """
     태깅 결과
@@ -150,14 +162,16 @@ class Article840Tagger:
         # 각 카테고리별로 키워드 매칭
         category_matches = {}
         all_matched_keywords = []
+        # 중복 키워드 판정은 set으로 (리스트 탐색 대신 O(1) 조회)
+        seen_keywords = set()
 
         for category, data in self.keywords.items():
             matched_keywords = []
             for keyword in data["keywords"]:
-                if keyword in content_lower:
-                    if keyword not in all_matched_keywords:
-                        all_matched_keywords.append(keyword)
-                        matched_keywords.append(keyword)
+                if keyword not in seen_keywords and keyword in content_lower:
+                    seen_keywords.add(keyword)
+                    all_matched_keywords.append(keyword)
+                    matched_keywords.append(keyword)
 
             if matched_keywords:
                 category_matches[category] = {
@@ -193,10 +207,10 @@ class Article840Tagger:
         )
 
         # 상위 카테고리들 선택 (GENERAL 제외)
-        selected_categories = []
-        for category, match_data in sorted_categories:
-            if category != Article840Category.GENERAL:
-                selected_categories.append(category)
+        selected_categories = [
+            category for category, _ in sorted_categories
+            if category != Article840Category.GENERAL
+        ]
 
         # GENERAL 제외하고 매칭이 없으면 GENERAL 추가
         if not selected_categories:
@@ -285,18 +299,7 @@ class Article840Tagger:
         if not categories or categories == [Article840Category.GENERAL]:
             return f"General evidence with keywords: {', '.join(matched_keywords[:3])}"
 
-        # 카테고리 이름 매핑
-        category_names = {
-            Article840Category.ADULTERY: "Adultery (Article 840-1)",
-            Article840Category.DESERTION: "Malicious Desertion (Article 840-2)",
-            Article840Category.MISTREATMENT_BY_INLAWS: "Mistreatment by In-laws (Article 840-3)",
-            Article840Category.HARM_TO_OWN_PARENTS: "Harm to Own Parents (Article 840-4)",
-            Article840Category.UNKNOWN_WHEREABOUTS: "Unknown Whereabouts (Article 840-5)",
-            Article840Category.IRRECONCILABLE_DIFFERENCES: "Irreconcilable Differences (Article 840-6)",
-            Article840Category.GENERAL: "General Evidence"
-        }
-
-        category_list = [category_names[cat] for cat in categories]
+        category_list = [_CATEGORY_NAMES[cat] for cat in categories]
 
         reasoning = f"Classified as {', '.join(category_list)} based on {len(matched_keywords)} keywords"
 
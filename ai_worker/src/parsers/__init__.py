@@ -1,13 +1,67 @@
 """
 Parsers Module
 Handles parsing of various file types: KakaoTalk, Text, PDF, Images, Audio
+
+Only the base types are imported eagerly. Concrete parsers pull in heavy
+optional dependencies (PyPDF2, pytesseract, Pillow, ffmpeg, openai), so they
+are resolved lazily on first attribute access (PEP 562).
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import BaseParser, Message
-from .image_ocr import ImageOCRParser
-from .image_vision import ImageVisionParser
-from .pdf_parser import PDFParser
-from .audio_parser import AudioParser
-from .video_parser import VideoParser
+
+if TYPE_CHECKING:
+    # Static tools see the real symbols; at runtime they load via __getattr__
+    from .audio_parser import AudioParser
+    from .image_ocr import ImageOCRParser
+    from .image_vision import ImageVisionParser
+    from .pdf_parser import PDFParser
+    from .video_parser import VideoParser
+
+# public name -> submodule that defines it
+_LAZY = {
+    "ImageOCRParser": ".image_ocr",
+    "ImageVisionParser": ".image_vision",
+    "PDFParser": ".pdf_parser",
+    "AudioParser": ".audio_parser",
+    "VideoParser": ".video_parser",
+}
 
 __all__ = ["BaseParser", "Message", "ImageOCRParser", "ImageVisionParser", "PDFParser", "AudioParser", "VideoParser"]
+
+
+# name -> (message, missing module, original ImportError) for a parser whose
+# dependencies are missing; failed imports are not cached by Python, so
+# remember them to avoid re-probing disk. A fresh ImportError is raised each
+# time: re-raising one instance would grow its traceback on every access
+_FAILED = {}
+
+
+def __getattr__(name):
+    mod_path = _LAZY.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name in _FAILED:
+        message, missing, cause = _FAILED[name]
+        raise ImportError(message, name=missing) from cause
+
+    try:
+        module = importlib.import_module(mod_path, __name__)
+    except ImportError as e:
+        message = (
+            f"{name} requires {e.name or 'an optional dependency'!r}; "
+            f"install with: pip install -r requirements.txt"
+        )
+        _FAILED[name] = (message, e.name, e)
+        raise ImportError(message, name=e.name) from e
+
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -35,12 +35,6 @@ class Message(BaseModel):
             raise ValueError(f"Score must be between 0 and 10, got {v}")
         return v
 
-    class Config:
-        # datetime 직렬화 지원
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class BaseParser(ABC):
     """
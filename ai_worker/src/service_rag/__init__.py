@@ -1,18 +1,36 @@
 """Service RAG module for legal knowledge base"""
 
-from src.service_rag.schemas import (
-    Statute,
-    CaseLaw,
-    LegalChunk,
-    LegalSearchResult
-)
-from src.service_rag.legal_parser import (
-    LegalParser,
-    StatuteParser,
-    CaseLawParser
-)
-from src.service_rag.legal_vectorizer import LegalVectorizer
-from src.service_rag.legal_search import LegalSearchEngine
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.service_rag.schemas import (
+        Statute,
+        CaseLaw,
+        LegalChunk,
+        LegalSearchResult
+    )
+    from src.service_rag.legal_parser import (
+        LegalParser,
+        StatuteParser,
+        CaseLawParser
+    )
+    from src.service_rag.legal_vectorizer import LegalVectorizer
+    from src.service_rag.legal_search import LegalSearchEngine
+
+# Re-exports are resolved lazily (PEP 562) so that importing e.g.
+# src.service_rag.schemas does not drag in Qdrant/OpenAI via the vectorizer
+_NAME_TO_MOD = {
+    "Statute": "src.service_rag.schemas",
+    "CaseLaw": "src.service_rag.schemas",
+    "LegalChunk": "src.service_rag.schemas",
+    "LegalSearchResult": "src.service_rag.schemas",
+    "LegalParser": "src.service_rag.legal_parser",
+    "StatuteParser": "src.service_rag.legal_parser",
+    "CaseLawParser": "src.service_rag.legal_parser",
+    "LegalVectorizer": "src.service_rag.legal_vectorizer",
+    "LegalSearchEngine": "src.service_rag.legal_search",
+}
 
 __all__ = [
     "Statute",
@@ -25,3 +43,17 @@ __all__ = [
     "LegalVectorizer",
     "LegalSearchEngine",
 ]
+
+
+def __getattr__(name):
+    mod_path = _NAME_TO_MOD.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(mod_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_TO_MOD))
@@ -9,6 +9,7 @@ Architecture:
 
 import os
 import logging
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
@@ -568,11 +569,39 @@ class MetadataStore:
             return 0
 
     def get_case_summary(self, case_id: str) -> Dict[str, Any]:
-        """케이스 요약 정보"""
+        """
+        케이스 요약 정보
+
+        파일/청크 개수를 COUNT 쿼리 두 번 대신 record_type만 projection한
+        Query 한 번(페이지 포함)으로 읽어 Counter로 집계합니다.
+        """
+        counts = Counter()
+        params = {
+            'TableName': self.table_name,
+            'IndexName': 'case_id-index',
+            'KeyConditionExpression': 'case_id = :case_id',
+            'ExpressionAttributeValues': {':case_id': {'S': case_id}},
+            'ProjectionExpression': 'record_type'
+        }
+        try:
+            while True:
+                response = self.client.query(**params)
+                counts.update(
+                    item['record_type']['S']
+                    for item in response.get('Items', [])
+                    if 'record_type' in item
+                )
+                if 'LastEvaluatedKey' not in response:
+                    break
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except ClientError as e:
+            logger.error(f"DynamoDB count error for case {case_id}: {e}")
+            counts.clear()
+
         return {
             "case_id": case_id,
-            "file_count": self.count_files_by_case(case_id),
-            "chunk_count": self.count_chunks_by_case(case_id)
+            "file_count": counts['file'],
+            "chunk_count": counts['chunk']
         }
 
     def get_case_stats(self, case_id: str) -> Dict[str, Any]:
@@ -30,11 +30,6 @@ class EvidenceFile(BaseModel):
     case_id: str
     filepath: Optional[str] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class EvidenceChunk(BaseModel):
     """
@@ -59,11 +54,6 @@ class EvidenceChunk(BaseModel):
     vector_id: Optional[str] = None
     case_id: str
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 # 헬퍼 함수
 def generate_file_id() -> str:
@@ -102,8 +92,3 @@ class SearchResult(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     context_before: Optional[List[str]] = None
     context_after: Optional[List[str]] = None
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
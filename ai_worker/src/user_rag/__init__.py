@@ -1,11 +1,24 @@
 """User RAG module for case-specific search"""
 
-from src.user_rag.schemas import (
-    HybridSearchResult,
-    ContextualSearchRequest,
-    RankedSearchResult
-)
-from src.user_rag.hybrid_search import HybridSearchEngine
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.user_rag.schemas import (
+        HybridSearchResult,
+        ContextualSearchRequest,
+        RankedSearchResult
+    )
+    from src.user_rag.hybrid_search import HybridSearchEngine
+
+# Re-exports are resolved lazily (PEP 562) so that importing the schemas
+# does not load the search engines and their Qdrant client
+_NAME_TO_MOD = {
+    "HybridSearchResult": "src.user_rag.schemas",
+    "ContextualSearchRequest": "src.user_rag.schemas",
+    "RankedSearchResult": "src.user_rag.schemas",
+    "HybridSearchEngine": "src.user_rag.hybrid_search",
+}
 
 __all__ = [
     "HybridSearchResult",
@@ -13,3 +26,17 @@ __all__ = [
     "RankedSearchResult",
     "HybridSearchEngine",
 ]
+
+
+def __getattr__(name):
+    mod_path = _NAME_TO_MOD.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(mod_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_TO_MOD))
@@ -3,6 +3,7 @@ Hybrid Search Engine Module
 증거 검색 + 법률 지식 검색 통합
 """
 
+import heapq
 from typing import List
 from src.storage.search_engine import SearchEngine
 from src.service_rag.legal_search import LegalSearchEngine
@@ -125,11 +126,9 @@ class HybridSearchEngine:
                 )
                 all_results.append(hybrid_result)
 
-        # 3. 거리 기준 정렬 (낮은 거리 = 높은 유사도)
-        all_results.sort(key=lambda x: x.distance)
-
-        # 4. top_k 제한
-        return all_results[:top_k]
+        # 3. 거리 기준 상위 top_k 선택 (낮은 거리 = 높은 유사도)
+        # 전체 정렬 대신 부분 선택; sorted(...)[:top_k]와 결과/순서 동일
+        return heapq.nsmallest(top_k, all_results, key=lambda x: x.distance)
 
     def search_with_weights(
         self,
@@ -162,10 +161,8 @@ class HybridSearchEngine:
             else:
                 result.relevance_score *= legal_weight
 
-        # relevance_score 기준 재정렬
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-
-        return results[:top_k]
+        # relevance_score 기준 상위 top_k 선택
+        return heapq.nlargest(top_k, results, key=lambda x: x.relevance_score)
 
 
 # Mock for testing when storage_manager is None
@@ -1,5 +1,33 @@
 """Utility modules for AI Worker."""
 
-from .logging_filter import SensitiveDataFilter
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ['SensitiveDataFilter']
+if TYPE_CHECKING:
+    from .embeddings import get_embedding, get_embeddings_batch, get_embedding_dimension
+    from .logging_filter import SensitiveDataFilter
+
+# Resolved lazily (PEP 562): the embedding helpers pull in the OpenAI SDK,
+# which callers that only need the logging filter should not pay for
+_NAME_TO_MOD = {
+    "SensitiveDataFilter": "src.utils.logging_filter",
+    "get_embedding": "src.utils.embeddings",
+    "get_embeddings_batch": "src.utils.embeddings",
+    "get_embedding_dimension": "src.utils.embeddings",
+}
+
+__all__ = ['SensitiveDataFilter', 'get_embedding', 'get_embeddings_batch', 'get_embedding_dimension']
+
+
+def __getattr__(name):
+    mod_path = _NAME_TO_MOD.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(mod_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_TO_MOD))
@@ -3,11 +3,14 @@ Embedding Utilities for LEH AI Worker
 Generates vector embeddings using OpenAI API
 """
 
+from __future__ import annotations
+
 import os
 import logging
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,9 @@ def _get_client() -> OpenAI:
     """Get or create OpenAI client (singleton pattern)"""
     global _client
     if _client is None:
+        # Imported on first use so loading this module stays cheap
+        from openai import OpenAI
+
         api_key = os.environ.get('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
@@ -103,3 +103,15 @@ class TestLegalSearchEngine:
 
         assert len(results) > 0
         assert all(r.doc_type == "case_law" for r in results)
+
+
+class TestServiceRagPackageExports:
+    """src.service_rag 패키지 지연 re-export 테스트"""
+
+    def test_package_reexports_resolve_to_submodule_objects(self):
+        """패키지 수준 이름이 하위 모듈의 객체와 동일"""
+        import src.service_rag as service_rag
+
+        assert service_rag.LegalSearchEngine is LegalSearchEngine
+        assert service_rag.LegalSearchResult is LegalSearchResult
+        assert set(service_rag.__all__) <= set(dir(service_rag))
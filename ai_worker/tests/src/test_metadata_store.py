@@ -261,11 +261,12 @@ class TestStatistics:
         assert count == 5
 
     def test_get_case_summary(self, metadata_store, mock_dynamodb_client):
-        """케이스 요약 정보 테스트"""
-        # 파일 카운트와 청크 카운트에 대한 별도 응답
+        """케이스 요약 정보 테스트 (한 번의 Query를 페이지 단위로 집계)"""
+        file_item = {'record_type': {'S': 'file'}}
+        chunk_item = {'record_type': {'S': 'chunk'}}
         mock_dynamodb_client.query.side_effect = [
-            {'Count': 2},  # file count
-            {'Count': 10}  # chunk count
+            {'Items': [file_item] + [chunk_item] * 6, 'LastEvaluatedKey': {'evidence_id': {'S': 'x'}}},
+            {'Items': [file_item] + [chunk_item] * 4}
         ]
 
         summary = metadata_store.get_case_summary("case001")
@@ -273,6 +274,8 @@ class TestStatistics:
         assert summary["file_count"] == 2
         assert summary["chunk_count"] == 10
         assert summary["case_id"] == "case001"
+        assert mock_dynamodb_client.query.call_count == 2
+        assert mock_dynamodb_client.query.call_args.kwargs['ExclusiveStartKey'] == {'evidence_id': {'S': 'x'}}
 
 
 class TestCaseManagement:
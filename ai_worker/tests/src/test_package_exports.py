@@ -0,0 +1,35 @@
+"""
+Test suite for lazily re-exporting packages
+__all__, 지연 로딩 테이블, 실제 속성이 서로 일치하는지 검증
+"""
+
+import importlib
+
+import pytest
+
+
+LAZY_PACKAGES = [
+    ("src.parsers", "_LAZY"),
+    ("src.service_rag", "_NAME_TO_MOD"),
+    ("src.user_rag", "_NAME_TO_MOD"),
+    ("src.utils", "_NAME_TO_MOD"),
+]
+
+
+@pytest.mark.parametrize("package_name, table_name", LAZY_PACKAGES)
+class TestLazyPackageExports:
+    """PEP 562 지연 re-export 패키지 공통 테스트"""
+
+    def test_lazy_table_names_are_public(self, package_name, table_name):
+        """지연 로딩 대상 이름은 모두 __all__에 선언됨"""
+        package = importlib.import_module(package_name)
+
+        assert set(getattr(package, table_name)) <= set(package.__all__)
+
+    def test_all_names_resolve(self, package_name, table_name):
+        """__all__의 모든 이름이 실제 객체로 해석되고 dir()에 노출됨"""
+        package = importlib.import_module(package_name)
+
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
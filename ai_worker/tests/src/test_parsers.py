@@ -303,3 +303,56 @@ class TestTextParser:
         messages = parser.parse("tests/fixtures/text_sample.txt")
 
         assert len(messages) > 0
+
+
+class TestParsersPackageLazyExports:
+    """src.parsers 패키지의 지연 로딩(PEP 562) 테스트"""
+
+    def test_lazy_export_resolves_parser_class(self):
+        """__all__에 선언된 파서는 속성 접근 시 실제 클래스로 로드됨"""
+        import src.parsers as parsers
+        from src.parsers.pdf_parser import PDFParser
+
+        assert parsers.PDFParser is PDFParser
+        assert "PDFParser" in parsers.__all__
+
+    def test_lazy_export_listed_in_dir(self):
+        """dir()에 지연 로딩 대상 이름이 포함됨"""
+        import src.parsers as parsers
+
+        for name in parsers.__all__:
+            assert name in dir(parsers)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """정의되지 않은 이름은 AttributeError 발생"""
+        import src.parsers as parsers
+
+        with pytest.raises(AttributeError):
+            _ = parsers.NotAParser
+
+    def test_missing_dependency_raises_helpful_import_error_once(self, monkeypatch):
+        """의존성이 없는 파서는 안내 메시지와 함께 ImportError, 실패는 캐시됨"""
+        import importlib
+        import src.parsers as parsers
+
+        attempts = []
+
+        def failing_import(name, package=None):
+            attempts.append(name)
+            raise ModuleNotFoundError("No module named 'PyPDF2'", name="PyPDF2")
+
+        monkeypatch.delitem(vars(parsers), "PDFParser", raising=False)
+        monkeypatch.setattr(parsers, "_FAILED", {})
+        monkeypatch.setattr(importlib, "import_module", failing_import)
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(ImportError, match="PDFParser requires 'PyPDF2'") as exc_info:
+                _ = parsers.PDFParser
+            errors.append(exc_info.value)
+
+        assert attempts == [".pdf_parser"]
+        # 매번 새 예외를 생성 (같은 인스턴스의 traceback이 누적되지 않음)
+        assert errors[0] is not errors[1]
+        assert errors[1].name == "PyPDF2"
+        assert errors[1].__cause__ is errors[0].__cause__
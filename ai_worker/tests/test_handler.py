@@ -7,21 +7,43 @@ Phase 1: 2.1 Event 파싱 테스트
 - 지원하지 않는 파일 확장자 DLQ 전송
 """
 
-import json
 from unittest.mock import Mock, patch
-from handler import (
-    handle,
-    route_and_process,
-    route_parser,
-    _extract_case_id,
-    _extract_evidence_id_from_s3_key
-)
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def handler_mod():
+    """
+    handler 모듈을 테스트 실행 시점에 import
+    (수집 단계에서 파서/boto3 의존성을 로드하지 않도록)
+    """
+    import handler
+    return handler
+
+
+def _recorder():
+    """
+    route_and_process 대체용 호출 기록 함수 (MagicMock 대신 사용)
+    호출 인자는 .calls에 (bucket, key) 튜플로, 공유 클라이언트는 .clients에 쌓임
+    """
+    calls = []
+    clients = []
+
+    def process(bucket_name, object_key, **shared):
+        calls.append((bucket_name, object_key))
+        clients.append(shared)
+        return {"status": "processed"}
+
+    process.calls = calls
+    process.clients = clients
+    return process
 
 
 class TestS3EventParsing:
     """S3 이벤트 파싱 테스트 (2.1)"""
 
-    def test_extract_bucket_and_key_from_valid_s3_event(self):
+    def test_extract_bucket_and_key_from_valid_s3_event(self, handler_mod, monkeypatch):
         """
         Given: 유효한 S3 ObjectCreated 이벤트
         When: handle() 함수로 이벤트 처리
@@ -41,18 +63,17 @@ class TestS3EventParsing:
         context = {}
 
         # When
-        with patch('handler.route_and_process') as mock_process:
-            mock_process.return_value = {"status": "processed"}
-            result = handle(event, context)
+        process = _recorder()
+        monkeypatch.setattr(handler_mod, 'route_and_process', process)
+        result = handler_mod.handle(event, context)
 
         # Then
-        mock_process.assert_called_once_with(
-            "leh-evidence-bucket",
-            "cases/case123/evidence/document.pdf"
-        )
+        assert process.calls == [
+            ("leh-evidence-bucket", "cases/case123/evidence/document.pdf")
+        ]
         assert result["statusCode"] == 200
 
-    def test_handle_url_encoded_object_key_with_plus(self):
+    def test_handle_url_encoded_object_key_with_plus(self, handler_mod, monkeypatch):
         """
         Given: + 기호로 인코딩된 공백이 있는 객체 키
         When: S3 이벤트 처리
@@ -72,15 +93,15 @@ class TestS3EventParsing:
         context = {}
 
         # When
-        with patch('handler.route_and_process') as mock_process:
-            mock_process.return_value = {"status": "processed"}
-            handle(event, context)
+        process = _recorder()
+        monkeypatch.setattr(handler_mod, 'route_and_process', process)
+        handler_mod.handle(event, context)
 
         # Then: URL 디코딩된 키로 호출되어야 함 (+ → 공백)
-        called_key = mock_process.call_args[0][1]
+        called_key = process.calls[0][1]
         assert called_key == "folder/file with spaces.txt"
 
-    def test_handle_url_encoded_object_key_with_percent(self):
+    def test_handle_url_encoded_object_key_with_percent(self, handler_mod, monkeypatch):
         """
         Given: %20으로 인코딩된 공백이 있는 객체 키
         When: S3 이벤트 처리
@@ -100,15 +121,15 @@ class TestS3EventParsing:
         context = {}
 
         # When
-        with patch('handler.route_and_process') as mock_process:
-            mock_process.return_value = {"status": "processed"}
-            handle(event, context)
+        process = _recorder()
+        monkeypatch.setattr(handler_mod, 'route_and_process', process)
+        handler_mod.handle(event, context)
 
         # Then: URL 디코딩된 키로 호출되어야 함 (%20 → 공백)
-        called_key = mock_process.call_args[0][1]
+        called_key = process.calls[0][1]
         assert called_key == "folder/file with spaces.txt"
 
-    def test_ignore_non_s3_events(self):
+    def test_ignore_non_s3_events(self, handler_mod):
         """
         Given: S3 Records가 없는 이벤트
         When: handle() 함수 호출
@@ -119,13 +140,13 @@ class TestS3EventParsing:
         context = {}
 
         # When
-        result = handle(event, context)
+        result = handler_mod.handle(event, context)
 
         # Then
         assert result["status"] == "ignored"
         assert result["reason"] == "No S3 Records found"
 
-    def test_process_multiple_s3_records(self):
+    def test_process_multiple_s3_records(self, handler_mod, monkeypatch):
         """
         Given: 여러 개의 S3 레코드를 가진 이벤트
         When: handle() 함수 호출
@@ -151,20 +172,95 @@ class TestS3EventParsing:
         context = {}
 
         # When
-        with patch('handler.route_and_process') as mock_process:
-            mock_process.return_value = {"status": "processed"}
-            result = handle(event, context)
+        process = _recorder()
+        monkeypatch.setattr(handler_mod, 'route_and_process', process)
+        result = handler_mod.handle(event, context)
 
         # Then
-        assert mock_process.call_count == 2
+        import json
+        assert len(process.calls) == 2
         result_body = json.loads(result["body"])
         assert len(result_body["results"]) == 2
 
+    def test_multiple_records_keep_event_order(self, handler_mod, monkeypatch):
+        """
+        Given: 여러 개의 S3 레코드 (병렬 처리)
+        When: handle() 함수 호출
+        Then: 결과는 이벤트의 레코드 순서를 유지함
+        """
+        # Given
+        keys = [f"file{i}.pdf" for i in range(5)]
+        event = {
+            "Records": [
+                {"s3": {"bucket": {"name": "bucket"}, "object": {"key": key}}}
+                for key in keys
+            ]
+        }
+
+        # When
+        monkeypatch.setattr(
+            handler_mod, 'route_and_process',
+            lambda bucket, key, **shared: {"status": "processed", "file": key}
+        )
+        result = handler_mod.handle(event, {})
+
+        # Then
+        import json
+        result_body = json.loads(result["body"])
+        assert [r["file"] for r in result_body["results"]] == keys
+
+    def test_multiple_records_share_clients_built_before_fan_out(self, handler_mod, monkeypatch):
+        """
+        Given: 여러 개의 S3 레코드 (병렬 처리)
+        When: handle() 함수 호출 (실제 boto3 클라이언트 생성 경로)
+        Then: 클라이언트는 호출 스레드에서 한 번만 생성되고 모든 레코드가 공유함
+        """
+        import threading
+
+        real_client = handler_mod.boto3.client
+        creating_threads = []
+
+        def client(*args, **kwargs):
+            creating_threads.append(threading.current_thread())
+            return real_client(*args, **kwargs)
+
+        monkeypatch.setattr(handler_mod.boto3, 'client', client)
+        monkeypatch.setattr('src.storage.metadata_store.boto3.client', client)
+        process = _recorder()
+        monkeypatch.setattr(handler_mod, 'route_and_process', process)
+        event = {
+            "Records": [
+                {"s3": {"bucket": {"name": "bucket"}, "object": {"key": f"file{i}.txt"}}}
+                for i in range(4)
+            ]
+        }
+
+        handler_mod.handle(event, {})
+
+        assert len(process.calls) == 4
+        assert creating_threads == [threading.current_thread()] * 2
+        first = process.clients[0]
+        assert set(first) == {"s3_client", "metadata_store", "vector_store"}
+        for shared in process.clients[1:]:
+            assert all(shared[name] is first[name] for name in first)
+
+    def test_empty_records_returns_empty_results(self, handler_mod):
+        """
+        Given: Records가 빈 리스트인 이벤트
+        When: handle() 함수 호출
+        Then: 빈 결과 목록 반환
+        """
+        import json
+        result = handler_mod.handle({"Records": []}, {})
+
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {"results": []}
+
 
 class TestUnsupportedFileTypes:
     """지원하지 않는 파일 타입 처리 테스트 (2.1)"""
 
-    def test_skip_unsupported_file_extension(self):
+    def test_skip_unsupported_file_extension(self, handler_mod):
         """
         Given: 지원하지 않는 확장자 (.xyz)
         When: route_and_process() 호출
@@ -175,54 +271,83 @@ class TestUnsupportedFileTypes:
         key = "folder/unsupported.xyz"
 
         # When
-        result = route_and_process(bucket, key)
+        result = handler_mod.route_and_process(bucket, key)
 
         # Then
         assert result["status"] == "skipped"
         assert "unsupported" in result["reason"].lower()
         assert result["file"] == key
 
-    def test_supported_file_extensions(self):
+    def test_supported_file_extensions(self, handler_mod):
         """
         Given: 지원되는 확장자들
         When: route_parser() 호출
         Then: 적절한 파서 반환
         """
         # PDF
-        assert route_parser('.pdf') is not None
-        assert route_parser('.PDF') is not None  # 대소문자 무시
+        assert handler_mod.route_parser('.pdf') is not None
+        assert handler_mod.route_parser('.PDF') is not None  # 대소문자 무시
 
         # Images
-        assert route_parser('.jpg') is not None
-        assert route_parser('.png') is not None
+        assert handler_mod.route_parser('.jpg') is not None
+        assert handler_mod.route_parser('.png') is not None
 
         # Audio
-        assert route_parser('.mp3') is not None
-        assert route_parser('.wav') is not None
+        assert handler_mod.route_parser('.mp3') is not None
+        assert handler_mod.route_parser('.wav') is not None
 
         # Video
-        assert route_parser('.mp4') is not None
+        assert handler_mod.route_parser('.mp4') is not None
 
         # Text
-        assert route_parser('.txt') is not None
+        assert handler_mod.route_parser('.txt') is not None
 
-    def test_unsupported_extensions_return_none(self):
+    def test_unsupported_extensions_return_none(self, handler_mod):
         """
         Given: 지원하지 않는 확장자들
         When: route_parser() 호출
         Then: None 반환
         """
         # Unsupported extensions
-        assert route_parser('.xyz') is None
-        assert route_parser('.docx') is None
-        assert route_parser('.exe') is None
+        assert handler_mod.route_parser('.xyz') is None
+        assert handler_mod.route_parser('.docx') is None
+        assert handler_mod.route_parser('.exe') is None
+
+    def test_route_parser_is_case_insensitive_and_caches_class(self, handler_mod):
+        """
+        Given: 대소문자만 다른 확장자 ('.PDF', '.pdf')
+        When: route_parser() 호출
+        Then: 같은 파서 클래스를 반환하고, 로드된 클래스는 모듈에 캐시됨
+        """
+        from src.parsers.pdf_parser import PDFParser
+
+        upper = handler_mod.route_parser('.PDF')
+        lower = handler_mod.route_parser('.pdf')
+
+        assert type(upper) is type(lower) is PDFParser
+        assert vars(handler_mod)['PDFParser'] is PDFParser
+
+    def test_prewarm_parsers_loads_configured_extensions(self, handler_mod, monkeypatch):
+        """
+        Given: PARSER_PREWARM_EXTS 환경변수로 지정된 확장자
+        When: _prewarm_parsers() 호출
+        Then: 해당 파서 클래스가 모듈에 미리 로드됨 (미지원 확장자는 무시)
+        """
+        from src.parsers.audio_parser import AudioParser
+
+        monkeypatch.setenv('PARSER_PREWARM_EXTS', '.MP3, .xyz')
+        monkeypatch.delitem(vars(handler_mod), 'AudioParser', raising=False)
+
+        handler_mod._prewarm_parsers()
+
+        assert vars(handler_mod)['AudioParser'] is AudioParser
 
 
 class TestFileProcessing:
     """파일 타입별 처리 테스트 (2.2)"""
 
     @patch('handler.boto3')
-    def test_download_file_from_s3(self, mock_boto3):
+    def test_download_file_from_s3(self, mock_boto3, handler_mod):
         """
         Given: S3에 PDF 파일이 존재
         When: route_and_process() 호출
@@ -235,7 +360,7 @@ class TestFileProcessing:
         key = "test-file.pdf"
 
         # When
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             mock_parser_instance.parse.return_value = {
                 "content": "test content",
@@ -243,7 +368,7 @@ class TestFileProcessing:
             }
             mock_parser.return_value = mock_parser_instance
 
-            route_and_process(bucket, key)
+            handler_mod.route_and_process(bucket, key)
 
         # Then: S3 client가 파일을 다운로드했는지 확인
         mock_boto3.client.assert_called_once_with('s3')
@@ -254,6 +379,36 @@ class TestFileProcessing:
         assert call_args[1] == key
         assert '/tmp' in call_args[2] or 'tmp' in call_args[2].lower()
 
+    @patch('handler.boto3')
+    @patch('handler.MetadataStore')
+    @patch('handler.VectorStore')
+    def test_download_dir_removed_after_processing(
+        self, mock_vector_class, mock_metadata_class, mock_boto3, handler_mod
+    ):
+        """
+        Given: 레코드 처리를 위해 /tmp 하위 임시 디렉토리에 다운로드
+        When: _process_record() 완료
+        Then: 다운로드 디렉토리가 삭제됨 (warm 컨테이너의 /tmp 누적 방지)
+        """
+        import os
+
+        downloaded = []
+
+        def download_file(bucket, key, path):
+            with open(path, "w") as f:
+                f.write("content")
+            downloaded.append(path)
+
+        mock_boto3.client.return_value.download_file.side_effect = download_file
+        record = {"s3": {"bucket": {"name": "test-bucket"}, "object": {"key": "test-file.pdf"}}}
+
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
+            mock_parser.return_value.parse.return_value = []
+            handler_mod._process_record(record)
+
+        assert len(downloaded) == 1
+        assert not os.path.exists(os.path.dirname(downloaded[0]))
+
     @patch('handler.boto3')
     @patch('handler.MetadataStore')
     @patch('handler.VectorStore')
@@ -263,7 +418,8 @@ class TestFileProcessing:
         mock_tagger_class,
         mock_vector_class,
         mock_metadata_class,
-        mock_boto3
+        mock_boto3,
+        handler_mod
     ):
         """
         Given: S3에서 파일을 다운로드
@@ -302,7 +458,7 @@ class TestFileProcessing:
         mock_tagger_class.return_value = mock_tagger_instance
 
         # When
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             mock_message = Mock()
             mock_message.content = "parsed text content"
@@ -312,7 +468,7 @@ class TestFileProcessing:
             mock_parser_instance.parse.return_value = [mock_message]
             mock_parser.return_value = mock_parser_instance
 
-            result = route_and_process(bucket, key)
+            result = handler_mod.route_and_process(bucket, key)
 
         # Then: 파서가 실행되었는지 확인
         mock_parser_instance.parse.assert_called_once()
@@ -323,7 +479,7 @@ class TestFileProcessing:
 class TestErrorHandling:
     """에러 처리 테스트"""
 
-    def test_handle_malformed_s3_record(self):
+    def test_handle_malformed_s3_record(self, handler_mod):
         """
         Given: 잘못된 형식의 S3 레코드
         When: handle() 호출
@@ -343,13 +499,13 @@ class TestErrorHandling:
         context = {}
 
         # When
-        result = handle(event, context)
+        result = handler_mod.handle(event, context)
 
         # Then
         # 에러가 발생하더라도 statusCode는 200이어야 함 (Lambda 재시도 방지)
         assert result["statusCode"] == 200
 
-    def test_error_in_processing_returns_error_status(self):
+    def test_error_in_processing_returns_error_status(self, handler_mod):
         """
         Given: 파일 처리 중 예외 발생
         When: route_and_process() 호출
@@ -360,8 +516,8 @@ class TestErrorHandling:
         key = "test-file.pdf"
 
         # When
-        with patch('handler.route_parser', side_effect=Exception("Test error")):
-            result = route_and_process(bucket, key)
+        with patch.object(handler_mod, 'route_parser', side_effect=Exception("Test error")):
+            result = handler_mod.route_and_process(bucket, key)
 
         # Then
         assert result["status"] == "error"
@@ -381,7 +537,8 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class,
         mock_vector_class,
         mock_metadata_class,
-        mock_boto3
+        mock_boto3,
+        handler_mod
     ):
         """
         Given: PDF 파일 파싱 완료
@@ -418,7 +575,7 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class.return_value = mock_tagger_instance
 
         # Parser mock
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             mock_message = Mock()
             mock_message.content = "test content"
@@ -429,7 +586,7 @@ class TestStorageAndAnalysisIntegration:
             mock_parser.return_value = mock_parser_instance
 
             # When
-            result = route_and_process("test-bucket", "test.pdf")
+            result = handler_mod.route_and_process("test-bucket", "test.pdf")
 
         # Then
         mock_metadata_instance.save_evidence_file.assert_called_once_with(
@@ -449,7 +606,8 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class,
         mock_vector_class,
         mock_metadata_class,
-        mock_boto3
+        mock_boto3,
+        handler_mod
     ):
         """
         Given: 여러 청크로 파싱된 파일
@@ -486,7 +644,7 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class.return_value = mock_tagger_instance
 
         # Parser mock - 3개의 메시지 반환
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             messages = []
             for i in range(3):
@@ -500,7 +658,7 @@ class TestStorageAndAnalysisIntegration:
             mock_parser.return_value = mock_parser_instance
 
             # When
-            result = route_and_process("bucket", "chat.txt")
+            result = handler_mod.route_and_process("bucket", "chat.txt")
 
         # Then
         assert mock_vector_instance.add_evidence.call_count == 3
@@ -516,7 +674,8 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class,
         mock_vector_class,
         mock_metadata_class,
-        mock_boto3
+        mock_boto3,
+        handler_mod
     ):
         """
         Given: 파싱된 메시지들
@@ -554,7 +713,7 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class.return_value = mock_tagger_instance
 
         # Parser mock - 2개의 메시지
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             msg1 = Mock()
             msg1.content = "외도 증거"
@@ -570,7 +729,7 @@ class TestStorageAndAnalysisIntegration:
             mock_parser.return_value = mock_parser_instance
 
             # When
-            result = route_and_process("bucket", "evidence.txt")
+            result = handler_mod.route_and_process("bucket", "evidence.txt")
 
         # Then
         assert mock_tagger_instance.tag.call_count == 2
@@ -591,7 +750,8 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class,
         mock_vector_class,
         mock_metadata_class,
-        mock_boto3
+        mock_boto3,
+        handler_mod
     ):
         """
         Given: 파일 처리 완료
@@ -628,7 +788,7 @@ class TestStorageAndAnalysisIntegration:
         mock_tagger_class.return_value = mock_tagger_instance
 
         # Parser mock
-        with patch('handler.route_parser') as mock_parser:
+        with patch.object(handler_mod, 'route_parser') as mock_parser:
             mock_parser_instance = Mock()
             msg1 = Mock()
             msg1.content = "content1"
@@ -644,7 +804,7 @@ class TestStorageAndAnalysisIntegration:
             mock_parser.return_value = mock_parser_instance
 
             # When
-            result = route_and_process("complete-bucket", "complete.pdf")
+            result = handler_mod.route_and_process("complete-bucket", "complete.pdf")
 
         # Then
         assert result["status"] == "processed"
@@ -662,7 +822,7 @@ class TestStorageAndAnalysisIntegration:
 class TestE2EIntegration:
     """E2E 통합 테스트 (2.8) - Backend ↔ AI Worker"""
 
-    def test_extract_case_id_from_backend_format(self):
+    def test_extract_case_id_from_backend_format(self, handler_mod):
         """
         Given: Backend 형식 S3 키 (cases/{case_id}/raw/{ev_id}_{filename})
         When: _extract_case_id() 호출
@@ -672,12 +832,12 @@ class TestE2EIntegration:
         object_key = "cases/case_001/raw/ev_abc123_photo.jpg"
 
         # When
-        case_id = _extract_case_id(object_key, "fallback-bucket")
+        case_id = handler_mod._extract_case_id(object_key, "fallback-bucket")
 
         # Then
         assert case_id == "case_001"
 
-    def test_extract_case_id_from_legacy_format(self):
+    def test_extract_case_id_from_legacy_format(self, handler_mod):
         """
         Given: 레거시 형식 S3 키 (evidence/{case_id}/filename)
         When: _extract_case_id() 호출
@@ -687,12 +847,12 @@ class TestE2EIntegration:
         object_key = "evidence/case_002/document.pdf"
 
         # When
-        case_id = _extract_case_id(object_key, "fallback-bucket")
+        case_id = handler_mod._extract_case_id(object_key, "fallback-bucket")
 
         # Then
         assert case_id == "case_002"
 
-    def test_extract_case_id_fallback(self):
+    def test_extract_case_id_fallback(self, handler_mod):
         """
         Given: 형식이 맞지 않는 S3 키
         When: _extract_case_id() 호출
@@ -702,12 +862,12 @@ class TestE2EIntegration:
         object_key = "document.pdf"
 
         # When
-        case_id = _extract_case_id(object_key, "fallback-bucket")
+        case_id = handler_mod._extract_case_id(object_key, "fallback-bucket")
 
         # Then
         assert case_id == "fallback-bucket"
 
-    def test_extract_evidence_id_from_backend_format(self):
+    def test_extract_evidence_id_from_backend_format(self, handler_mod):
         """
         Given: Backend 형식 S3 키 (cases/{case_id}/raw/{ev_id}_{filename})
         When: _extract_evidence_id_from_s3_key() 호출
@@ -717,12 +877,12 @@ class TestE2EIntegration:
         object_key = "cases/case_001/raw/ev_abc123_photo.jpg"
 
         # When
-        evidence_id = _extract_evidence_id_from_s3_key(object_key)
+        evidence_id = handler_mod._extract_evidence_id_from_s3_key(object_key)
 
         # Then
         assert evidence_id == "ev_abc123"
 
-    def test_extract_evidence_id_with_underscore_in_filename(self):
+    def test_extract_evidence_id_with_underscore_in_filename(self, handler_mod):
         """
         Given: 파일명에 언더스코어가 포함된 S3 키
         When: _extract_evidence_id_from_s3_key() 호출
@@ -732,12 +892,12 @@ class TestE2EIntegration:
         object_key = "cases/case_001/raw/ev_xyz789_my_document_file.pdf"
 
         # When
-        evidence_id = _extract_evidence_id_from_s3_key(object_key)
+        evidence_id = handler_mod._extract_evidence_id_from_s3_key(object_key)
 
         # Then
         assert evidence_id == "ev_xyz789"
 
-    def test_extract_evidence_id_returns_none_for_legacy_format(self):
+    def test_extract_evidence_id_returns_none_for_legacy_format(self, handler_mod):
         """
         Given: 레거시 형식 S3 키 (evidence_id 없음)
         When: _extract_evidence_id_from_s3_key() 호출
@@ -747,12 +907,12 @@ class TestE2EIntegration:
         object_key = "evidence/case_002/document.pdf"
 
         # When
-        evidence_id = _extract_evidence_id_from_s3_key(object_key)
+        evidence_id = handler_mod._extract_evidence_id_from_s3_key(object_key)
 
         # Then
         assert evidence_id is None
 
-    def test_extract_evidence_id_returns_none_for_non_ev_prefix(self):
+    def test_extract_evidence_id_returns_none_for_non_ev_prefix(self, handler_mod):
         """
         Given: ev_ 접두어가 없는 S3 키
         When: _extract_evidence_id_from_s3_key() 호출
@@ -762,7 +922,7 @@ class TestE2EIntegration:
         object_key = "cases/case_001/raw/file_123_photo.jpg"
 
         # When
-        evidence_id = _extract_evidence_id_from_s3_key(object_key)
+        evidence_id = handler_mod._extract_evidence_id_from_s3_key(object_key)
 
         # Then
         assert evidence_id is None
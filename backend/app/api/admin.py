@@ -16,6 +16,7 @@ from app.db.schemas import (
     UserInviteRequest,
     InviteResponse,
     UserListResponse,
+    UserDeleteResponse,
     RolePermissionsResponse,
     UpdateRolePermissionsRequest,
     RolePermissions,
@@ -73,8 +74,8 @@ def invite_user(
     description="로펌 내 모든 사용자 목록을 조회합니다. 검색 및 필터링을 지원합니다."
 )
 def list_users(
-    email: Optional[str] = Query(None, description="이메일 검색 (부분 일치)"),
-    name: Optional[str] = Query(None, description="이름 검색 (부분 일치)"),
+    email: Optional[str] = Query(None, max_length=100, description="이메일 검색 (부분 일치)"),
+    name: Optional[str] = Query(None, max_length=100, description="이름 검색 (부분 일치)"),
     role: Optional[UserRole] = Query(None, description="역할 필터"),
     status: Optional[UserStatus] = Query(None, description="상태 필터"),
     current_user: User = Depends(require_admin),
@@ -113,6 +114,7 @@ def list_users(
 
 @router.delete(
     "/users/{user_id}",
+    response_model=UserDeleteResponse,
     status_code=status.HTTP_200_OK,
     summary="사용자 삭제",
     description="사용자를 soft delete (status를 inactive로 변경)합니다."
@@ -131,7 +133,7 @@ def delete_user(
         db: 데이터베이스 세션
 
     Returns:
-        dict: 성공 메시지
+        UserDeleteResponse: 성공 메시지
 
     Raises:
         ValidationError: 자기 자신을 삭제하려는 경우
@@ -141,7 +143,7 @@ def delete_user(
     service = UserManagementService(db)
     service.delete_user(user_id, current_user.id)
 
-    return {"message": "사용자가 삭제되었습니다.", "user_id": user_id}
+    return UserDeleteResponse(message="사용자가 삭제되었습니다.", user_id=user_id)
 
 
 @router.get(
@@ -227,6 +229,7 @@ def get_audit_logs(
     actions: Optional[List[AuditAction]] = Query(None, description="액션 타입 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(50, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=256, description="이전 응답의 next_cursor (지정 시 page 무시)"),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
@@ -245,6 +248,7 @@ def get_audit_logs(
       - GENERATE_DRAFT
     - page: 페이지 번호 (1부터 시작)
     - page_size: 페이지 크기 (1-100)
+    - cursor: 이전 응답의 next_cursor (키셋 페이지네이션, 깊은 페이지도 일정한 비용)
 
     **Response:**
     - 200: 감사 로그 목록 (페이지네이션 포함)
@@ -253,8 +257,10 @@ def get_audit_logs(
     - page: 현재 페이지
     - page_size: 페이지 크기
     - total_pages: 전체 페이지 수
+    - next_cursor: 다음 페이지 커서 (마지막 페이지면 null)
 
     **Errors:**
+    - 400: 잘못된 cursor
     - 401: 인증되지 않은 사용자
     - 403: Admin 권한 없음
 
@@ -268,13 +274,16 @@ def get_audit_logs(
     """
     service = AuditLogService(db)
 
-    request = AuditLogListRequest(
+    # Query() already validated every field (types, page >= 1, page_size <= 100,
+    # cursor length); skip re-running pydantic validation on the trusted values
+    request = AuditLogListRequest.model_construct(
         start_date=start_date,
         end_date=end_date,
         user_id=user_id,
         actions=actions,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
 
     return service.get_audit_logs(request)
@@ -322,11 +331,11 @@ def export_audit_logs(
     **Notes:**
     - 모든 로그를 한 번에 내보냅니다 (페이지네이션 없음)
     - 로그는 최신순으로 정렬됩니다
-    - 대량의 로그를 내보낼 경우 시간이 걸릴 수 있습니다
+    - 대량의 로그도 배치 단위로 조회하며 스트리밍합니다 (전체를 메모리에 올리지 않음)
     """
     service = AuditLogService(db)
 
-    csv_content = service.export_audit_logs_csv(
+    csv_chunks = service.export_audit_logs_csv(
         start_date=start_date,
         end_date=end_date,
         user_id=user_id,
@@ -336,9 +345,9 @@ def export_audit_logs(
     # Generate filename with current timestamp
     filename = f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    # Return CSV as streaming response
+    # Stream rows as they are fetched instead of buffering the whole file
     return StreamingResponse(
-        iter([csv_content]),
+        csv_chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -11,7 +11,7 @@ from fastapi import APIRouter, Depends, status, Response, Cookie, Header
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.db.session import get_db
-from app.db.schemas import LoginRequest, SignupRequest, TokenResponse, UserOut
+from app.db.schemas import LoginRequest, SignupRequest, TokenResponse, LogoutResponse, UserOut
 from app.services.auth_service import AuthService
 from app.core.config import settings
 from app.core.security import (
@@ -261,7 +261,7 @@ def refresh_token(
     )
 
 
-@router.post("/logout", status_code=status.HTTP_200_OK)
+@router.post("/logout", response_model=LogoutResponse, status_code=status.HTTP_200_OK)
 def logout(response: Response):
     """
     Logout and clear authentication cookies
@@ -281,7 +281,7 @@ def logout(response: Response):
     - For immediate token invalidation, implement a token blacklist
     """
     clear_auth_cookies(response)
-    return {"message": "Successfully logged out"}
+    return LogoutResponse(message="Successfully logged out")
 
 
 @router.get("/me", response_model=UserOut, status_code=status.HTTP_200_OK)
@@ -7,11 +7,13 @@ PATCH /cases/{id} - Update case
 DELETE /cases/{id} - Soft delete case
 GET /cases/{id}/evidence - List evidence for a case
 POST /cases/{id}/draft-preview - Generate draft preview
+POST /cases/{id}/draft-preview/stream - Stream draft preview (SSE)
 GET /cases/{id}/draft-export - Export draft as DOCX/PDF
 """
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Request
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -32,10 +34,13 @@ from app.services.case_service import CaseService
 from app.services.evidence_service import EvidenceService
 from app.services.draft_service import DraftService
 from app.core.dependencies import get_current_user_id
+from app.utils.etag import etag_json_response
 
 
 router = APIRouter()
 
+_evidence_list_adapter = TypeAdapter(List[EvidenceSummary])
+
 
 @router.post("", response_model=CaseOut, status_code=status.HTTP_201_CREATED)
 def create_case(
@@ -139,6 +144,7 @@ def update_case(
 @router.get("/{case_id}/evidence", response_model=List[EvidenceSummary])
 def list_case_evidence(
     case_id: str,
+    request: Request,
     categories: Optional[List[Article840Category]] = Query(None, description="Filter by Article 840 categories"),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -177,9 +183,11 @@ def list_case_evidence(
     - Only returns metadata, not full file content
     - AI analysis results (including article_840_tags) available when status="done"
     - Filtering by categories returns only evidence tagged with at least one of the specified categories
+    - Sends an ETag; polling clients that send it back as If-None-Match get 304 when nothing changed
     """
     evidence_service = EvidenceService(db)
-    return evidence_service.get_evidence_list(case_id, user_id, categories=categories)
+    evidence_list = evidence_service.get_evidence_list(case_id, user_id, categories=categories)
+    return etag_json_response(request, _evidence_list_adapter, evidence_list)
 
 
 @router.post("/{case_id}/draft-preview", response_model=DraftPreviewResponse)
@@ -232,6 +240,42 @@ def generate_draft_preview(
     return draft_service.generate_draft_preview(case_id, request, user_id)
 
 
+@router.post("/{case_id}/draft-preview/stream")
+def stream_draft_preview(
+    case_id: str,
+    request: DraftPreviewRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream draft preview as Server-Sent Events
+
+    Same input, checks and generation as POST /cases/{id}/draft-preview, but
+    the draft text is sent as GPT-4o produces it.
+
+    **Response:**
+    - 200: text/event-stream
+    - event "citations": list of evidence citations (first event)
+    - event "delta": {"text": "..."} draft text fragments
+    - event "done": {"generated_at": "..."}
+    - event "error": {"message": "..."} (terminal; replaces "done" if generation fails mid-stream)
+
+    **Errors:**
+    - 400: No evidence in case
+    - 401: Not authenticated
+    - 403: User does not have access to case
+    - 404: Case not found
+    """
+    draft_service = DraftService(db)
+    events = draft_service.generate_draft_preview_stream(case_id, request, user_id)
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{case_id}/draft-export")
 def export_draft(
     case_id: str,
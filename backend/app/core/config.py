@@ -68,6 +68,32 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = Field(default="", env="DATABASE_URL")
 
+    # Sync endpoints (def + Session) run in AnyIO's worker threadpool (default 40).
+    # Each in-flight DB query holds one worker, so this caps request concurrency.
+    DB_THREADPOOL_SIZE: int = Field(default=40, env="DB_THREADPOOL_SIZE")
+
+    # Connection pool (PostgreSQL only). pool_size + max_overflow should cover
+    # DB_THREADPOOL_SIZE so worker threads don't queue on connection checkout.
+    DB_POOL_SIZE: int = Field(default=20, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, env="DB_POOL_RECYCLE_SECONDS")
+    # Compiled SQL cache entries per engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = Field(default=2048, env="DB_QUERY_CACHE_SIZE")
+
+    # Background threads for overlapping DynamoDB/Qdrant calls with DB checks.
+    # Keep >= DB_THREADPOOL_SIZE: each request thread may wait on one call, and
+    # a smaller pool would queue reads that used to run concurrently inline.
+    IO_FANOUT_WORKERS: int = Field(default=40, env="IO_FANOUT_WORKERS")
+
+    # Raise on un-whitelisted lazy loads in list queries (tests/staging only)
+    STRICT_LOADING: bool = Field(default=False, env="STRICT_LOADING")
+
+    # Per-process cache of case_members access checks (0 = disabled)
+    CASE_ACCESS_CACHE_TTL_SECONDS: int = Field(default=30, env="CASE_ACCESS_CACHE_TTL_SECONDS")
+
+    # Per-process cache of generated draft previews (0 = disabled)
+    DRAFT_PREVIEW_CACHE_TTL_SECONDS: int = Field(default=3600, env="DRAFT_PREVIEW_CACHE_TTL_SECONDS")
+
     @property
     def database_url_computed(self) -> str:
         """
@@ -96,6 +122,8 @@ class Settings(BaseSettings):
     # ============================================
     DDB_EVIDENCE_TABLE: str = Field(default="leh_evidence", env="DDB_EVIDENCE_TABLE")
     DDB_CASE_SUMMARY_TABLE: str = Field(default="leh_case_summary", env="DDB_CASE_SUMMARY_TABLE")
+    # Per-process cache of evidence lists by case (0 = disabled)
+    EVIDENCE_LIST_CACHE_TTL_SECONDS: int = Field(default=10, env="EVIDENCE_LIST_CACHE_TTL_SECONDS")
 
     # ============================================
     # Qdrant Settings (Vector Database for RAG)
@@ -106,6 +134,8 @@ class Settings(BaseSettings):
     QDRANT_USE_HTTPS: bool = Field(default=False, env="QDRANT_USE_HTTPS")
     QDRANT_COLLECTION_PREFIX: str = Field(default="case_rag_", env="QDRANT_COLLECTION_PREFIX")
     QDRANT_DEFAULT_TOP_K: int = Field(default=5, env="QDRANT_DEFAULT_TOP_K")
+    # Per-process cache of semantic search results by case (0 = disabled)
+    QDRANT_SEARCH_CACHE_TTL_SECONDS: int = Field(default=60, env="QDRANT_SEARCH_CACHE_TTL_SECONDS")
 
     # ============================================
     # OpenAI / LLM Settings
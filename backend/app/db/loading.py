@@ -0,0 +1,34 @@
+"""
+Relationship loading helpers
+Guard list queries against accidental lazy loads (N+1)
+"""
+
+from typing import TypeVar, Union
+from sqlalchemy import Select
+from sqlalchemy.orm import Query, raiseload
+from app.core.config import settings
+
+_Q = TypeVar("_Q", bound=Union[Query, Select])
+
+
+def apply_safe_loading(query: _Q, *eager) -> _Q:
+    """
+    Apply eager-loading options and, under STRICT_LOADING, forbid the rest
+
+    With STRICT_LOADING on (tests/staging), any relationship not listed in
+    ``eager`` raises on access instead of issuing a lazy SELECT, so a new
+    attribute read in a response schema fails CI rather than quietly adding
+    one query per row. Off in production: lazy loads stay allowed.
+
+    Args:
+        query: ORM query or 2.0-style select()
+        *eager: Loader options that are allowed (e.g. contains_eager(...))
+
+    Returns:
+        Query with options applied
+    """
+    if settings.STRICT_LOADING:
+        return query.options(*eager, raiseload("*"))
+    if eager:
+        return query.options(*eager)
+    return query
@@ -3,17 +3,27 @@ SQLAlchemy ORM Models for LEH Backend
 Database tables: users, cases, case_members, audit_logs
 """
 
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
+import secrets
 import enum
 
 
 Base = declarative_base()
 
 
+def generate_id(prefix: str) -> str:
+    """
+    Generate a prefixed 12-hex-char ID (e.g. "case_1a2b3c4d5e6f")
+
+    Draws only the 6 random bytes the ID uses instead of building a full
+    uuid4 per row and discarding most of it.
+    """
+    return f"{prefix}_{secrets.token_hex(6)}"
+
+
 # ============================================
 # Enums
 # ============================================
@@ -52,7 +62,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, default=lambda: f"user_{uuid.uuid4().hex[:12]}")
+    id = Column(String, primary_key=True, default=lambda: generate_id("user"))
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
     name = Column(String, nullable=False)
@@ -74,7 +84,7 @@ class Case(Base):
     """
     __tablename__ = "cases"
 
-    id = Column(String, primary_key=True, default=lambda: f"case_{uuid.uuid4().hex[:12]}")
+    id = Column(String, primary_key=True, default=lambda: generate_id("case"))
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
     status = Column(SQLEnum(CaseStatus), nullable=False, default=CaseStatus.ACTIVE)
@@ -95,6 +105,10 @@ class CaseMember(Base):
     Case membership model - user access to cases
     """
     __tablename__ = "case_members"
+    __table_args__ = (
+        # PK is (case_id, user_id); "cases for this user" lookups lead with user_id
+        Index("ix_case_members_user_case", "user_id", "case_id"),
+    )
 
     case_id = Column(String, ForeignKey("cases.id"), primary_key=True)
     user_id = Column(String, ForeignKey("users.id"), primary_key=True)
@@ -114,7 +128,7 @@ class InviteToken(Base):
     """
     __tablename__ = "invite_tokens"
 
-    id = Column(String, primary_key=True, default=lambda: f"invite_{uuid.uuid4().hex[:12]}")
+    id = Column(String, primary_key=True, default=lambda: generate_id("invite"))
     email = Column(String, nullable=False, index=True)
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.LAWYER)
     token = Column(String, unique=True, nullable=False, index=True)
@@ -132,8 +146,14 @@ class AuditLog(Base):
     Audit log model - tracks all user actions
     """
     __tablename__ = "audit_logs"
-
-    id = Column(String, primary_key=True, default=lambda: f"audit_{uuid.uuid4().hex[:12]}")
+    __table_args__ = (
+        # Serves the per-user filter + ORDER BY timestamp DESC in the admin log view
+        Index("ix_audit_logs_user_timestamp", "user_id", "timestamp"),
+        # Unfiltered view: ORDER BY timestamp DESC, id DESC and the keyset seek
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: generate_id("audit"))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     action = Column(String, nullable=False)  # e.g., "VIEW_EVIDENCE", "CREATE_CASE"
     object_id = Column(String, nullable=True)  # evidence_id or case_id
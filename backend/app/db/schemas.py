@@ -3,7 +3,7 @@ Pydantic schemas (DTOs) for request/response validation
 Separated from SQLAlchemy models per BACKEND_SERVICE_REPOSITORY_GUIDE.md
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -36,8 +36,7 @@ class UserOut(BaseModel):
     status: UserStatus
     created_at: datetime
 
-    class Config:
-        from_attributes = True  # Pydantic v2 (was orm_mode in v1)
+    model_config = ConfigDict(from_attributes=True)  # Pydantic v2 (was orm_mode in v1)
 
 
 class TokenResponse(BaseModel):
@@ -48,6 +47,11 @@ class TokenResponse(BaseModel):
     user: UserOut
 
 
+class LogoutResponse(BaseModel):
+    """Logout response schema"""
+    message: str
+
+
 # ============================================
 # User Management Schemas
 # ============================================
@@ -72,6 +76,12 @@ class UserListResponse(BaseModel):
     total: int
 
 
+class UserDeleteResponse(BaseModel):
+    """User delete (soft delete) response schema"""
+    message: str
+    user_id: str
+
+
 # ============================================
 # RBAC / Permission Schemas
 # ============================================
@@ -129,8 +139,7 @@ class CaseOut(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CaseSummary(BaseModel):
@@ -166,8 +175,7 @@ class CaseMemberOut(BaseModel):
     permission: CaseMemberPermission
     role: CaseMemberRole  # Actual DB role (owner/member/viewer)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AddCaseMembersRequest(BaseModel):
@@ -345,8 +353,7 @@ class AuditLogOut(BaseModel):
     object_id: Optional[str] = None
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogListRequest(BaseModel):
@@ -357,6 +364,7 @@ class AuditLogListRequest(BaseModel):
     actions: Optional[List[AuditAction]] = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=50, ge=1, le=100)
+    cursor: Optional[str] = Field(default=None, max_length=256)  # next_cursor from the previous page; overrides page
 
 
 class AuditLogListResponse(BaseModel):
@@ -366,3 +374,15 @@ class AuditLogListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+# ============================================
+# Health Check Schemas
+# ============================================
+class HealthResponse(BaseModel):
+    """Health check response schema"""
+    status: str
+    service: str
+    version: str
+    timestamp: datetime  # serialized to ISO 8601 by pydantic-core
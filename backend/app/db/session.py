@@ -40,18 +40,28 @@ def init_db():
 
         # PostgreSQL connection args with timeout
         connect_args = {}
+        pool_args = {}
         if "sqlite" in database_url:
             connect_args = {"check_same_thread": False}
         else:
             # PostgreSQL: add connection timeout (5 seconds)
             connect_args = {"connect_timeout": 5}
+            # Size the pool to the endpoint threadpool (default QueuePool is 5+10)
+            pool_args = {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+                "pool_use_lifo": True,  # Reuse warm connections; idle extras age out
+            }
 
         engine = create_engine(
             database_url,
             connect_args=connect_args,
             pool_pre_ping=True,
             pool_timeout=10,  # Wait max 10s for connection from pool
-            echo=settings.APP_DEBUG
+            echo=settings.APP_DEBUG,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            **pool_args
         )
 
         SessionLocal = sessionmaker(
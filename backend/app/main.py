@@ -10,13 +10,14 @@ import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from mangum import Mangum  # AWS Lambda handler
 
 # Import configuration and middleware
 from app.core.config import settings
+from app.db.schemas import HealthResponse
 
 # Import API routers
 from app.api import auth, admin, cases, evidence
@@ -59,6 +60,11 @@ async def lifespan(_app: FastAPI):
     logger.info("📍 Debug mode: %s", settings.APP_DEBUG)
     logger.info("📍 CORS origins: %s", settings.cors_origins_list)
 
+    # Sync route handlers block a worker thread for the duration of each DB call;
+    # size the pool so concurrency is not capped at AnyIO's default of 40
+    to_thread.current_default_thread_limiter().total_tokens = settings.DB_THREADPOOL_SIZE
+    logger.info("📍 Threadpool size: %s", settings.DB_THREADPOOL_SIZE)
+
     # Note: Database connection pool is managed per-request via get_db()
     # Note: AWS services (S3, DynamoDB) currently use mock implementations
     # Note: Qdrant client is initialized on-demand in utils/qdrant.py (in-memory mode for local dev)
@@ -143,7 +149,7 @@ async def root():
     }
 
 
-@app.get("/health", tags=["Health"])
+@app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
     """
     헬스 체크 엔드포인트
@@ -153,15 +159,15 @@ async def health_check():
     API_SPEC.md 기준:
     - 200 OK: 서버 정상 동작
     - 간단한 응답 형식 (에러 처리 불필요)
+
+    response_model로 반환해 Pydantic이 JSON bytes로 직접 직렬화한다
+    (LB가 자주 호출하므로 JSONResponse의 stdlib json 경로를 피함)
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "ok",
-            "service": "Legal Evidence Hub API",
-            "version": "0.2.0",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+    return HealthResponse(
+        status="ok",
+        service="Legal Evidence Hub API",
+        version="0.2.0",
+        timestamp=datetime.now(timezone.utc)
     )
 
 
@@ -4,15 +4,19 @@ Logs user actions (LOGIN, VIEW, CREATE, UPDATE, DELETE) to audit_logs table
 """
 
 from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.db.schemas import AuditAction
-from typing import Optional
+from typing import Optional, Tuple
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
 
 # Sensitive endpoints to log (HTTP method + path pattern)
 AUDITABLE_ENDPOINTS = {
@@ -33,8 +37,8 @@ AUDITABLE_ENDPOINTS = {
     ("POST", r"^/admin/users/invite$"): AuditAction.INVITE_USER,
     ("DELETE", r"^/admin/users/[^/]+$"): AuditAction.DELETE_USER,
 
-    # Draft
-    ("POST", r"^/cases/[^/]+/draft-preview$"): AuditAction.GENERATE_DRAFT,
+    # Draft (buffered and SSE-streamed preview)
+    ("POST", r"^/cases/[^/]+/draft-preview(/stream)?$"): AuditAction.GENERATE_DRAFT,
 }
 
 
@@ -58,6 +62,44 @@ def extract_object_id(path: str, pattern: str) -> Optional[str]:
     return None
 
 
+def _compile_endpoints(endpoints: dict) -> dict:
+    """
+    Group AUDITABLE_ENDPOINTS by method with precompiled regexes
+
+    The ID placeholder is compiled as a capture group (as extract_object_id
+    does), so one match both selects the endpoint and yields the object ID.
+    """
+    by_method = {}
+    for (method, pattern), action in endpoints.items():
+        regex = re.compile(pattern.replace("[^/]+", r"([^/]+)"))
+        by_method.setdefault(method, []).append((regex, action))
+    return by_method
+
+
+# method -> [(compiled pattern, action)]; built once, since every 2xx
+# response goes through the lookup below
+_COMPILED_ENDPOINTS = _compile_endpoints(AUDITABLE_ENDPOINTS)
+
+
+def match_auditable_endpoint(method: str, path: str) -> Optional[Tuple[AuditAction, Optional[str]]]:
+    """
+    Find the audit action for a request, if it is auditable
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        (action, object_id) for auditable requests, None otherwise
+    """
+    # Unlisted methods (e.g. PATCH, OPTIONS) miss the dict and return at once
+    for regex, action in _COMPILED_ENDPOINTS.get(method, ()):
+        match = regex.match(path)
+        if match:
+            return action, (match.group(1) if regex.groups else None)
+    return None
+
+
 class AuditLogMiddleware(BaseHTTPMiddleware):
     """
     Middleware to automatically log sensitive API requests to audit_logs table
@@ -91,22 +133,11 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
             request: FastAPI Request object
             response: Response object
         """
-        method = request.method
-        path = request.url.path
-
-        # Find matching auditable endpoint
-        action = None
-        object_id = None
-
-        for (endpoint_method, pattern), audit_action in AUDITABLE_ENDPOINTS.items():
-            if endpoint_method == method and re.match(pattern, path):
-                action = audit_action
-                object_id = extract_object_id(path, pattern)
-                break
-
-        # If not auditable, skip
-        if not action:
+        # Find matching auditable endpoint; if not auditable, skip
+        matched = match_auditable_endpoint(request.method, request.url.path)
+        if matched is None:
             return
+        action, object_id = matched
 
         # Get user_id from request state (set by JWT dependency)
         user_id = getattr(request.state, "user_id", None)
@@ -116,20 +147,26 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
         if not user_id:
             return
 
-        # Create audit log entry
-        db: Session = SessionLocal()
-        try:
-            audit_repo = AuditLogRepository(db)
-            audit_repo.create(
-                user_id=user_id,
-                action=action.value,
-                object_id=object_id
-            )
-            db.commit()
-        except Exception as e:
-            # Don't fail the request if audit logging fails
-            # Just log the error (in production, use proper logging)
-            print(f"[AuditLogMiddleware] Failed to create audit log: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        # Blocking DB write: run it on the threadpool so the event loop keeps
+        # serving other requests. It is still awaited (not queued) because on
+        # Lambda (Mangum) work left after the response may never run
+        await run_in_threadpool(_write_audit_log, user_id, action.value, object_id)
+
+
+def _write_audit_log(user_id: str, action: str, object_id: Optional[str]) -> None:
+    """Insert one audit log row in its own session; failures are logged, not raised"""
+    db: Session = SessionLocal()
+    try:
+        audit_repo = AuditLogRepository(db)
+        audit_repo.record(
+            user_id=user_id,
+            action=action,
+            object_id=object_id
+        )
+        db.commit()
+    except Exception as e:
+        # Don't fail the request if audit logging fails
+        logger.warning("[AuditLogMiddleware] Failed to create audit log: %s", e)
+        db.rollback()
+    finally:
+        db.close()
@@ -11,6 +11,7 @@ import traceback
 import uuid
 from datetime import datetime, timezone
 import logging
+from app.core import config
 from app.core.logging_filter import SensitiveDataFilter
 
 logger = logging.getLogger(__name__)
@@ -192,9 +193,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
     # In production, hide internal details
-    from app.core.config import settings
-
-    if settings.APP_ENV == "prod":
+    if config.settings.APP_ENV == "prod":
         message = "An internal error occurred. Please contact support."
     else:
         message = f"{type(exc).__name__}: {str(exc)}"
@@ -5,9 +5,13 @@ Security headers and HTTPS enforcement
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import RedirectResponse, Response
 import logging
 
+# Imported as a module (not `from ... import settings`) so the hot path is a
+# single attribute load per request and tests can still swap config.settings
+from app.core import config
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +36,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
         # Strict Transport Security (HSTS)
         # Only add in production with HTTPS enabled
-        from app.core.config import settings
+        settings = config.settings
         if settings.APP_ENV == "prod":
             response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
 
@@ -68,7 +72,7 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next):
-        from app.core.config import settings
+        settings = config.settings
 
         # Only enforce HTTPS in production
         if settings.APP_ENV == "prod":
@@ -81,7 +85,6 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
                     f"Redirecting HTTP to HTTPS: {request.url} -> {https_url}"
                 )
 
-                from starlette.responses import RedirectResponse
                 return RedirectResponse(url=str(https_url), status_code=301)
 
         response = await call_next(request)
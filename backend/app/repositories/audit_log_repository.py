@@ -3,14 +3,32 @@ AuditLog Repository - Data access layer for AuditLog model
 Handles audit log storage and retrieval
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import Optional, List, Tuple
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import and_, func, insert, tuple_
+from sqlalchemy.engine import Row
+from typing import Iterable, Optional, List, Tuple
 from datetime import datetime
 from app.db.models import AuditLog, User
 from app.db.schemas import AuditAction
 
 
+# Columns the audit views render: the log itself plus the actor's email/name.
+# Selecting these (instead of AuditLog + a per-row User lookup) returns narrow
+# tuples from the existing JOIN; no ORM objects or hashed_password are loaded.
+_LOG_VIEW_COLUMNS = (
+    AuditLog.id,
+    AuditLog.user_id,
+    AuditLog.action,
+    AuditLog.object_id,
+    AuditLog.timestamp,
+    User.email.label("user_email"),
+    User.name.label("user_name"),
+)
+
+# Rows fetched per round-trip when streaming the CSV export
+_EXPORT_BATCH_ROWS = 500
+
+
 class AuditLogRepository:
     """
     Repository for AuditLog database operations
@@ -47,32 +65,43 @@ class AuditLogRepository:
 
         return log
 
-    def get_logs_with_pagination(
+    def record(
         self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        user_id: Optional[str] = None,
-        actions: Optional[List[AuditAction]] = None,
-        page: int = 1,
-        page_size: int = 50
-    ) -> Tuple[List[AuditLog], int]:
+        user_id: str,
+        action: str,
+        object_id: Optional[str] = None
+    ) -> None:
         """
-        Get audit logs with filtering and pagination
+        Write an audit log entry without building an ORM instance
+
+        Fire-and-forget variant of create() for the per-request middleware:
+        a Core INSERT (id/timestamp from the column defaults) skips instance
+        construction, identity-map bookkeeping and the unit-of-work flush.
 
         Args:
-            start_date: Filter logs after this date (optional)
-            end_date: Filter logs before this date (optional)
-            user_id: Filter logs by user ID (optional)
-            actions: Filter logs by action types (optional)
-            page: Page number (1-indexed)
-            page_size: Number of items per page
+            user_id: User ID performing the action
+            action: Action type (e.g., "VIEW_EVIDENCE", "CREATE_CASE")
+            object_id: ID of the object being acted upon (optional)
+        """
+        self.session.execute(
+            insert(AuditLog).values(user_id=user_id, action=action, object_id=object_id)
+        )
 
-        Returns:
-            Tuple of (logs list, total count)
+    def _filtered_view_query(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        user_id: Optional[str],
+        actions: Optional[List[AuditAction]]
+    ) -> Query:
+        """
+        Build the log view query (log columns + actor email/name) with filters
+
+        Shared by the paginated view and the CSV export so both always apply
+        identical filters.
         """
-        query = self.session.query(AuditLog).join(User, AuditLog.user_id == User.id)
+        query = self.session.query(*_LOG_VIEW_COLUMNS).join(User, AuditLog.user_id == User.id)
 
-        # Apply filters
         filters = []
 
         if start_date:
@@ -92,17 +121,68 @@ class AuditLogRepository:
         if filters:
             query = query.filter(and_(*filters))
 
-        # Get total count
-        total = query.count()
+        return query
 
-        # Apply pagination and ordering (newest first)
-        logs = (
-            query
-            .order_by(AuditLog.timestamp.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
+    def get_logs_with_pagination(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        actions: Optional[List[AuditAction]] = None,
+        page: int = 1,
+        page_size: int = 50,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> Tuple[List[Row], int]:
+        """
+        Get audit logs with filtering and pagination
+
+        Args:
+            start_date: Filter logs after this date (optional)
+            end_date: Filter logs before this date (optional)
+            user_id: Filter logs by user ID (optional)
+            actions: Filter logs by action types (optional)
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            after: (timestamp, id) of the last row already seen; when given,
+                   seeks past it instead of using OFFSET and page is ignored
+
+        Returns:
+            Tuple of (log rows with user_email/user_name, total count)
+        """
+        query = self._filtered_view_query(start_date, end_date, user_id, actions)
+
+        # Newest first; id breaks timestamp ties so keyset pages never skip
+        # or repeat rows
+        ordered = query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+
+        if after is None:
+            # OFFSET scans and discards every skipped row; fine for shallow pages.
+            # COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so each row
+            # carries the filtered total and page + total take one round-trip
+            logs = (
+                ordered
+                .add_columns(func.count().over().label("total_count"))
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+                .all()
+            )
+            if logs:
+                return logs, logs[0].total_count
+            if page == 1:
+                return logs, 0
+            # Past the last page: no row to read the total from, count below
+        else:
+            # Keyset: index seek to the last seen row, cost independent of depth
+            logs = (
+                ordered
+                .filter(tuple_(AuditLog.timestamp, AuditLog.id) < after)
+                .limit(page_size)
+                .all()
+            )
+
+        # COUNT(*) over the filtered join directly, instead of Query.count()
+        # which wraps the full row select in a subquery
+        total = query.with_entities(func.count(AuditLog.id)).scalar() or 0
 
         return logs, total
 
@@ -112,7 +192,7 @@ class AuditLogRepository:
         end_date: Optional[datetime] = None,
         user_id: Optional[str] = None,
         actions: Optional[List[AuditAction]] = None
-    ) -> List[AuditLog]:
+    ) -> Iterable[Row]:
         """
         Get all audit logs for CSV export (no pagination)
 
@@ -123,28 +203,12 @@ class AuditLogRepository:
             actions: Filter logs by action types (optional)
 
         Returns:
-            List of AuditLog instances
+            Lazily fetched log rows with user_email/user_name; iterate while
+            the session is open
         """
-        query = self.session.query(AuditLog).join(User, AuditLog.user_id == User.id)
-
-        # Apply filters (same as get_logs_with_pagination)
-        filters = []
-
-        if start_date:
-            filters.append(AuditLog.timestamp >= start_date)
-
-        if end_date:
-            filters.append(AuditLog.timestamp <= end_date)
-
-        if user_id:
-            filters.append(AuditLog.user_id == user_id)
-
-        if actions:
-            action_strs = [action.value for action in actions]
-            filters.append(AuditLog.action.in_(action_strs))
-
-        if filters:
-            query = query.filter(and_(*filters))
+        query = self._filtered_view_query(start_date, end_date, user_id, actions)
 
-        # Return all logs (no pagination) ordered by timestamp
-        return query.order_by(AuditLog.timestamp.desc()).all()
+        # All logs (no pagination), newest first, fetched in batches of
+        # _EXPORT_BATCH_ROWS (server-side cursor on PostgreSQL) so a large
+        # export is never held in memory at once
+        return query.order_by(AuditLog.timestamp.desc()).yield_per(_EXPORT_BATCH_ROWS)
@@ -3,9 +3,74 @@ CaseMember Repository - Data access layer for CaseMember model
 Handles case membership and permissions
 """
 
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, contains_eager
+from typing import Dict, Iterable, Optional, List
 from app.db.models import CaseMember, CaseMemberRole, User
+from app.core.config import settings
+from app.db.loading import apply_safe_loading
+from app.utils.ttl_cache import TTLCache
+
+# (case_id, user_id) -> CaseMemberRole, or None for non-members; backs
+# has_access, which runs on every case/evidence/draft request while membership
+# changes rarely. Invalidated on every membership write below, but only in this
+# process: other workers see a change once the (short) TTL expires, so
+# owner-gated writes (is_owner) always read the row instead.
+_role_cache = TTLCache(settings.CASE_ACCESS_CACHE_TTL_SECONDS)
+_NOT_CACHED = object()
+
+# Session.info key holding (case_id, user_id) pairs written in the current
+# transaction
+_PENDING_ROLE_KEYS = "case_member_role_keys"
+
+
+def _invalidate_role(session: Session, key: tuple) -> None:
+    """
+    Drop a cached role now and again when the session's transaction ends
+
+    Until the commit, a concurrent request still reads the old committed row
+    and may re-cache it; the second invalidation (after_commit below) clears
+    that so the new membership is visible without waiting for the TTL.
+    """
+    _role_cache.invalidate(key)
+    session.info.setdefault(_PENDING_ROLE_KEYS, set()).add(key)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending_roles(session: Session) -> None:
+    """Invalidate roles touched by the finished transaction"""
+    for key in session.info.pop(_PENDING_ROLE_KEYS, ()):
+        _role_cache.invalidate(key)
+
+# Hot-path membership lookup, built once at import with bound parameters so
+# each call only binds values; its compiled SQL stays in the engine's
+# query cache instead of a fresh Query being constructed per request.
+# Callers get a bare CaseMember; touching .user/.case raises under STRICT_LOADING
+_GET_MEMBER_STMT = apply_safe_loading(
+    select(CaseMember)
+    .where(CaseMember.case_id == bindparam("case_id"))
+    .where(CaseMember.user_id == bindparam("user_id"))
+    .limit(1)
+)
+
+# Access/ownership probe reads the role column alone instead of hydrating a
+# CaseMember
+_GET_ROLE_STMT = (
+    select(CaseMember.role)
+    .where(CaseMember.case_id == bindparam("case_id"))
+    .where(CaseMember.user_id == bindparam("user_id"))
+    .limit(1)
+)
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT; production runs
+# on PostgreSQL (RDS), tests and local dev on SQLite
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 class CaseMemberRepository:
@@ -20,13 +85,17 @@ class CaseMemberRepository:
         """
         Add a member to a case
 
+        The row is written with the caller's next flush/commit (keys are all
+        caller-supplied, so nothing needs to be read back); flush first if
+        membership is queried again in the same transaction.
+
         Args:
             case_id: Case ID
             user_id: User ID
             role: Member role (owner, member, viewer)
 
         Returns:
-            Created CaseMember instance
+            Created (pending) CaseMember instance
         """
         member = CaseMember(
             case_id=case_id,
@@ -35,7 +104,7 @@ class CaseMemberRepository:
         )
 
         self.session.add(member)
-        self.session.flush()
+        _invalidate_role(self.session, (case_id, user_id))
 
         return member
 
@@ -50,12 +119,56 @@ class CaseMemberRepository:
         Returns:
             CaseMember instance if found, None otherwise
         """
-        return (
-            self.session.query(CaseMember)
-            .filter(CaseMember.case_id == case_id)
-            .filter(CaseMember.user_id == user_id)
-            .first()
+        return self.session.execute(
+            _GET_MEMBER_STMT, {"case_id": case_id, "user_id": user_id}
+        ).scalars().first()
+
+    def get_members_for_users(self, case_id: str, user_ids: Iterable[str]) -> Dict[str, CaseMember]:
+        """
+        Get memberships of several users in one query
+
+        Args:
+            case_id: Case ID
+            user_ids: User IDs to look up
+
+        Returns:
+            Dict of user_id -> CaseMember for users who are members
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+
+        stmt = apply_safe_loading(
+            select(CaseMember)
+            .where(CaseMember.case_id == case_id)
+            .where(CaseMember.user_id.in_(user_ids))
         )
+        members = self.session.execute(stmt).scalars()
+        return {member.user_id: member for member in members}
+
+    def get_role(self, case_id: str, user_id: str) -> Optional[CaseMemberRole]:
+        """
+        Get a user's role in a case (cached)
+
+        Args:
+            case_id: Case ID
+            user_id: User ID
+
+        Returns:
+            CaseMemberRole if user is a member, None otherwise
+        """
+        role = _role_cache.get((case_id, user_id), _NOT_CACHED)
+        if role is not _NOT_CACHED:
+            return role
+        return self._read_role(case_id, user_id)
+
+    def _read_role(self, case_id: str, user_id: str) -> Optional[CaseMemberRole]:
+        """Read a user's role from the database and refresh the cache"""
+        role = self.session.execute(
+            _GET_ROLE_STMT, {"case_id": case_id, "user_id": user_id}
+        ).scalar()
+        _role_cache.set((case_id, user_id), role)
+        return role
 
     def has_access(self, case_id: str, user_id: str) -> bool:
         """
@@ -68,12 +181,14 @@ class CaseMemberRepository:
         Returns:
             True if user has access, False otherwise
         """
-        return self.get_member(case_id, user_id) is not None
+        return self.get_role(case_id, user_id) is not None
 
     def remove_member(self, case_id: str, user_id: str) -> bool:
         """
         Remove a member from a case
 
+        The DELETE is issued with the caller's next flush/commit.
+
         Args:
             case_id: Case ID
             user_id: User ID
@@ -86,7 +201,7 @@ class CaseMemberRepository:
             return False
 
         self.session.delete(member)
-        self.session.flush()
+        _invalidate_role(self.session, (case_id, user_id))
         return True
 
     def get_all_members(self, case_id: str) -> List[CaseMember]:
@@ -99,12 +214,17 @@ class CaseMemberRepository:
         Returns:
             List of CaseMember instances with joined User data
         """
-        return (
+        # Populate CaseMember.user from the same JOIN so callers can read
+        # member.user without one lazy SELECT per member. The member list
+        # only renders id/name/email, so the password hash, role, status and
+        # timestamps are left out of the SELECT
+        query = (
             self.session.query(CaseMember)
             .join(User, CaseMember.user_id == User.id)
             .filter(CaseMember.case_id == case_id)
-            .all()
         )
+        user_loader = contains_eager(CaseMember.user).load_only(User.id, User.name, User.email)
+        return apply_safe_loading(query, user_loader).all()
 
     def is_owner(self, case_id: str, user_id: str) -> bool:
         """
@@ -117,8 +237,10 @@ class CaseMemberRepository:
         Returns:
             True if user is owner, False otherwise
         """
-        member = self.get_member(case_id, user_id)
-        return member is not None and member.role == CaseMemberRole.OWNER
+        # Gates membership writes, so never trust a role cached before another
+        # process demoted or removed the user. SQLEnum hands back
+        # CaseMemberRole members (or None), so an identity check suffices
+        return self._read_role(case_id, user_id) is CaseMemberRole.OWNER
 
     def add_members_batch(
         self,
@@ -133,27 +255,33 @@ class CaseMemberRepository:
             members: List of (user_id, role) tuples
 
         Returns:
-            List of created CaseMember instances
-        """
-        created_members = []
-
-        for user_id, role in members:
-            # Check if member already exists
-            existing = self.get_member(case_id, user_id)
-            if existing:
-                # Update role if different
-                if existing.role != role:
-                    existing.role = role
-                created_members.append(existing)
-            else:
-                # Create new member
-                member = CaseMember(
-                    case_id=case_id,
-                    user_id=user_id,
-                    role=role
-                )
-                self.session.add(member)
-                created_members.append(member)
-
-        self.session.flush()
-        return created_members
+            List of created or updated CaseMember instances, one per user
+        """
+        # Last role wins when a user_id repeats within the batch; ON CONFLICT
+        # cannot touch the same row twice in one statement
+        requested = dict(members)
+        if not requested:
+            return []
+
+        # Add-or-update in a single atomic statement against the
+        # (case_id, user_id) primary key: no pre-SELECT, no check/insert race
+        dialect = self.session.get_bind().dialect.name
+        stmt = _UPSERT_INSERTS[dialect](CaseMember).values([
+            {"case_id": case_id, "user_id": user_id, "role": role}
+            for user_id, role in requested.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CaseMember.case_id, CaseMember.user_id],
+            set_={"role": stmt.excluded.role},
+        )
+        # populate_existing refreshes members already in the identity map
+        upserted = self.session.scalars(
+            stmt.returning(CaseMember),
+            execution_options={"populate_existing": True},
+        )
+        by_user = {member.user_id: member for member in upserted}
+
+        for user_id in requested:
+            _invalidate_role(self.session, (case_id, user_id))
+
+        return [by_user[user_id] for user_id in requested]
@@ -3,11 +3,24 @@ Case Repository - Data access layer for Case model
 Implements Repository pattern per BACKEND_SERVICE_REPOSITORY_GUIDE.md
 """
 
+from sqlalchemy import and_, bindparam, select
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.db.models import Case, CaseMember
+from typing import List, Optional, Tuple
+from app.db.models import Case, CaseMember, generate_id
 from datetime import datetime, timezone
-import uuid
+
+# Case + caller's membership, run on every case/evidence/draft request.
+# Built once with bound parameters (like CaseMemberRepository's hot-path
+# statements) so each call only binds values and reuses the cached SQL
+_GET_WITH_MEMBER_STMT = (
+    select(Case, CaseMember)
+    .outerjoin(
+        CaseMember,
+        and_(CaseMember.case_id == Case.id, CaseMember.user_id == bindparam("user_id"))
+    )
+    .where(Case.id == bindparam("case_id"))
+    .limit(1)
+)
 
 
 class CaseRepository:
@@ -31,7 +44,7 @@ class CaseRepository:
             Created Case instance
         """
         case = Case(
-            id=f"case_{uuid.uuid4().hex[:12]}",
+            id=generate_id("case"),
             title=title,
             description=description,
             status="active",
@@ -56,6 +69,30 @@ class CaseRepository:
         """
         return self.session.query(Case).filter(Case.id == case_id).first()
 
+    def get_with_member(
+        self, case_id: str, user_id: str
+    ) -> Tuple[Optional[Case], Optional[CaseMember]]:
+        """
+        Get case and the user's membership in a single query
+
+        LEFT JOIN on case_members so one round-trip tells "case missing"
+        (404) apart from "not a member" (403).
+
+        Args:
+            case_id: Case ID
+            user_id: User ID
+
+        Returns:
+            (case, member) tuple; case is None if not found,
+            member is None if user is not a member of the case
+        """
+        row = self.session.execute(
+            _GET_WITH_MEMBER_STMT, {"case_id": case_id, "user_id": user_id}
+        ).first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     def get_all_for_user(self, user_id: str) -> List[Case]:
         """
         Get all cases accessible by user (via case_members)
@@ -3,7 +3,7 @@ User Repository - Data access layer for User model
 Per BACKEND_SERVICE_REPOSITORY_GUIDE.md pattern
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set
 from sqlalchemy.orm import Session
 from app.db.models import User, UserRole, UserStatus
 from app.core.security import hash_password
@@ -41,6 +41,23 @@ class UserRepository:
         """
         return self.session.query(User).filter(User.id == user_id).first()
 
+    def get_existing_ids(self, user_ids: Iterable[str]) -> Set[str]:
+        """
+        Get which of the given user IDs exist, in one query
+
+        Args:
+            user_ids: User IDs to check
+
+        Returns:
+            Set of IDs that belong to existing users
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return set()
+
+        rows = self.session.query(User.id).filter(User.id.in_(user_ids)).all()
+        return {row.id for row in rows}
+
     def create(self, email: str, password: str, name: str, role: UserRole = UserRole.LAWYER) -> User:
         """
         Create a new user
@@ -4,7 +4,7 @@ Handles audit log retrieval and CSV export
 """
 
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from datetime import datetime
 from app.db.schemas import (
     AuditAction,
@@ -13,9 +13,12 @@ from app.db.schemas import (
     AuditLogListResponse
 )
 from app.repositories.audit_log_repository import AuditLogRepository
-from app.repositories.user_repository import UserRepository
+from app.utils.cursor import decode_cursor, encode_cursor
 import math
 
+# Rows per chunk handed to the streaming response
+_CSV_CHUNK_ROWS = 500
+
 
 class AuditLogService:
     """
@@ -25,7 +28,6 @@ class AuditLogService:
     def __init__(self, db: Session):
         self.db = db
         self.audit_repo = AuditLogRepository(db)
-        self.user_repo = UserRepository(db)
 
     def get_audit_logs(
         self,
@@ -39,7 +41,12 @@ class AuditLogService:
 
         Returns:
             Paginated audit log response
+
+        Raises:
+            ValidationError: Malformed cursor
         """
+        after = decode_cursor(request.cursor) if request.cursor else None
+
         # Get logs from repository
         logs, total = self.audit_repo.get_logs_with_pagination(
             start_date=request.start_date,
@@ -47,33 +54,29 @@ class AuditLogService:
             user_id=request.user_id,
             actions=request.actions,
             page=request.page,
-            page_size=request.page_size
+            page_size=request.page_size,
+            after=after
         )
 
-        # Convert to output schema with user info
-        log_outs = []
-        for log in logs:
-            user = self.user_repo.get_by_id(log.user_id)
-
-            log_outs.append(AuditLogOut(
-                id=log.id,
-                user_id=log.user_id,
-                user_email=user.email if user else None,
-                user_name=user.name if user else None,
-                action=log.action,
-                object_id=log.object_id,
-                timestamp=log.timestamp
-            ))
+        # Convert to output schema (user info comes from the repository JOIN)
+        log_outs = [AuditLogOut.model_validate(log) for log in logs]
 
         # Calculate total pages
         total_pages = math.ceil(total / request.page_size) if total > 0 else 0
 
+        # A full page may have more after it; hand back its last sort key
+        next_cursor = None
+        if log_outs and len(log_outs) == request.page_size:
+            last = log_outs[-1]
+            next_cursor = encode_cursor(last.timestamp, last.id)
+
         return AuditLogListResponse(
             logs=log_outs,
             total=total,
             page=request.page,
             page_size=request.page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
 
     def export_audit_logs_csv(
@@ -82,9 +85,12 @@ class AuditLogService:
         end_date: Optional[datetime] = None,
         user_id: Optional[str] = None,
         actions: Optional[List[AuditAction]] = None
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Export audit logs to CSV format
+        Export audit logs to CSV format as a stream of text chunks
+
+        Rows are formatted as they are fetched, so the full export is never
+        built as one string; concatenating the chunks gives the CSV file.
 
         Args:
             start_date: Filter logs after this date (optional)
@@ -93,7 +99,7 @@ class AuditLogService:
             actions: Filter logs by action types (optional)
 
         Returns:
-            CSV string content
+            Iterator of CSV text chunks (header first)
         """
         # Get all logs for export (no pagination)
         logs = self.audit_repo.get_logs_for_export(
@@ -103,24 +109,31 @@ class AuditLogService:
             actions=actions
         )
 
-        # Build CSV content
-        csv_lines = []
+        return self._iter_csv(logs)
 
+    @staticmethod
+    def _iter_csv(logs: Iterable) -> Iterator[str]:
+        """Yield the CSV header, then data rows in chunks of _CSV_CHUNK_ROWS"""
         # Header
-        csv_lines.append("ID,User ID,User Email,User Name,Action,Object ID,Timestamp")
+        yield "ID,User ID,User Email,User Name,Action,Object ID,Timestamp"
 
         # Data rows
+        batch = []
         for log in logs:
-            user = self.user_repo.get_by_id(log.user_id)
-
-            csv_lines.append(",".join([
+            batch.append(",".join([
                 log.id,
                 log.user_id,
-                user.email if user else "",
-                f'"{user.name}"' if user else "",  # Quote name for CSV safety
+                log.user_email or "",
+                f'"{log.user_name}"' if log.user_name is not None else "",  # Quote name for CSV safety
                 log.action,
                 log.object_id or "",
-                log.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+                # Same text as strftime("%Y-%m-%d %H:%M:%S") without parsing
+                # a format string per row
+                log.timestamp.isoformat(" ", "seconds")[:19]
             ]))
+            if len(batch) >= _CSV_CHUNK_ROWS:
+                yield "\n" + "\n".join(batch)
+                batch = []
 
-        return "\n".join(csv_lines)
+        if batch:
+            yield "\n" + "\n".join(batch)
@@ -78,11 +78,14 @@ class CaseService:
             role="owner"
         )
 
+        # Serialize before commit: flush already populated every column, and
+        # commit expires the instance (refresh would be an extra SELECT)
+        case_out = CaseOut.model_validate(case)
+
         # Commit transaction
         self.db.commit()
-        self.db.refresh(case)
 
-        return CaseOut.model_validate(case)
+        return case_out
 
     def get_cases_for_user(self, user_id: str) -> List[CaseOut]:
         """
@@ -112,12 +115,12 @@ class CaseService:
             NotFoundError: Case not found
             PermissionError: User does not have access
         """
-        case = self.case_repo.get_by_id(case_id)
+        case, member = self.case_repo.get_with_member(case_id, user_id)
         if not case:
             raise NotFoundError("Case")
 
         # Check if user has access
-        if not self.member_repo.has_access(case_id, user_id):
+        if not member:
             raise PermissionError("You do not have access to this case")
 
         return CaseOut.model_validate(case)
@@ -138,12 +141,11 @@ class CaseService:
             NotFoundError: Case not found
             PermissionError: User does not have write access
         """
-        case = self.case_repo.get_by_id(case_id)
+        case, member = self.case_repo.get_with_member(case_id, user_id)
         if not case:
             raise NotFoundError("Case")
 
         # Check if user has write access (owner or member with read_write)
-        member = self.member_repo.get_member(case_id, user_id)
         if not member:
             raise PermissionError("You do not have access to this case")
 
@@ -157,10 +159,13 @@ class CaseService:
         if update_data.description is not None:
             case.description = update_data.description
 
+        # Flush applies updated_at (onupdate); serialize before commit expires it
+        self.case_repo.update(case)
+        case_out = CaseOut.model_validate(case)
+
         self.db.commit()
-        self.db.refresh(case)
 
-        return CaseOut.model_validate(case)
+        return case_out
 
     def delete_case(self, case_id: str, user_id: str):
         """
@@ -174,12 +179,11 @@ class CaseService:
             NotFoundError: Case not found
             PermissionError: User does not have owner access
         """
-        case = self.case_repo.get_by_id(case_id)
+        case, member = self.case_repo.get_with_member(case_id, user_id)
         if not case:
             raise NotFoundError("Case")
 
         # Check if user is owner
-        member = self.member_repo.get_member(case_id, user_id)
         if not member or member.role != CaseMemberRole.OWNER:
             raise PermissionError("Only case owner can delete the case")
 
@@ -234,17 +238,17 @@ class CaseService:
         if not case:
             raise NotFoundError("Case")
 
-        # Check if requester is owner or admin
-        is_owner = self.member_repo.is_owner(case_id, user_id)
-        requester = self.user_repo.get_by_id(user_id)
-
-        if not is_owner and (not requester or requester.role.value != "admin"):
-            raise PermissionError("Only case owner or admin can add members")
+        # Check if requester is owner or admin; the (cached) ownership check
+        # settles the common case, the requester row is only read otherwise
+        if not self.member_repo.is_owner(case_id, user_id):
+            requester = self.user_repo.get_by_id(user_id)
+            if not requester or requester.role.value != "admin":
+                raise PermissionError("Only case owner or admin can add members")
 
-        # Validate all users exist
+        # Validate all users exist (one IN query instead of one lookup per member)
+        existing_ids = self.user_repo.get_existing_ids(member.user_id for member in members)
         for member in members:
-            user = self.user_repo.get_by_id(member.user_id)
-            if not user:
+            if member.user_id not in existing_ids:
                 raise NotFoundError(f"User {member.user_id}")
 
         # Convert permissions to roles and add members
@@ -287,13 +291,13 @@ class CaseService:
         if not self.member_repo.has_access(case_id, user_id):
             raise PermissionError("You do not have access to this case")
 
-        # Get all members
+        # Get all members (User is loaded in the same query)
         members = self.member_repo.get_all_members(case_id)
 
         # Convert to response schema
         member_outs = []
         for member in members:
-            user = self.user_repo.get_by_id(member.user_id)
+            user = member.user
             if user:
                 member_outs.append(CaseMemberOut(
                     user_id=user.id,
@@ -3,10 +3,13 @@ Draft Service - Business logic for draft generation with RAG
 Orchestrates Qdrant RAG + OpenAI GPT-4o for draft preview
 """
 
+import json
+import logging
 from sqlalchemy.orm import Session
-from typing import List, Tuple
+from typing import Any, Hashable, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
 from io import BytesIO
+from xml.sax.saxutils import escape
 
 from app.db.schemas import (
     DraftPreviewRequest,
@@ -16,9 +19,11 @@ from app.db.schemas import (
 )
 from app.repositories.case_repository import CaseRepository
 from app.repositories.case_member_repository import CaseMemberRepository
+from app.core.config import settings
 from app.utils.dynamo import get_evidence_by_case
-from app.utils.qdrant import search_evidence_by_semantic
-from app.utils.openai_client import generate_chat_completion
+from app.utils.qdrant import make_snippet, search_evidence_by_semantic
+from app.utils.openai_client import generate_chat_completion, stream_chat_completion, truncate_tokens
+from app.utils.ttl_cache import TTLCache
 from app.middleware import NotFoundError, PermissionError, ValidationError
 
 # Optional: python-docx for DOCX generation
@@ -30,6 +35,106 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+# Optional: reportlab for PDF generation. The sample stylesheet is built once
+# here; it is only read during rendering
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.units import inch
+    _PDF_STYLES = getSampleStyleSheet()
+    PDF_AVAILABLE = True
+except ImportError:
+    PDF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Sent byte-identical on every draft request (no interpolation) so OpenAI
+# prompt caching can serve this prefix instead of re-reading it each time
+_SYSTEM_PROMPT = """당신은 대한민국의 전문 법률가입니다.
+이혼 소송 준비서면 초안을 작성하는 AI 어시스턴트입니다.
+
+**중요 원칙:**
+1. 제공된 증거만을 기반으로 작성하세요
+2. 추측이나 가정을 하지 마세요
+3. 법률 용어를 정확하게 사용하세요
+4. 민법 제840조 이혼 사유를 정확히 인용하세요
+5. 존중하고 전문적인 어조를 유지하세요
+
+**작성 형식:**
+- 법원 제출용 표준 형식
+- 명확한 섹션 구분
+- 증거 기반 서술
+- 법률 근거 명시
+
+**주의사항:**
+본 문서는 초안이며, 변호사의 검토가 필수입니다.
+"""
+
+# Low temperature for consistent legal writing
+_COMPLETION_PARAMS = {"temperature": 0.3, "max_tokens": 4000}
+
+
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+# Returned instead of a GPT-4o draft when RAG has no evidence to cite
+_TEMPLATE_DRAFT = """[템플릿 전용 초안]
+증거 분석 결과가 아직 준비되지 않아 AI 작성 없이 기본 서식만 제공합니다.
+증거 처리가 완료된 후 다시 생성해 주세요.
+
+사건명: {title}
+사건 설명: {description}
+
+{sections}
+
+※ 본 문서는 초안이며, 변호사의 검토가 필수입니다."""
+
+# Section -> (RAG query, top_k) for sections that need targeted evidence
+_RAG_SECTION_QUERIES = {
+    # Search for fault evidence (guilt factors)
+    "청구원인": ("이혼 사유 귀책사유 폭언 불화 부정행위", 10),
+}
+_RAG_DEFAULT_TOP_K = 5
+
+# One evidence block of the prompt's RAG section
+_RAG_CONTEXT_ENTRY = """
+[증거 {index}] (ID: {evidence_id})
+- 분류: {labels}
+- 화자: {speaker}
+- 시점: {timestamp}
+- 내용: {content}
+"""
+# Evidence content is cut on token boundaries: at most _RAG_CONTENT_TOKENS
+# per document (~500 Korean chars) and _RAG_CONTEXT_TOKENS across all of them
+_RAG_CONTENT_TOKENS = 350
+_RAG_CONTEXT_TOKENS = 3000
+
+
+def _display_timestamp(draft_response: DraftPreviewResponse) -> str:
+    """Generation time as printed in exported documents"""
+    return draft_response.generated_at.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _export_filename(case: Any, draft_response: DraftPreviewResponse, extension: str) -> str:
+    """Download filename shared by the DOCX and PDF exports"""
+    safe_title = case.title.replace(" ", "_")[:30]
+    return f"draft_{safe_title}_{draft_response.generated_at:%Y%m%d}.{extension}"
+
+
+def _truncate_content(text: str, max_tokens: int) -> str:
+    """Cut text to max_tokens tokens, marking the cut with '...'"""
+    truncated = truncate_tokens(text, max_tokens)
+    return truncated + "..." if len(truncated) < len(text) else truncated
+
+
+# Generated previews keyed by everything that feeds the prompt (see
+# _preview_cache_key); preview -> DOCX export -> PDF export reuses one GPT-4o
+# call. New or re-processed evidence changes the key, so no invalidation needed
+_preview_cache = TTLCache(settings.DRAFT_PREVIEW_CACHE_TTL_SECONDS)
+
 
 class DraftService:
     """
@@ -72,6 +177,20 @@ class DraftService:
             ValidationError: No evidence in case
         """
         # 1. Validate case access
+        case = self._get_accessible_case(case_id, user_id)
+
+        # 2. Retrieve evidence metadata from DynamoDB (only for an accessible
+        # case; the RAG search depends on it, so there is nothing to overlap)
+        return self._build_preview(case, request, get_evidence_by_case(case_id))
+
+    def _get_accessible_case(self, case_id: str, user_id: str):
+        """
+        Load a case the user may draft for
+
+        Raises:
+            NotFoundError: Case not found
+            PermissionError: User does not have access to case
+        """
         case = self.case_repo.get_by_id(case_id)
         if not case:
             raise NotFoundError("Case")
@@ -79,22 +198,173 @@ class DraftService:
         if not self.member_repo.has_access(case_id, user_id):
             raise PermissionError("You do not have access to this case")
 
-        # 2. Retrieve evidence metadata from DynamoDB
+        return case
+
+    def _build_preview(
+        self,
+        case: any,
+        request: DraftPreviewRequest,
+        evidence_list: List[dict]
+    ) -> DraftPreviewResponse:
+        """
+        Generate (or reuse) the draft for an already-authorized case
+
+        Args:
+            case: Case object
+            request: Draft generation request
+            evidence_list: Evidence metadata from DynamoDB
+
+        Returns:
+            Draft preview with citations
+
+        Raises:
+            ValidationError: No evidence in case
+        """
+        cache_key, cached = self._check_preview_cache(case, request, evidence_list)
+        if cached is not None:
+            return cached
+
+        # 3. Perform semantic RAG search in Qdrant
+        rag_results = self._perform_rag_search(
+            case.id, request.sections, self._evidence_fingerprint(evidence_list)
+        )
+        if not rag_results:
+            return self._template_preview(case, request)
+
+        # 4. Build GPT-4o prompt with RAG context
+        prompt_messages = self._build_draft_prompt_for(case, request, rag_results)
+
+        # 5. Generate draft text using GPT-4o
+        draft_text = generate_chat_completion(
+            messages=prompt_messages,
+            prompt_cache_key=case.id,
+            **_COMPLETION_PARAMS
+        )
+
+        # 6. Extract citations from RAG results
+        return self._store_preview(
+            cache_key, case.id, draft_text, self._extract_citations(rag_results)
+        )
+
+    def generate_draft_preview_stream(
+        self,
+        case_id: str,
+        request: DraftPreviewRequest,
+        user_id: str
+    ) -> Iterator[str]:
+        """
+        Generate draft preview as Server-Sent Events
+
+        Access, evidence and RAG run before this returns, so their errors
+        surface as regular HTTP errors; only GPT-4o output is streamed.
+
+        Events:
+            citations: JSON list of DraftCitation (sent first)
+            delta: {"text": "..."} draft text fragments, in order
+            done: {"generated_at": "..."} after the last fragment
+            error: {"message": "..."} instead of done if generation fails
+
+        Args:
+            case_id: Case ID
+            request: Draft generation request (sections, language, style)
+            user_id: User ID requesting draft
+
+        Returns:
+            Iterator of SSE-formatted event strings
+
+        Raises:
+            NotFoundError: Case not found
+            PermissionError: User does not have access to case
+            ValidationError: No evidence in case
+        """
+        case = self._get_accessible_case(case_id, user_id)
         evidence_list = get_evidence_by_case(case_id)
 
+        cache_key, cached = self._check_preview_cache(case, request, evidence_list)
+        if cached is not None:
+            return self._draft_events(cache_key, case_id, cached.citations, iter((cached.draft_text,)), cached)
+
+        rag_results = self._perform_rag_search(
+            case_id, request.sections, self._evidence_fingerprint(evidence_list)
+        )
+        if not rag_results:
+            template = self._template_preview(case, request)
+            return self._draft_events(cache_key, case_id, [], iter((template.draft_text,)), template)
+
+        prompt_messages = self._build_draft_prompt_for(case, request, rag_results)
+        deltas = stream_chat_completion(
+            messages=prompt_messages,
+            prompt_cache_key=case_id,
+            **_COMPLETION_PARAMS
+        )
+        return self._draft_events(cache_key, case_id, self._extract_citations(rag_results), deltas)
+
+    def _draft_events(
+        self,
+        cache_key: Hashable,
+        case_id: str,
+        citations: List[DraftCitation],
+        deltas: Iterator[str],
+        response: Optional[DraftPreviewResponse] = None
+    ) -> Iterator[str]:
+        """
+        Yield SSE events for a draft
+
+        Streamed text is cached once complete; pass ``response`` when the
+        draft already exists (cache hit, template) to skip storing it
+        """
+        yield _sse("citations", [citation.model_dump() for citation in citations])
+
+        # The OpenAI request runs lazily inside this loop, after the 200 is
+        # sent; report failures as a terminal event instead of a dropped
+        # connection, and don't cache the partial text
+        parts = []
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                yield _sse("delta", {"text": delta})
+        except Exception as e:
+            logger.error(f"Draft stream failed for case {case_id}: {e}")
+            yield _sse("error", {"message": "초안 생성 중 오류가 발생했습니다. 다시 시도해 주세요."})
+            return
+
+        response = response or self._store_preview(cache_key, case_id, "".join(parts), citations)
+        yield _sse("done", {"generated_at": response.generated_at.isoformat()})
+
+    def _check_preview_cache(
+        self,
+        case: any,
+        request: DraftPreviewRequest,
+        evidence_list: List[dict]
+    ) -> Tuple[Hashable, Optional[DraftPreviewResponse]]:
+        """
+        Validate evidence and look up a previously generated draft
+
+        Returns:
+            (cache_key, cached preview or None)
+
+        Raises:
+            ValidationError: No evidence in case
+        """
         # Check if there's any evidence
         if not evidence_list:
             raise ValidationError("사건에 증거가 하나도 없습니다. 증거를 업로드한 후 초안을 생성해 주세요.")
 
-        # Filter for completed evidence only (status="done")
-        # Note: Currently filtering for reference, may be used for future enhancements
-        _ = [ev for ev in evidence_list if ev.get("status") == "done"]
+        # No status filter: the RAG index only ever holds chunks the AI worker
+        # has finished processing, so in-progress evidence cannot be retrieved
 
-        # 3. Perform semantic RAG search in Qdrant
-        rag_results = self._perform_rag_search(case_id, request.sections)
+        # Same case, settings and evidence -> same draft; skip RAG + GPT-4o
+        cache_key = self._preview_cache_key(case, request, evidence_list)
+        return cache_key, _preview_cache.get(cache_key)
 
-        # 4. Build GPT-4o prompt with RAG context
-        prompt_messages = self._build_draft_prompt(
+    def _build_draft_prompt_for(
+        self,
+        case: any,
+        request: DraftPreviewRequest,
+        rag_results: List[dict]
+    ) -> List[dict]:
+        """Build the GPT-4o prompt for a preview request"""
+        return self._build_draft_prompt(
             case=case,
             sections=request.sections,
             rag_context=rag_results,
@@ -102,53 +372,111 @@ class DraftService:
             style=request.style
         )
 
-        # 5. Generate draft text using GPT-4o
-        draft_text = generate_chat_completion(
-            messages=prompt_messages,
-            temperature=0.3,  # Low temperature for consistent legal writing
-            max_tokens=4000
-        )
-
-        # 6. Extract citations from RAG results
-        citations = self._extract_citations(rag_results)
+    @staticmethod
+    def _template_preview(case: any, request: DraftPreviewRequest) -> DraftPreviewResponse:
+        """
+        Build a template-only draft without calling GPT-4o
 
+        Used when RAG finds nothing (evidence not indexed yet): a completion
+        would have no facts to work from. Not cached, so the next request
+        after indexing gets a real draft.
+        """
+        draft_text = _TEMPLATE_DRAFT.format(
+            title=case.title,
+            description=case.description or "N/A",
+            sections="\n\n".join(f"## {section}\n(증거 분석 후 작성)" for section in request.sections)
+        )
         return DraftPreviewResponse(
+            case_id=case.id,
+            draft_text=draft_text,
+            citations=[],
+            generated_at=datetime.now(timezone.utc)
+        )
+
+    @staticmethod
+    def _store_preview(
+        cache_key: Hashable,
+        case_id: str,
+        draft_text: str,
+        citations: List[DraftCitation]
+    ) -> DraftPreviewResponse:
+        """Build the preview response and cache it"""
+        response = DraftPreviewResponse(
             case_id=case_id,
             draft_text=draft_text,
             citations=citations,
             generated_at=datetime.now(timezone.utc)
         )
+        _preview_cache.set(cache_key, response)
+        return response
+
+    @staticmethod
+    def _preview_cache_key(
+        case: any,
+        request: DraftPreviewRequest,
+        evidence_list: List[dict]
+    ) -> Hashable:
+        """
+        Build the draft preview cache key
+
+        Args:
+            case: Case object (title/description are part of the prompt)
+            request: Draft generation request
+            evidence_list: Evidence metadata already fetched from DynamoDB
+
+        Returns:
+            Hashable key; changes whenever evidence is added, removed or
+            (re-)processed (the AI worker stamps processed_at on every run)
+        """
+        return (
+            case.id,
+            case.title,
+            case.description,
+            tuple(request.sections),
+            request.language,
+            request.style,
+            DraftService._evidence_fingerprint(evidence_list),
+        )
+
+    @staticmethod
+    def _evidence_fingerprint(evidence_list: List[dict]) -> Hashable:
+        """Evidence set identity, shared by the preview and RAG search cache keys"""
+        return frozenset(
+            (ev.get("id"), ev.get("status"), ev.get("created_at"), ev.get("processed_at"))
+            for ev in evidence_list
+        )
 
-    def _perform_rag_search(self, case_id: str, sections: List[str]) -> List[dict]:
+    def _perform_rag_search(
+        self,
+        case_id: str,
+        sections: List[str],
+        evidence_fingerprint: Hashable = None
+    ) -> List[dict]:
         """
         Perform semantic search in Qdrant for RAG context
 
         Args:
             case_id: Case ID
             sections: Sections being generated
+            evidence_fingerprint: Current evidence set (_evidence_fingerprint);
+                keys the search cache so chunks the AI worker indexed since the
+                last search are not served from a stale cached result
 
         Returns:
             List of relevant evidence documents
         """
-        # Build search query based on sections
-        if "청구원인" in sections:
-            # Search for fault evidence (guilt factors)
-            query = "이혼 사유 귀책사유 폭언 불화 부정행위"
-            results = search_evidence_by_semantic(
-                case_id=case_id,
-                query=query,
-                top_k=10
-            )
-        else:
-            # General search for all sections
-            query = " ".join(sections)
-            results = search_evidence_by_semantic(
-                case_id=case_id,
-                query=query,
-                top_k=5
-            )
-
-        return results
+        # First section with a dedicated query wins; otherwise search on the
+        # section names themselves
+        query, top_k = next(
+            (_RAG_SECTION_QUERIES[section] for section in sections if section in _RAG_SECTION_QUERIES),
+            (" ".join(sections), _RAG_DEFAULT_TOP_K)
+        )
+        return search_evidence_by_semantic(
+            case_id=case_id,
+            query=query,
+            top_k=top_k,
+            cache_token=evidence_fingerprint
+        )
 
     def _build_draft_prompt(
         self,
@@ -171,60 +499,47 @@ class DraftService:
         Returns:
             List of messages for GPT-4o
         """
-        # System message - define role and constraints
-        system_message = {
-            "role": "system",
-            "content": """당신은 대한민국의 전문 법률가입니다.
-이혼 소송 준비서면 초안을 작성하는 AI 어시스턴트입니다.
-
-**중요 원칙:**
-1. 제공된 증거만을 기반으로 작성하세요
-2. 추측이나 가정을 하지 마세요
-3. 법률 용어를 정확하게 사용하세요
-4. 민법 제840조 이혼 사유를 정확히 인용하세요
-5. 존중하고 전문적인 어조를 유지하세요
-
-**작성 형식:**
-- 법원 제출용 표준 형식
-- 명확한 섹션 구분
-- 증거 기반 서술
-- 법률 근거 명시
+        # Ordered from most to least stable so OpenAI prompt caching reuses
+        # the longest prefix: static system prompt, per-case info, request
+        # settings, and the evidence (changes whenever evidence is added) last
+        system_message = {"role": "system", "content": _SYSTEM_PROMPT}
 
-**주의사항:**
-본 문서는 초안이며, 변호사의 검토가 필수입니다.
-"""
-        }
-
-        # Build RAG context string
-        rag_context_str = self._format_rag_context(rag_context)
-
-        # User message - include case info and RAG context
-        user_message = {
+        case_message = {
             "role": "user",
-            "content": f"""
-다음 정보를 바탕으로 이혼 소송 준비서면 초안을 작성해 주세요.
+            "content": f"""다음 정보를 바탕으로 이혼 소송 준비서면 초안을 작성해 주세요.
 
 **사건 정보:**
 - 사건명: {case.title}
 - 사건 설명: {case.description or "N/A"}
+"""
+        }
 
-**생성할 섹션:**
+        settings_message = {
+            "role": "user",
+            "content": f"""**생성할 섹션:**
 {", ".join(sections)}
 
-**증거 자료 (RAG 검색 결과):**
-{rag_context_str}
-
 **요청사항:**
 - 언어: {language}
 - 스타일: {style}
-- 위 증거를 기반으로 법률적 논리를 구성해 주세요
+- 아래 증거를 기반으로 법률적 논리를 구성해 주세요
 - 각 주장에 대해 증거 번호를 명시해 주세요 (예: [증거 1], [증거 2])
+"""
+        }
+
+        # Build RAG context string
+        rag_context_str = self._format_rag_context(rag_context)
+
+        evidence_message = {
+            "role": "user",
+            "content": f"""**증거 자료 (RAG 검색 결과):**
+{rag_context_str}
 
 준비서면 초안을 작성해 주세요.
 """
         }
 
-        return [system_message, user_message]
+        return [system_message, case_message, settings_message, evidence_message]
 
     def _format_rag_context(self, rag_results: List[dict]) -> str:
         """
@@ -239,27 +554,19 @@ class DraftService:
         if not rag_results:
             return "(증거 자료 없음 - 기본 템플릿으로 작성)"
 
-        context_parts = []
-        for i, doc in enumerate(rag_results, start=1):
-            evidence_id = doc.get("id", f"evidence_{i}")
-            content = doc.get("content", "")
-            labels = doc.get("labels", [])
-            speaker = doc.get("speaker", "")
-            timestamp = doc.get("timestamp", "")
-
-            # Truncate content if too long
-            if len(content) > 500:
-                content = content[:500] + "..."
-
-            context_parts.append(f"""
-[증거 {i}] (ID: {evidence_id})
-- 분류: {", ".join(labels) if labels else "N/A"}
-- 화자: {speaker or "N/A"}
-- 시점: {timestamp or "N/A"}
-- 내용: {content}
-""")
+        per_doc_tokens = min(_RAG_CONTENT_TOKENS, _RAG_CONTEXT_TOKENS // len(rag_results))
 
-        return "\n".join(context_parts)
+        return "\n".join(
+            _RAG_CONTEXT_ENTRY.format(
+                index=i,
+                evidence_id=doc.get("id", f"evidence_{i}"),
+                labels=", ".join(doc.get("labels") or ()) or "N/A",
+                speaker=doc.get("speaker") or "N/A",
+                timestamp=doc.get("timestamp") or "N/A",
+                content=_truncate_content(doc.get("content", ""), per_doc_tokens),
+            )
+            for i, doc in enumerate(rag_results, start=1)
+        )
 
     def _extract_citations(self, rag_results: List[dict]) -> List[DraftCitation]:
         """
@@ -275,11 +582,10 @@ class DraftService:
 
         for doc in rag_results:
             evidence_id = doc.get("id")
-            content = doc.get("content", "")
             labels = doc.get("labels", [])
 
-            # Create snippet (first 200 chars)
-            snippet = content[:200] + "..." if len(content) > 200 else content
+            # Snippet precomputed at index time; cut here for older points
+            snippet = doc.get("snippet") or make_snippet(doc.get("content", ""))
 
             citations.append(
                 DraftCitation(
@@ -319,16 +625,12 @@ class DraftService:
             ValidationError: Export format not supported or missing dependencies
         """
         # 1. Validate case access
-        case = self.case_repo.get_by_id(case_id)
-        if not case:
-            raise NotFoundError("Case")
+        case = self._get_accessible_case(case_id, user_id)
 
-        if not self.member_repo.has_access(case_id, user_id):
-            raise PermissionError("You do not have access to this case")
-
-        # 2. Generate draft preview
+        # 2. Generate draft preview; access is already checked, so go straight
+        # to the preview body (served from the preview cache on repeat exports)
         request = DraftPreviewRequest()  # Use default sections
-        draft_response = self.generate_draft_preview(case_id, request, user_id)
+        draft_response = self._build_preview(case, request, get_evidence_by_case(case_id))
 
         # 3. Convert to requested format
         if export_format == DraftExportFormat.DOCX:
@@ -370,7 +672,7 @@ class DraftService:
         doc.add_paragraph()
         case_info = doc.add_paragraph()
         case_info.add_run(f"사건명: {case.title}").bold = True
-        doc.add_paragraph(f"생성일시: {draft_response.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        doc.add_paragraph(f"생성일시: {_display_timestamp(draft_response)}")
 
         # Draft content
         doc.add_heading("본문", level=1)
@@ -402,8 +704,7 @@ class DraftService:
         file_buffer.seek(0)
 
         # Generate filename
-        safe_title = case.title.replace(" ", "_")[:30]
-        filename = f"draft_{safe_title}_{draft_response.generated_at.strftime('%Y%m%d')}.docx"
+        filename = _export_filename(case, draft_response, "docx")
         content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
         return file_buffer, filename, content_type
@@ -416,8 +717,7 @@ class DraftService:
         """
         Generate PDF file from draft response
 
-        Note: For simplicity, we generate a basic text-based PDF.
-        For production, consider using reportlab or weasyprint.
+        Basic text-based layout via reportlab.
 
         Args:
             case: Case object
@@ -426,53 +726,47 @@ class DraftService:
         Returns:
             Tuple of (file_bytes, filename, content_type)
         """
-        # For now, create a simple text file as PDF placeholder
-        # In production, use reportlab or weasyprint for proper PDF generation
-        try:
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.units import inch
-            from reportlab.pdfbase.ttfonts import TTFont  # noqa: F401
-
-            file_buffer = BytesIO()
-            doc = SimpleDocTemplate(file_buffer, pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
-
-            # Title
-            story.append(Paragraph("이혼 소송 준비서면 (초안)", styles['Title']))
-            story.append(Spacer(1, 0.5 * inch))
-
-            # Case info
-            story.append(Paragraph(f"<b>사건명:</b> {case.title}", styles['Normal']))
-            story.append(Paragraph(
-                f"<b>생성일시:</b> {draft_response.generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-                styles['Normal']
-            ))
-            story.append(Spacer(1, 0.3 * inch))
-
-            # Draft content
-            story.append(Paragraph("<b>본문</b>", styles['Heading2']))
-            for paragraph_text in draft_response.draft_text.split("\n\n"):
-                if paragraph_text.strip():
-                    story.append(Paragraph(paragraph_text.strip(), styles['Normal']))
-                    story.append(Spacer(1, 0.1 * inch))
-
-            # Build PDF
-            doc.build(story)
-            file_buffer.seek(0)
-
-            safe_title = case.title.replace(" ", "_")[:30]
-            filename = f"draft_{safe_title}_{draft_response.generated_at.strftime('%Y%m%d')}.pdf"
-            content_type = "application/pdf"
-
-            return file_buffer, filename, content_type
-
-        except ImportError:
-            # Fallback: Return DOCX instead with a warning
+        if not PDF_AVAILABLE:
             raise ValidationError(
                 "PDF export is not available. "
                 "Please install reportlab: pip install reportlab. "
                 "Alternatively, use DOCX format."
             )
+
+        file_buffer = BytesIO()
+        doc = SimpleDocTemplate(file_buffer, pagesize=A4)
+        styles = _PDF_STYLES
+        story = []
+
+        # Title
+        story.append(Paragraph("이혼 소송 준비서면 (초안)", styles['Title']))
+        story.append(Spacer(1, 0.5 * inch))
+
+        # Case info
+        story.append(Paragraph(f"<b>사건명:</b> {escape(case.title)}", styles['Normal']))
+        story.append(Paragraph(
+            f"<b>생성일시:</b> {_display_timestamp(draft_response)}",
+            styles['Normal']
+        ))
+        story.append(Spacer(1, 0.3 * inch))
+
+        # Draft content; Paragraph parses reportlab's mini-markup, so LLM text
+        # is escaped (a stray "<" or "&" would otherwise break the build)
+        story.append(Paragraph("<b>본문</b>", styles['Heading2']))
+        paragraphs = [
+            escape(stripped)
+            for stripped in (text.strip() for text in draft_response.draft_text.split("\n\n"))
+            if stripped
+        ]
+        for paragraph_text in paragraphs:
+            story.append(Paragraph(paragraph_text, styles['Normal']))
+            story.append(Spacer(1, 0.1 * inch))
+
+        # Build PDF
+        doc.build(story)
+        file_buffer.seek(0)
+
+        filename = _export_filename(case, draft_response, "pdf")
+        content_type = "application/pdf"
+
+        return file_buffer, filename, content_type
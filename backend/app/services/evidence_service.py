@@ -4,9 +4,9 @@ Handles presigned URL generation and evidence metadata retrieval
 """
 
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Tuple
 from datetime import datetime
-import uuid
+from functools import lru_cache
 from app.db.schemas import (
     PresignedUrlRequest,
     PresignedUrlResponse,
@@ -17,14 +17,56 @@ from app.db.schemas import (
     Article840Tags,
     Article840Category
 )
+from app.db.models import generate_id
 from app.repositories.case_repository import CaseRepository
 from app.repositories.case_member_repository import CaseMemberRepository
 from app.utils.s3 import generate_presigned_upload_url
 from app.utils.dynamo import get_evidence_by_case, get_evidence_by_id, put_evidence_metadata as save_evidence_metadata
+from app.utils.fanout import submit_io
+from app.utils.ttl_cache import TTLCache
 from app.core.config import settings
 from app.middleware import NotFoundError, PermissionError
 from typing import Optional
 
+# DynamoDB stores categories as plain strings; map once instead of calling the
+# Enum constructor (and raising ValueError) per value
+_ARTICLE_840_BY_VALUE = {category.value: category for category in Article840Category}
+
+# File extension -> evidence type / MIME type, built once at import rather
+# than per upload-complete call
+_EVIDENCE_TYPES = {
+    "jpg": "image", "jpeg": "image", "png": "image", "gif": "image",
+    "mp3": "audio", "wav": "audio", "m4a": "audio",
+    "mp4": "video", "avi": "video", "mov": "video",
+    "pdf": "pdf",
+    "txt": "text", "csv": "text", "json": "text"
+}
+_CONTENT_TYPES = {
+    "jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "gif": "image/gif",
+    "mp3": "audio/mpeg", "wav": "audio/wav", "m4a": "audio/mp4",
+    "mp4": "video/mp4", "avi": "video/x-msvideo", "mov": "video/quicktime",
+    "pdf": "application/pdf",
+    "txt": "text/plain", "csv": "text/csv", "json": "application/json"
+}
+
+# Shared read-only default for absent tag lists: .get(key, []) would allocate a
+# fresh list for every evidence item in a listing just to be iterated or copied
+_NO_VALUES = ()
+
+# case_id -> (raw evidence items, parsed EvidenceSummary tuple, category index).
+# The items come from app.utils.dynamo's evidence-list cache, which hands out
+# the same dicts until it re-reads DynamoDB; reuse the parse while every item
+# is the identical object, so this never serves data older than that cache does.
+# The category index (Article840Category -> positions in the summary tuple) is
+# built with the parse so category-filtered lists only touch matching items
+_summary_cache = TTLCache(settings.EVIDENCE_LIST_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=16384)
+def _parse_timestamp(value: str) -> datetime:
+    """ISO timestamp from DynamoDB, memoized: list refreshes re-read the same strings"""
+    return datetime.fromisoformat(value)
+
 
 class EvidenceService:
     """
@@ -53,17 +95,22 @@ class EvidenceService:
 
         try:
             # Parse categories from string values to Article840Category enum
+            raw_categories = tags_data.get("categories", _NO_VALUES)
             categories = [
-                Article840Category(cat)
-                for cat in tags_data.get("categories", [])
+                _ARTICLE_840_BY_VALUE[cat]
+                for cat in raw_categories
+                if cat in _ARTICLE_840_BY_VALUE
             ]
+            if len(categories) != len(raw_categories):
+                # Invalid category value
+                return None
 
             return Article840Tags(
                 categories=categories,
                 confidence=tags_data.get("confidence", 0.0),
-                matched_keywords=tags_data.get("matched_keywords", [])
+                matched_keywords=tags_data.get("matched_keywords", _NO_VALUES)
             )
-        except (ValueError, KeyError):
+        except (ValueError, KeyError, TypeError):
             # Invalid category value or malformed data
             return None
 
@@ -101,7 +148,7 @@ class EvidenceService:
             raise PermissionError("You do not have access to this case")
 
         # Generate unique temporary evidence ID
-        evidence_temp_id = f"ev_{uuid.uuid4().hex[:12]}"
+        evidence_temp_id = generate_id("ev")
 
         # Construct S3 key with proper prefix
         s3_key = f"cases/{request.case_id}/raw/{evidence_temp_id}_{request.filename}"
@@ -162,17 +209,10 @@ class EvidenceService:
 
         # Determine file type from extension
         extension = filename.split(".")[-1].lower() if "." in filename else ""
-        type_mapping = {
-            "jpg": "image", "jpeg": "image", "png": "image", "gif": "image",
-            "mp3": "audio", "wav": "audio", "m4a": "audio",
-            "mp4": "video", "avi": "video", "mov": "video",
-            "pdf": "pdf",
-            "txt": "text", "csv": "text", "json": "text"
-        }
-        evidence_type = type_mapping.get(extension, "document")
+        evidence_type = _EVIDENCE_TYPES.get(extension, "document")
 
         # Generate evidence ID
-        evidence_id = f"ev_{uuid.uuid4().hex[:12]}"
+        evidence_id = generate_id("ev")
         created_at = datetime.utcnow()
 
         # Create evidence metadata for DynamoDB
@@ -209,14 +249,7 @@ class EvidenceService:
     @staticmethod
     def _get_content_type(extension: str) -> str:
         """Get MIME content type from file extension"""
-        content_types = {
-            "jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "gif": "image/gif",
-            "mp3": "audio/mpeg", "wav": "audio/wav", "m4a": "audio/mp4",
-            "mp4": "video/mp4", "avi": "video/x-msvideo", "mov": "video/quicktime",
-            "pdf": "application/pdf",
-            "txt": "text/plain", "csv": "text/csv", "json": "application/json"
-        }
-        return content_types.get(extension, "application/octet-stream")
+        return _CONTENT_TYPES.get(extension, "application/octet-stream")
 
     def get_evidence_list(
         self,
@@ -244,39 +277,78 @@ class EvidenceService:
         if not case:
             raise NotFoundError("Case")
 
+        # Start the DynamoDB read for the existing case; it overlaps the
+        # membership check and its result is discarded if the check fails
+        evidence_future = submit_io(get_evidence_by_case, case_id)
+
         # Check if user has access to case
         if not self.member_repo.has_access(case_id, user_id):
             raise PermissionError("You do not have access to this case")
 
         # Get evidence metadata from DynamoDB
-        evidence_list = get_evidence_by_case(case_id)
+        evidence_list = evidence_future.result()
 
         # Convert to EvidenceSummary schema
-        summaries = [
+        summaries, by_category = self._to_summaries(case_id, evidence_list)
+
+        if not categories:
+            return list(summaries)
+
+        # Apply category filter via the index, keeping newest-first order.
+        # A single category (the usual UI toggle) is already an ordered
+        # subset, so skip the union and sort
+        wanted = set(categories)
+        if len(wanted) == 1:
+            positions = by_category.get(wanted.pop(), _NO_VALUES)
+        else:
+            positions = sorted(set().union(*(by_category.get(category, _NO_VALUES) for category in wanted)))
+        return [summaries[i] for i in positions]
+
+    def _to_summaries(
+        self, case_id: str, evidence_list: List[dict]
+    ) -> Tuple[Tuple[EvidenceSummary, ...], Dict[Article840Category, Tuple[int, ...]]]:
+        """
+        Parse DynamoDB evidence items into EvidenceSummary, reusing the
+        previous parse when the items are unchanged (see _summary_cache)
+
+        Args:
+            case_id: Case ID
+            evidence_list: Evidence items from get_evidence_by_case
+
+        Returns:
+            (summaries, by_category): tuple of EvidenceSummary and the
+            category -> positions index, both shared with the cache (do not
+            mutate; copy into a list before handing out)
+        """
+        cached = _summary_cache.get(case_id)
+        if cached is not None:
+            items, summaries, by_category = cached
+            if len(items) == len(evidence_list) and all(a is b for a, b in zip(items, evidence_list)):
+                return summaries, by_category
+
+        summaries = tuple(
             EvidenceSummary(
                 id=evidence.get("evidence_id") or evidence.get("id"),
                 case_id=evidence["case_id"],
                 type=evidence["type"],
                 filename=evidence["filename"],
                 size=evidence.get("size", 0),
-                created_at=datetime.fromisoformat(evidence["created_at"]),
+                created_at=_parse_timestamp(evidence["created_at"]),
                 status=evidence.get("status", "pending"),
                 article_840_tags=self._parse_article_840_tags(evidence)
             )
             for evidence in evidence_list
-        ]
-
-        # Apply category filter if specified
-        if categories:
-            summaries = [
-                summary for summary in summaries
-                if summary.article_840_tags and any(
-                    cat in summary.article_840_tags.categories
-                    for cat in categories
-                )
-            ]
+        )
+
+        positions = {}
+        for i, summary in enumerate(summaries):
+            if summary.article_840_tags:
+                for category in set(summary.article_840_tags.categories):
+                    positions.setdefault(category, []).append(i)
+        by_category = {category: tuple(indexes) for category, indexes in positions.items()}
 
-        return summaries
+        _summary_cache.set(case_id, (tuple(evidence_list), summaries, by_category))
+        return summaries, by_category
 
     def get_evidence_detail(self, evidence_id: str, user_id: str) -> EvidenceDetail:
         """
@@ -321,14 +393,14 @@ class EvidenceService:
             size=evidence.get("size", 0),
             s3_key=evidence["s3_key"],
             content_type=evidence.get("content_type", "application/octet-stream"),
-            created_at=datetime.fromisoformat(evidence["created_at"]),
+            created_at=_parse_timestamp(evidence["created_at"]),
             status=evidence.get("status", "pending"),
             ai_summary=evidence.get("ai_summary"),
             labels=labels,
             insights=evidence.get("insights", []),
             content=evidence.get("content"),
             speaker=evidence.get("speaker"),
-            timestamp=datetime.fromisoformat(evidence["timestamp"]) if evidence.get("timestamp") else None,
+            timestamp=_parse_timestamp(evidence["timestamp"]) if evidence.get("timestamp") else None,
             qdrant_id=evidence.get("qdrant_id"),
             article_840_tags=article_840_tags
         )
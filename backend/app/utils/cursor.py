@@ -0,0 +1,47 @@
+"""
+Keyset pagination cursors
+Opaque token encoding the (timestamp, id) of the last row on a page
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from app.middleware import ValidationError
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    Encode the sort key of the last row into an opaque, URL-safe cursor
+
+    Args:
+        timestamp: Sort timestamp of the last row
+        row_id: Primary key of the last row (tie-breaker)
+
+    Returns:
+        Cursor string
+    """
+    raw = json.dumps({"ts": timestamp.isoformat(), "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        (timestamp, row_id)
+
+    Raises:
+        ValidationError: Cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(data["ts"]), str(data["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValidationError("Invalid pagination cursor") from e
@@ -10,6 +10,8 @@ Table Schema:
 """
 
 import logging
+import sys
+import time
 from typing import List, Dict, Optional
 from datetime import datetime, timezone
 
@@ -17,12 +19,18 @@ import boto3
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 # Initialize DynamoDB client
 _dynamodb_client = None
 
+# case_id -> evidence list; evidence list screens are polled, and the AI worker
+# writes directly to DynamoDB, so keep the TTL short (worker updates appear late
+# by at most this much). Backend writes invalidate immediately.
+_case_evidence_cache = TTLCache(settings.EVIDENCE_LIST_CACHE_TTL_SECONDS)
+
 
 def _get_dynamodb_client():
     """Get or create DynamoDB client (singleton pattern)"""
@@ -55,27 +63,32 @@ def _serialize_value(value) -> Dict:
         return {'S': str(value)}
 
 
+def _deserialize_number(num_str: str):
+    return float(num_str) if '.' in num_str else int(num_str)
+
+
+# DynamoDB type tag -> converter. Each attribute value is a single-key dict, so
+# one dict lookup replaces walking an if/elif chain of membership tests for
+# every attribute of every item on the (hot) evidence list read path.
+_DESERIALIZERS = {
+    'NULL': lambda _: None,
+    'BOOL': lambda v: v,
+    'S': lambda v: v,
+    'N': _deserialize_number,
+    'L': lambda v: [_deserialize_value(x) for x in v],
+    'M': lambda v: {k: _deserialize_value(x) for k, x in v.items()},
+    'SS': list,
+    'NS': lambda v: [_deserialize_number(n) for n in v],
+}
+
+
 def _deserialize_value(dynamodb_value: Dict):
     """Convert DynamoDB type to Python value"""
-    if 'NULL' in dynamodb_value:
-        return None
-    elif 'BOOL' in dynamodb_value:
-        return dynamodb_value['BOOL']
-    elif 'S' in dynamodb_value:
-        return dynamodb_value['S']
-    elif 'N' in dynamodb_value:
-        num_str = dynamodb_value['N']
-        return float(num_str) if '.' in num_str else int(num_str)
-    elif 'L' in dynamodb_value:
-        return [_deserialize_value(v) for v in dynamodb_value['L']]
-    elif 'M' in dynamodb_value:
-        return {k: _deserialize_value(v) for k, v in dynamodb_value['M'].items()}
-    elif 'SS' in dynamodb_value:
-        return list(dynamodb_value['SS'])
-    elif 'NS' in dynamodb_value:
-        return [float(n) if '.' in n else int(n) for n in dynamodb_value['NS']]
-    else:
-        return None
+    for tag, raw in dynamodb_value.items():
+        converter = _DESERIALIZERS.get(tag)
+        if converter is not None:
+            return converter(raw)
+    return None
 
 
 def _serialize_to_dynamodb(data: Dict) -> Dict:
@@ -88,37 +101,147 @@ def _deserialize_dynamodb_item(item: Dict) -> Dict:
     return {k: _deserialize_value(v) for k, v in item.items()}
 
 
+def _invalidate_case_evidence(case_id: Optional[str]) -> None:
+    """Drop cached evidence list for a case (all cases if case_id unknown)"""
+    if case_id:
+        _case_evidence_cache.invalidate(case_id)
+    else:
+        _case_evidence_cache.clear()
+
+
+# Attributes the list views read (EvidenceSummary + draft preview cache key;
+# processed_at moves every time the AI worker re-processes an item).
+# Heavy fields (content, ai_summary, insights) are fetched per item via
+# get_evidence_by_id, so list queries don't read/transfer/cache full text.
+# Several names are DynamoDB reserved words, hence the #placeholders.
+_SUMMARY_ATTRIBUTES = (
+    'evidence_id', 'id', 'case_id', 'type', 'filename',
+    'size', 'created_at', 'status', 'article_840_tags',
+    'processed_at',
+)
+_SUMMARY_PROJECTION = ', '.join(f'#a{i}' for i in range(len(_SUMMARY_ATTRIBUTES)))
+_SUMMARY_ATTRIBUTE_NAMES = {f'#a{i}': name for i, name in enumerate(_SUMMARY_ATTRIBUTES)}
+
+# Low-cardinality summary attributes repeated across a case's items; interned
+# so the cached evidence lists share one string per value and downstream dict
+# lookups (category/type mapping) match on identity
+_INTERNED_ATTRIBUTES = ('case_id', 'type', 'status')
+
+
+def _intern_summary_strings(item: Dict) -> Dict:
+    """Intern repeated enum-like strings of a deserialized summary item in place"""
+    for name in _INTERNED_ATTRIBUTES:
+        value = item.get(name)
+        if isinstance(value, str):
+            item[name] = sys.intern(value)
+    tags = item.get('article_840_tags')
+    if isinstance(tags, dict) and isinstance(tags.get('categories'), list):
+        tags['categories'] = [
+            sys.intern(category) if isinstance(category, str) else category
+            for category in tags['categories']
+        ]
+    return item
+
+
+# BatchWriteItem accepts at most 25 requests per call; unprocessed requests
+# (throttling) are retried with exponential backoff before giving up
+_BATCH_WRITE_SIZE = 25
+_BATCH_WRITE_MAX_ATTEMPTS = 5
+_BATCH_WRITE_BACKOFF_SECONDS = 0.05
+
+
+def _query_case_items(dynamodb, case_id: str, **query_kwargs) -> List[Dict]:
+    """
+    Query every page of case_id-index for a case
+
+    A single Query returns at most 1 MB; follow LastEvaluatedKey so large
+    cases aren't silently truncated.
+    """
+    params = {
+        'TableName': settings.DDB_EVIDENCE_TABLE,
+        'IndexName': 'case_id-index',
+        'KeyConditionExpression': 'case_id = :case_id',
+        'ExpressionAttributeValues': {':case_id': {'S': case_id}},
+        **query_kwargs,
+    }
+    items = []
+    while True:
+        response = dynamodb.query(**params)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _batch_delete_evidence(dynamodb, evidence_ids: List[str]) -> int:
+    """
+    Delete evidence items by primary key with BatchWriteItem
+
+    Returns:
+        Number of items deleted (requests still unprocessed after the
+        retries are logged and not counted)
+    """
+    table = settings.DDB_EVIDENCE_TABLE
+    deleted_count = 0
+
+    for start in range(0, len(evidence_ids), _BATCH_WRITE_SIZE):
+        chunk = evidence_ids[start:start + _BATCH_WRITE_SIZE]
+        requests = [
+            {'DeleteRequest': {'Key': {'evidence_id': {'S': evidence_id}}}}
+            for evidence_id in chunk
+        ]
+        for attempt in range(_BATCH_WRITE_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_BATCH_WRITE_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            response = dynamodb.batch_write_item(RequestItems={table: requests})
+            requests = response.get('UnprocessedItems', {}).get(table, [])
+            if not requests:
+                break
+
+        deleted_count += len(chunk) - len(requests)
+        if requests:
+            logger.warning(
+                f"Failed to delete {len(requests)} evidence items after "
+                f"{_BATCH_WRITE_MAX_ATTEMPTS} attempts"
+            )
+
+    return deleted_count
+
+
 def get_evidence_by_case(case_id: str) -> List[Dict]:
     """
-    Get all evidence metadata for a case from DynamoDB
+    Get evidence summary metadata for a case from DynamoDB
 
-    Uses GSI: case_id-index for efficient query
+    Uses GSI: case_id-index for efficient query, projected to
+    _SUMMARY_ATTRIBUTES. Results are cached for
+    EVIDENCE_LIST_CACHE_TTL_SECONDS; writes through this module invalidate.
 
     Args:
         case_id: Case ID (GSI partition key)
 
     Returns:
-        List of evidence metadata dictionaries
+        List of evidence metadata dictionaries (summary attributes only)
     """
+    cached = _case_evidence_cache.get(case_id)
+    if cached is not None:
+        return list(cached)
+
     dynamodb = _get_dynamodb_client()
 
     try:
-        response = dynamodb.query(
-            TableName=settings.DDB_EVIDENCE_TABLE,
-            IndexName='case_id-index',
-            KeyConditionExpression='case_id = :case_id',
-            ExpressionAttributeValues={
-                ':case_id': {'S': case_id}
-            }
+        items = _query_case_items(
+            dynamodb,
+            case_id,
+            ProjectionExpression=_SUMMARY_PROJECTION,
+            ExpressionAttributeNames=_SUMMARY_ATTRIBUTE_NAMES
         )
-
-        items = response.get('Items', [])
-        evidence_list = [_deserialize_dynamodb_item(item) for item in items]
+        evidence_list = [_intern_summary_strings(_deserialize_dynamodb_item(item)) for item in items]
 
         # Sort by created_at descending (newest first)
         evidence_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
-        return evidence_list
+        _case_evidence_cache.set(case_id, evidence_list)
+        return list(evidence_list)
 
     except ClientError as e:
         logger.error(f"DynamoDB query error for case {case_id}: {e}")
@@ -194,6 +317,7 @@ def put_evidence_metadata(evidence_data: Dict) -> Dict:
             TableName=settings.DDB_EVIDENCE_TABLE,
             Item=_serialize_to_dynamodb(item_data)
         )
+        _invalidate_case_evidence(item_data.get('case_id'))
         return item_data
 
     except ClientError as e:
@@ -221,6 +345,7 @@ def delete_evidence_metadata(evidence_id: str, case_id: str = None) -> bool:
                 'evidence_id': {'S': evidence_id}
             }
         )
+        _invalidate_case_evidence(case_id)
         return True
 
     except ClientError as e:
@@ -241,34 +366,18 @@ def clear_case_evidence(case_id: str) -> int:
     dynamodb = _get_dynamodb_client()
 
     try:
-        # First, query all evidence for this case using GSI
-        response = dynamodb.query(
-            TableName=settings.DDB_EVIDENCE_TABLE,
-            IndexName='case_id-index',
-            KeyConditionExpression='case_id = :case_id',
-            ExpressionAttributeValues={
-                ':case_id': {'S': case_id}
-            },
+        # First, query all evidence keys for this case using GSI
+        items = _query_case_items(
+            dynamodb,
+            case_id,
             ProjectionExpression='evidence_id'  # Only need the key
         )
+        evidence_ids = [item['evidence_id']['S'] for item in items]
 
-        items = response.get('Items', [])
-        deleted_count = 0
-
-        # Delete each evidence item
-        for item in items:
-            evidence_id = item['evidence_id']['S']
-            try:
-                dynamodb.delete_item(
-                    TableName=settings.DDB_EVIDENCE_TABLE,
-                    Key={
-                        'evidence_id': {'S': evidence_id}
-                    }
-                )
-                deleted_count += 1
-            except ClientError as e:
-                logger.warning(f"Failed to delete evidence {evidence_id}: {e}")
+        # Then delete them 25 at a time instead of one DeleteItem per id
+        deleted_count = _batch_delete_evidence(dynamodb, evidence_ids)
 
+        _invalidate_case_evidence(case_id)
         return deleted_count
 
     except ClientError as e:
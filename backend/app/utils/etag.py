@@ -0,0 +1,39 @@
+"""
+Conditional GET helpers
+Strong ETag over the serialized body + If-None-Match short-circuit
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+
+def etag_json_response(request: Request, adapter: TypeAdapter, payload: Any) -> Response:
+    """
+    Serialize payload once and answer 304 if the client already has it
+
+    Polling clients send back the ETag they last saw; when the payload is
+    unchanged the body is not sent. The hash is over the exact bytes that
+    would be returned, so any field change yields a new tag.
+
+    Args:
+        request: Incoming request (reads If-None-Match)
+        adapter: TypeAdapter for the endpoint's response model
+        payload: Value to serialize
+
+    Returns:
+        200 JSON response with ETag, or empty 304 with the same ETag
+    """
+    body = adapter.dump_json(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
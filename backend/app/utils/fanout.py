@@ -0,0 +1,30 @@
+"""
+Request-scoped I/O fan-out
+Overlap independent network calls (DynamoDB, Qdrant) with DB work in sync endpoints
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+from app.core.config import settings
+
+# Shared, bounded pool: caps outstanding side calls across all requests so a
+# burst of clients cannot exhaust sockets or the DB threadpool. Never pass a
+# SQLAlchemy Session into work submitted here (sessions are not thread-safe).
+_executor = ThreadPoolExecutor(
+    max_workers=settings.IO_FANOUT_WORKERS,
+    thread_name_prefix="io-fanout"
+)
+
+
+def submit_io(fn: Callable, *args, **kwargs) -> Future:
+    """
+    Start a blocking I/O call in the background
+
+    Args:
+        fn: Function to call (must not touch the request's DB session)
+        *args, **kwargs: Arguments for fn
+
+    Returns:
+        Future; call .result() where the value is needed (re-raises fn's error)
+    """
+    return _executor.submit(fn, *args, **kwargs)
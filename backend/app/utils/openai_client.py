@@ -5,9 +5,10 @@ Real OpenAI API implementation using official openai package.
 """
 
 import logging
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional
 from openai import OpenAI
 from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,8 @@ def generate_chat_completion(
     messages: List[Dict[str, str]],
     model: Optional[str] = None,
     temperature: float = 0.3,
-    max_tokens: int = 4000
+    max_tokens: int = 4000,
+    prompt_cache_key: Optional[str] = None
 ) -> str:
     """
     Generate chat completion using OpenAI GPT model
@@ -46,6 +48,8 @@ def generate_chat_completion(
         model: Model name (defaults to settings.OPENAI_MODEL_CHAT)
         temperature: Sampling temperature (0.0-2.0)
         max_tokens: Maximum tokens to generate
+        prompt_cache_key: Routing hint for OpenAI prompt caching; requests
+            sharing a key and a message prefix are more likely to hit the cache
 
     Returns:
         Generated text response
@@ -62,11 +66,15 @@ def generate_chat_completion(
     try:
         logger.info(f"Calling OpenAI chat completion with model={model}")
 
+        # Sent via extra_body so older openai SDKs (no typed kwarg) still work
+        extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+
         response = client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            extra_body=extra_body
         )
 
         result = response.choices[0].message.content
@@ -79,6 +87,53 @@ def generate_chat_completion(
         raise
 
 
+def stream_chat_completion(
+    messages: List[Dict[str, str]],
+    model: Optional[str] = None,
+    temperature: float = 0.3,
+    max_tokens: int = 4000,
+    prompt_cache_key: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Stream chat completion text as it is generated
+
+    Same arguments as generate_chat_completion. The request is sent on the
+    first next(); iterate to completion to release the HTTP connection.
+
+    Yields:
+        Non-empty text fragments, in order
+
+    Raises:
+        ValueError: If API key is not configured
+        openai.APIError: If API call fails
+    """
+    if model is None:
+        model = settings.OPENAI_MODEL_CHAT
+
+    client = _get_openai_client()
+    extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+
+    try:
+        logger.info(f"Streaming OpenAI chat completion with model={model}")
+
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra_body=extra_body,
+            stream=True
+        )
+
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    except Exception as e:
+        logger.error(f"OpenAI API error: {e}")
+        raise
+
+
 def generate_embedding(text: str, model: Optional[str] = None) -> List[float]:
     """
     Generate text embedding using OpenAI embedding model
@@ -117,6 +172,49 @@ def generate_embedding(text: str, model: Optional[str] = None) -> List[float]:
         raise
 
 
+# Rough chars-per-token for Korean text when tiktoken is unavailable
+_FALLBACK_CHARS_PER_TOKEN = 2
+
+# model -> tiktoken encoding; only successful loads are kept for the process
+_encodings: Dict[str, Any] = {}
+# Models whose encoding failed to load (e.g. BPE download error); retried once
+# this expires instead of on every call or never again
+_encoding_failures = TTLCache(60)
+
+
+def _get_encoding(model: str):
+    """
+    tiktoken encoding for a model, loaded once per process
+
+    Returns None when tiktoken is not installed or its BPE file cannot be
+    loaded (first use downloads it), so callers fall back to an estimate.
+    """
+    encoding = _encodings.get(model)
+    if encoding is not None or _encoding_failures.get(model):
+        return encoding
+
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed, using rough token estimate")
+        _encoding_failures.set(model, True)
+        return None
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Fallback to cl100k_base for unknown models
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable ({e}), using rough token estimate")
+        _encoding_failures.set(model, True)
+        return None
+
+    _encodings[model] = encoding
+    return encoding
+
+
 def count_tokens(text: str, model: Optional[str] = None) -> int:
     """
     Estimate token count for text using tiktoken
@@ -128,22 +226,37 @@ def count_tokens(text: str, model: Optional[str] = None) -> int:
     Returns:
         Token count
     """
-    try:
-        import tiktoken
+    encoding = _get_encoding(model or settings.OPENAI_MODEL_CHAT)
+    if encoding is None:
+        # Conservative estimate for Korean text
+        return len(text) // _FALLBACK_CHARS_PER_TOKEN
 
-        if model is None:
-            model = settings.OPENAI_MODEL_CHAT
+    return len(encoding.encode(text))
 
-        # Get encoding for model
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            # Fallback to cl100k_base for unknown models
-            encoding = tiktoken.get_encoding("cl100k_base")
 
-        return len(encoding.encode(text))
+def truncate_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    Cut text to at most max_tokens tokens
 
-    except ImportError:
-        # Fallback: rough estimate (1 token ≈ 4 chars for English, 2 chars for Korean)
-        logger.warning("tiktoken not installed, using rough token estimate")
-        return len(text) // 2  # Conservative estimate for Korean text
+    Args:
+        text: Text to truncate
+        max_tokens: Token limit
+        model: Model name for encoding selection
+
+    Returns:
+        text itself if within the limit, otherwise its leading max_tokens tokens
+    """
+    # Every token covers at least one UTF-8 byte (byte-level BPE); a character
+    # count is not a bound, since rare Hangul/CJK/emoji span several tokens
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+
+    encoding = _get_encoding(model or settings.OPENAI_MODEL_CHAT)
+    if encoding is None:
+        return text[:max_tokens * _FALLBACK_CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    # A cut inside a multi-byte character decodes to U+FFFD; drop it
+    return encoding.decode(tokens[:max_tokens]).rstrip("\ufffd")
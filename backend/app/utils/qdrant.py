@@ -6,13 +6,16 @@ Qdrant is used for vector similarity search to find relevant evidence documents.
 """
 
 import logging
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Hashable, Optional
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
 
 from app.core.config import settings
 from app.utils.openai_client import generate_embedding
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +48,59 @@ def _get_collection_name(case_id: str) -> str:
     return f"{settings.QDRANT_COLLECTION_PREFIX}{case_id}"
 
 
+# Binary-quantized vectors stay in RAM for the HNSW walk; the float originals
+# live on disk and are only read to rescore the oversampled candidates
+_QUANTIZATION_CONFIG = models.BinaryQuantization(
+    binary=models.BinaryQuantizationConfig(always_ram=True)
+)
+_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(
+        ignore=False,
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
+# case_id -> {(query, top_k, filters, cache_token): results}. Draft RAG queries
+# are fixed strings, so repeat drafts for a case ask Qdrant the same thing. The
+# AI worker indexes directly into Qdrant without invalidating this cache, so
+# callers pass a cache_token that changes with the evidence set and the TTL is
+# kept short; backend writes below invalidate the case immediately.
+_search_cache = TTLCache(settings.QDRANT_SEARCH_CACHE_TTL_SECONDS)
+
+
+# Citation preview length; the snippet is cut once when a document is indexed
+# and stored in its payload, so draft citations don't re-slice full content
+SNIPPET_CHARS = 200
+
+
+def make_snippet(content: str) -> str:
+    """First SNIPPET_CHARS characters of content, marking a cut with '...'"""
+    return content[:SNIPPET_CHARS] + "..." if len(content) > SNIPPET_CHARS else content
+
+
+@lru_cache(maxsize=256)
+def _embed_query(query: str) -> List[float]:
+    """Query embedding, memoized: the same text always maps to the same vector"""
+    return generate_embedding(query)
+
+
+def _filters_key(filters: Optional[Dict]) -> Hashable:
+    """Hashable form of search filters for the result cache key"""
+    if not filters:
+        return None
+    return tuple(sorted(
+        (field, tuple(values) if isinstance(values, list) else values)
+        for field, values in filters.items()
+    ))
+
+
 def search_evidence_by_semantic(
     case_id: str,
     query: str,
     top_k: int = 5,
-    filters: Optional[Dict] = None
+    filters: Optional[Dict] = None,
+    cache_token: Hashable = None
 ) -> List[Dict]:
     """
     Search evidence using semantic similarity (vector search)
@@ -59,22 +110,23 @@ def search_evidence_by_semantic(
         query: Search query text
         top_k: Number of top results to return
         filters: Optional filters (e.g., {"labels": ["폭언"]})
+        cache_token: Part of the cache key; pass a value that changes when
+            the case's evidence changes outside the backend (AI worker indexing)
 
     Returns:
         List of evidence documents with similarity scores
     """
+    search_key = (query, top_k, _filters_key(filters), cache_token)
+    case_results = _search_cache.get(case_id)
+    if case_results is not None and search_key in case_results:
+        return list(case_results[search_key])
+
     client = _get_qdrant_client()
     collection_name = _get_collection_name(case_id)
 
     try:
-        # Check if collection exists
-        collections = client.get_collections().collections
-        if not any(c.name == collection_name for c in collections):
-            logger.warning(f"Collection {collection_name} does not exist")
-            return []
-
         # Generate query embedding using OpenAI
-        query_embedding = generate_embedding(query)
+        query_embedding = _embed_query(query)
 
         # Build filter conditions if provided
         qdrant_filter = None
@@ -99,11 +151,15 @@ def search_evidence_by_semantic(
             if filter_conditions:
                 qdrant_filter = models.Filter(must=filter_conditions)
 
-        # Execute search using query_points (qdrant-client >= 1.7)
+        # Execute search using query_points (qdrant-client >= 1.7). No
+        # get_collections() pre-check: a missing collection comes back as 404
+        # from this same call, saving a round-trip that listed every case
         results = client.query_points(
             collection_name=collection_name,
             query=query_embedding,
             query_filter=qdrant_filter,
+            # In-memory mode is brute-force and warns on search_params
+            search_params=_SEARCH_PARAMS if settings.QDRANT_HOST else None,
             limit=top_k,
             with_payload=True
         ).points
@@ -116,8 +172,20 @@ def search_evidence_by_semantic(
             evidence_list.append(doc)
 
         logger.info(f"Qdrant search returned {len(evidence_list)} results for case {case_id}")
-        return evidence_list
 
+        # Entries share the case's expiry, so invalidate(case_id) drops them all
+        if case_results is None:
+            case_results = {}
+            _search_cache.set(case_id, case_results)
+        case_results[search_key] = evidence_list
+        return list(evidence_list)
+
+    except UnexpectedResponse as e:
+        if e.status_code == 404:
+            logger.warning(f"Collection {collection_name} does not exist")
+        else:
+            logger.error(f"Qdrant search error for case {case_id}: {e}")
+        return []
     except Exception as e:
         logger.error(f"Qdrant search error for case {case_id}: {e}")
         return []
@@ -159,6 +227,8 @@ def index_evidence_document(case_id: str, document: Dict) -> str:
 
         # Prepare payload (exclude vector from payload)
         payload = {k: v for k, v in document.items() if k != "vector"}
+        if "snippet" not in payload and isinstance(payload.get("content"), str):
+            payload["snippet"] = make_snippet(payload["content"])
 
         # Upsert point
         client.upsert(
@@ -172,6 +242,7 @@ def index_evidence_document(case_id: str, document: Dict) -> str:
             ]
         )
 
+        _search_cache.invalidate(case_id)
         logger.info(f"Indexed document {doc_id} in collection {collection_name}")
         return doc_id
 
@@ -205,8 +276,10 @@ def create_case_collection(case_id: str) -> bool:
             collection_name=collection_name,
             vectors_config=VectorParams(
                 size=1536,  # OpenAI text-embedding-3-small dimension
-                distance=Distance.COSINE
-            )
+                distance=Distance.COSINE,
+                on_disk=True
+            ),
+            quantization_config=_QUANTIZATION_CONFIG
         )
 
         logger.info(f"Created Qdrant collection: {collection_name}")
@@ -238,6 +311,7 @@ def delete_case_collection(case_id: str) -> bool:
             return False
 
         client.delete_collection(collection_name=collection_name)
+        _search_cache.invalidate(case_id)
         logger.info(f"Deleted Qdrant collection: {collection_name}")
         return True
 
@@ -0,0 +1,64 @@
+"""
+In-process TTL cache
+Small thread-safe key/value cache for hot, rarely-changing lookups
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Dict-backed cache whose entries expire after ``ttl_seconds``
+
+    Per-process only: each worker keeps its own copy, so writers must call
+    invalidate() and readers must tolerate up to ``ttl_seconds`` of staleness
+    from other processes. ``ttl_seconds <= 0`` disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value, or default if missing/expired"""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for ttl_seconds"""
+        if self.ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            if len(self._data) >= self.max_entries:
+                # Cheap bound on memory: drop everything rather than track LRU order
+                self._data.clear()
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single key"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
@@ -20,6 +20,9 @@ def pytest_configure(config):
     In local environment:
       - Load .env file for integration tests
     """
+    # Fail on N+1 lazy loads in list queries (see app/db/loading.py)
+    os.environ.setdefault("STRICT_LOADING", "true")
+
     # CI environment: set test defaults if not already set
     if os.environ.get("TESTING") == "true":
         # These defaults are used in CI when env vars are not explicitly set
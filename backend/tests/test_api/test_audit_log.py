@@ -28,8 +28,8 @@ class TestAuditLogAPI:
         return user
 
     @pytest.fixture
-    def sample_audit_logs(self):
-        """Sample audit logs with different timestamps and actions"""
+    def sample_audit_logs(self, sample_users_map):
+        """Sample audit log rows (joined with user email/name) with different timestamps and actions"""
         now = datetime.utcnow()
 
         logs = []
@@ -61,6 +61,12 @@ class TestAuditLogAPI:
         log3.timestamp = now - timedelta(minutes=10)
         logs.append(log3)
 
+        # Repository rows carry the joined user columns
+        for log in logs:
+            user = sample_users_map[log.user_id]
+            log.user_email = user.email
+            log.user_name = user.name
+
         return logs
 
     @pytest.fixture
@@ -97,17 +103,12 @@ class TestAuditLogAPI:
         When: GET /admin/audit?page=1&page_size=10
         Then: Returns logs with pagination metadata
         """
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository") as mock_user_repo:
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             # Mock repository
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_with_pagination.return_value = (sample_audit_logs, 3)
 
-            # Mock user repository
-            mock_user_repo_instance = mock_user_repo.return_value
-            mock_user_repo_instance.get_by_id.side_effect = lambda uid: sample_users_map.get(uid)
-
             # Call API
             response = client.get(
                 "/admin/audit?page=1&page_size=10",
@@ -159,8 +160,7 @@ class TestAuditLogAPI:
         start_date = (now - timedelta(days=7)).isoformat()
         end_date = now.isoformat()
 
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository"):
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_with_pagination.return_value = ([], 0)
@@ -198,15 +198,11 @@ class TestAuditLogAPI:
         # Filter to only user_lawyer1's logs
         filtered_logs = [log for log in sample_audit_logs if log.user_id == "user_lawyer1"]
 
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository") as mock_user_repo:
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_with_pagination.return_value = (filtered_logs, len(filtered_logs))
 
-            mock_user_repo_instance = mock_user_repo.return_value
-            mock_user_repo_instance.get_by_id.side_effect = lambda uid: sample_users_map.get(uid)
-
             # Call API with user_id filter
             response = client.get(
                 "/admin/audit?user_id=user_lawyer1",
@@ -244,15 +240,11 @@ class TestAuditLogAPI:
             if log.action in [AuditAction.LOGIN.value, AuditAction.CREATE_CASE.value]
         ]
 
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository") as mock_user_repo:
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_with_pagination.return_value = (filtered_logs, len(filtered_logs))
 
-            mock_user_repo_instance = mock_user_repo.return_value
-            mock_user_repo_instance.get_by_id.side_effect = lambda uid: sample_users_map.get(uid)
-
             # Call API with actions filter
             response = client.get(
                 "/admin/audit?actions=LOGIN&actions=CREATE_CASE",
@@ -269,6 +261,87 @@ class TestAuditLogAPI:
         for log in data["logs"]:
             assert log["action"] in ["LOGIN", "CREATE_CASE"]
 
+    def test_get_audit_logs_with_cursor(
+        self,
+        client,
+        admin_auth_headers,
+        sample_audit_logs,
+    ):
+        """
+        Test GET /admin/audit keyset pagination
+
+        Given: A full first page (page_size == rows returned)
+        When: The next_cursor is sent back
+        Then: Repository seeks past the last row instead of using OFFSET
+        """
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
+
+            mock_repo_instance = mock_repo.return_value
+            mock_repo_instance.get_logs_with_pagination.return_value = (sample_audit_logs, 10)
+
+            first = client.get("/admin/audit?page_size=3", headers=admin_auth_headers)
+            next_cursor = first.json()["next_cursor"]
+
+            second = client.get(
+                f"/admin/audit?page_size=3&cursor={next_cursor}",
+                headers=admin_auth_headers
+            )
+
+        assert first.status_code == 200
+        assert next_cursor is not None
+        assert second.status_code == 200
+
+        call_args = mock_repo_instance.get_logs_with_pagination.call_args
+        last = sample_audit_logs[-1]
+        assert call_args.kwargs["after"] == (last.timestamp, last.id)
+
+    def test_get_audit_logs_last_page_has_no_cursor(
+        self,
+        client,
+        admin_auth_headers,
+        sample_audit_logs,
+    ):
+        """
+        Test GET /admin/audit returns next_cursor=None on a partial page
+        """
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
+
+            mock_repo.return_value.get_logs_with_pagination.return_value = (sample_audit_logs, 3)
+
+            response = client.get("/admin/audit?page_size=10", headers=admin_auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+
+    def test_get_audit_logs_invalid_cursor(
+        self,
+        client,
+        admin_auth_headers,
+    ):
+        """
+        Test GET /admin/audit rejects a malformed cursor with 400
+        """
+        with patch("app.services.audit_log_service.AuditLogRepository"):
+
+            response = client.get("/admin/audit?cursor=not-a-cursor", headers=admin_auth_headers)
+
+        assert response.status_code == 400
+
+    def test_get_audit_logs_rejects_oversized_cursor(
+        self,
+        client,
+        admin_auth_headers,
+    ):
+        """
+        Test GET /admin/audit bounds cursor length before any decoding or query
+        """
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
+
+            response = client.get(f"/admin/audit?cursor={'A' * 1000}", headers=admin_auth_headers)
+
+        assert response.status_code == 422
+        mock_repo.return_value.get_logs_with_pagination.assert_not_called()
+
     def test_get_audit_logs_requires_admin(
         self,
         client,
@@ -311,15 +384,11 @@ class TestAuditLogAPI:
         When: GET /admin/audit/export
         Then: Returns CSV file with correct headers and data
         """
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository") as mock_user_repo:
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_for_export.return_value = sample_audit_logs
 
-            mock_user_repo_instance = mock_user_repo.return_value
-            mock_user_repo_instance.get_by_id.side_effect = lambda uid: sample_users_map.get(uid)
-
             # Call API
             response = client.get(
                 "/admin/audit/export",
@@ -342,6 +411,7 @@ class TestAuditLogAPI:
 
         # Check data rows
         assert len(lines) >= 4  # Header + 3 logs + possible trailing newline
+        assert lines[1].endswith(sample_audit_logs[0].timestamp.strftime("%Y-%m-%d %H:%M:%S"))
 
     def test_export_audit_logs_with_filters(
         self,
@@ -359,8 +429,7 @@ class TestAuditLogAPI:
         now = datetime.utcnow()
         start_date = (now - timedelta(days=7)).isoformat()
 
-        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo, \
-             patch("app.services.audit_log_service.UserRepository"):
+        with patch("app.services.audit_log_service.AuditLogRepository") as mock_repo:
 
             mock_repo_instance = mock_repo.return_value
             mock_repo_instance.get_logs_for_export.return_value = []
@@ -451,6 +520,32 @@ class TestAuditLogMiddleware:
         result = extract_object_id("/auth/login", r"^/auth/login$")
         assert result is None
 
+    def test_match_auditable_endpoint(self):
+        """
+        Test precompiled endpoint lookup
+
+        Given: Request method + path
+        When: match_auditable_endpoint is called
+        Then: Returns (action, object_id) for auditable requests, None otherwise
+        """
+        from app.middleware.audit_log import match_auditable_endpoint
+        from app.db.schemas import AuditAction
+
+        assert match_auditable_endpoint("GET", "/cases/case_abc123") == (AuditAction.VIEW_CASE, "case_abc123")
+        assert match_auditable_endpoint("DELETE", "/cases/case_abc123") == (AuditAction.DELETE_CASE, "case_abc123")
+        assert match_auditable_endpoint("POST", "/auth/login") == (AuditAction.LOGIN, None)
+        assert match_auditable_endpoint("POST", "/cases/case_abc123/draft-preview") == (
+            AuditAction.GENERATE_DRAFT, "case_abc123"
+        )
+        assert match_auditable_endpoint("POST", "/cases/case_abc123/draft-preview/stream") == (
+            AuditAction.GENERATE_DRAFT, "case_abc123"
+        )
+
+        # Not auditable: wrong method, unlisted path, nested path
+        assert match_auditable_endpoint("PATCH", "/cases/case_abc123") is None
+        assert match_auditable_endpoint("GET", "/cases") is None
+        assert match_auditable_endpoint("GET", "/cases/case_abc123/evidence") is None
+
     def test_middleware_only_logs_successful_requests(self):
         """
         Test middleware only logs 2xx responses
@@ -491,7 +586,26 @@ class TestAuditLogMiddleware:
         assert ("DELETE", r"^/admin/users/[^/]+$") in AUDITABLE_ENDPOINTS
 
         # Check draft endpoint
-        assert ("POST", r"^/cases/[^/]+/draft-preview$") in AUDITABLE_ENDPOINTS
+        assert ("POST", r"^/cases/[^/]+/draft-preview(/stream)?$") in AUDITABLE_ENDPOINTS
+
+    def test_write_audit_log_swallows_db_errors(self):
+        """
+        Test a failed audit insert is rolled back without raising
+
+        Given: The audit INSERT fails
+        When: _write_audit_log runs (on the threadpool)
+        Then: Session is rolled back and closed; no exception escapes
+        """
+        from app.middleware import audit_log
+
+        db = Mock()
+        db.execute.side_effect = RuntimeError("db down")
+        with patch.object(audit_log, "SessionLocal", return_value=db):
+            audit_log._write_audit_log("user_1", AuditAction.VIEW_CASE.value, "case_1")
+
+        db.rollback.assert_called_once()
+        db.close.assert_called_once()
+        db.commit.assert_not_called()
 
     def test_audit_action_enum_completeness(self):
         """
@@ -112,14 +112,17 @@ class TestCaseSharing:
             # Mock get_all_members for response
             owner_member = Mock()
             owner_member.user_id = sample_owner_user.id
+            owner_member.user = sample_owner_user
             owner_member.role = CaseMemberRole.OWNER
 
             new_member1 = Mock()
             new_member1.user_id = sample_member_user.id
+            new_member1.user = sample_member_user
             new_member1.role = CaseMemberRole.MEMBER
 
             new_member2 = Mock()
             new_member2.user_id = sample_viewer_user.id
+            new_member2.user = sample_viewer_user
             new_member2.role = CaseMemberRole.VIEWER
 
             mock_member_instance.get_all_members.return_value = [
@@ -139,6 +142,10 @@ class TestCaseSharing:
                 return None
 
             mock_user_repo.return_value.get_by_id.side_effect = mock_get_by_id
+            mock_user_repo.return_value.get_existing_ids.return_value = {
+                sample_member_user.id,
+                sample_viewer_user.id,
+            }
 
             # Call API
             response = client.post(
@@ -265,6 +272,7 @@ class TestCaseSharing:
 
             # User does not exist
             mock_user_repo.return_value.get_by_id.return_value = None
+            mock_user_repo.return_value.get_existing_ids.return_value = set()
 
             # Call API
             response = client.post(
@@ -319,6 +327,7 @@ class TestCaseSharing:
             admin_user = Mock()
             admin_user.role = UserRole.ADMIN
             mock_user_repo.return_value.get_by_id.return_value = admin_user
+            mock_user_repo.return_value.get_existing_ids.return_value = {sample_member_user.id}
 
             # Mock successful add
             mock_member_instance.add_members_batch.return_value = []
@@ -366,10 +375,12 @@ class TestCaseSharing:
             # Mock members list
             owner_member = Mock()
             owner_member.user_id = sample_owner_user.id
+            owner_member.user = sample_owner_user
             owner_member.role = CaseMemberRole.OWNER
 
             regular_member = Mock()
             regular_member.user_id = sample_member_user.id
+            regular_member.user = sample_member_user
             regular_member.role = CaseMemberRole.MEMBER
 
             mock_member_instance.get_all_members.return_value = [
@@ -484,11 +495,13 @@ class TestCaseSharing:
             # Member now has upgraded role
             upgraded_member = Mock()
             upgraded_member.user_id = sample_member_user.id
+            upgraded_member.user = sample_member_user
             upgraded_member.role = CaseMemberRole.MEMBER  # Upgraded from VIEWER
 
             mock_member_instance.get_all_members.return_value = [upgraded_member]
 
             mock_user_repo.return_value.get_by_id.return_value = sample_member_user
+            mock_user_repo.return_value.get_existing_ids.return_value = {sample_member_user.id}
 
             # Call API
             response = client.post(
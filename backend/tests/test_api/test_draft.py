@@ -3,10 +3,12 @@ Test suite for Draft Preview API endpoint
 
 Tests for:
 - POST /cases/{case_id}/draft-preview - Generate draft preview with RAG
+- POST /cases/{case_id}/draft-preview/stream - Stream draft preview (SSE)
 
 Note: This uses Qdrant (in-memory mode) and OpenAI for RAG search.
 """
 
+import json
 from unittest.mock import patch
 from fastapi import status
 
@@ -82,7 +84,8 @@ class TestDraftPreview:
         case_id = case_response.json()["id"]
 
         # When: POST /cases/{case_id}/draft-preview with empty evidence list
-        with patch("app.services.draft_service.get_evidence_by_case") as mock_get_evidence:
+        with patch("app.services.draft_service.get_evidence_by_case") as mock_get_evidence, \
+             patch("app.services.draft_service.search_evidence_by_semantic", return_value=[]):
             mock_get_evidence.return_value = []  # No evidence
 
             draft_request = {"sections": ["청구취지"]}
@@ -189,3 +192,99 @@ class TestDraftPreview:
 
         # Then: 422 Validation Error
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestDraftPreviewStream:
+    """
+    Test suite for POST /cases/{case_id}/draft-preview/stream endpoint
+    """
+
+    def test_should_stream_citations_then_text(self, client, test_user, auth_headers):
+        """
+        Given: User owns a case with processed evidence
+        When: POST /cases/{case_id}/draft-preview/stream is called
+        Then:
+            - Returns 200 text/event-stream
+            - First event carries citations, then text deltas, then done
+        """
+        case_response = client.post("/cases", json={"title": "스트리밍 테스트 사건"}, headers=auth_headers)
+        case_id = case_response.json()["id"]
+
+        mock_evidence = [{
+            "id": f"ev_stream_{case_id}",
+            "case_id": case_id,
+            "status": "done",
+            "labels": ["폭언"],
+            "content": "스트리밍 증거 내용"
+        }]
+
+        with patch("app.services.draft_service.get_evidence_by_case") as mock_get_evidence, \
+             patch("app.services.draft_service.search_evidence_by_semantic") as mock_search, \
+             patch("app.services.draft_service.stream_chat_completion") as mock_stream:
+            mock_get_evidence.return_value = mock_evidence
+            mock_search.return_value = mock_evidence
+            mock_stream.return_value = iter(["준비서면 ", "초안\n[증거 1]"])
+
+            response = client.post(f"/cases/{case_id}/draft-preview/stream", json={}, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = [
+            (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("\n")[1].removeprefix("data: ")))
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["citations", "delta", "delta", "done"]
+        assert events[0][1][0]["evidence_id"] == f"ev_stream_{case_id}"
+        assert "".join(data["text"] for name, data in events if name == "delta") == "준비서면 초안\n[증거 1]"
+        assert "generated_at" in events[-1][1]
+
+    def test_should_end_with_error_event_when_generation_fails(self, client, test_user, auth_headers):
+        """
+        Given: GPT-4o fails after the stream has started
+        When: POST /cases/{case_id}/draft-preview/stream is called
+        Then:
+            - Stream ends with an "error" event instead of "done"
+            - The partial draft is not cached (next request regenerates)
+        """
+        case_response = client.post("/cases", json={"title": "스트리밍 실패 사건"}, headers=auth_headers)
+        case_id = case_response.json()["id"]
+
+        mock_evidence = [{"id": f"ev_fail_{case_id}", "case_id": case_id, "status": "done", "content": "증거"}]
+
+        def failing_stream(**kwargs):
+            yield "준비서면 "
+            raise RuntimeError("OpenAI unavailable")
+
+        with patch("app.services.draft_service.get_evidence_by_case", return_value=mock_evidence), \
+             patch("app.services.draft_service.search_evidence_by_semantic", return_value=mock_evidence), \
+             patch("app.services.draft_service.stream_chat_completion", side_effect=failing_stream) as mock_stream:
+            response = client.post(f"/cases/{case_id}/draft-preview/stream", json={}, headers=auth_headers)
+            client.post(f"/cases/{case_id}/draft-preview/stream", json={}, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        events = [
+            (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("\n")[1].removeprefix("data: ")))
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["citations", "delta", "error"]
+        assert events[-1][1]["message"]
+        assert mock_stream.call_count == 2
+
+    def test_should_return_400_before_streaming_when_no_evidence(self, client, test_user, auth_headers):
+        """
+        Given: User owns a case with no evidence
+        When: POST /cases/{case_id}/draft-preview/stream is called
+        Then:
+            - Returns 400 as a regular JSON error (no stream started)
+        """
+        case_response = client.post("/cases", json={"title": "증거 없는 스트리밍"}, headers=auth_headers)
+        case_id = case_response.json()["id"]
+
+        with patch("app.services.draft_service.get_evidence_by_case") as mock_get_evidence, \
+             patch("app.services.draft_service.search_evidence_by_semantic", return_value=[]):
+            mock_get_evidence.return_value = []
+            response = client.post(f"/cases/{case_id}/draft-preview/stream", json={}, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "증거" in response.json()["error"]["message"]
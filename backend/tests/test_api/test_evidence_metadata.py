@@ -66,6 +66,27 @@ class TestEvidenceList:
         # Then: Success
         assert response.status_code == status.HTTP_200_OK
 
+    def test_should_return_304_when_etag_matches(self, client, test_user, auth_headers):
+        """
+        Given: Client already fetched the evidence list
+        When: It polls again with If-None-Match set to the returned ETag
+        Then: Returns 304 with no body
+        """
+        case_response = client.post("/cases", json={"title": "ETag 사건"}, headers=auth_headers)
+        case_id = case_response.json()["id"]
+
+        first = client.get(f"/cases/{case_id}/evidence", headers=auth_headers)
+        etag = first.headers["ETag"]
+
+        second = client.get(
+            f"/cases/{case_id}/evidence",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
     def test_should_require_case_access_permission(self, client, test_user, auth_headers):
         """
         Given: User does not have access to a case
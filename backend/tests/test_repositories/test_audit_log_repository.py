@@ -0,0 +1,43 @@
+"""
+Tests for AuditLogRepository
+"""
+
+import pytest
+from unittest.mock import Mock
+from sqlalchemy.sql.dml import Insert
+from app.repositories.audit_log_repository import AuditLogRepository
+from app.db.models import AuditLog
+
+
+@pytest.fixture
+def mock_session():
+    """Mock SQLAlchemy session"""
+    return Mock()
+
+
+@pytest.fixture
+def audit_log_repository(mock_session):
+    """Create AuditLogRepository with mocked session"""
+    return AuditLogRepository(mock_session)
+
+
+class TestAuditLogRepositoryRecord:
+    """Tests for record (middleware write path)"""
+
+    def test_record_issues_core_insert(self, audit_log_repository, mock_session):
+        """record() executes one INSERT without adding/flushing an ORM instance"""
+        # Act
+        result = audit_log_repository.record("user_1", "VIEW_CASE", "case_1")
+
+        # Assert
+        assert result is None
+        mock_session.add.assert_not_called()
+        mock_session.flush.assert_not_called()
+
+        stmt = mock_session.execute.call_args[0][0]
+        assert isinstance(stmt, Insert)
+        assert stmt.table.name == AuditLog.__tablename__
+        params = stmt.compile().params
+        assert params["user_id"] == "user_1"
+        assert params["action"] == "VIEW_CASE"
+        assert params["object_id"] == "case_1"
@@ -0,0 +1,201 @@
+"""
+Tests for CaseMemberRepository
+"""
+
+import pytest
+from unittest.mock import Mock
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from app.repositories import case_member_repository
+from app.repositories.case_member_repository import CaseMemberRepository
+from app.db.models import CaseMember, CaseMemberRole
+
+
+@pytest.fixture(autouse=True)
+def clear_role_cache():
+    """Role cache is module-level; isolate each test"""
+    case_member_repository._role_cache.clear()
+    yield
+    case_member_repository._role_cache.clear()
+
+
+@pytest.fixture
+def mock_session():
+    """Mock SQLAlchemy session"""
+    return Mock()
+
+
+@pytest.fixture
+def member_repository(mock_session):
+    """Create CaseMemberRepository with mocked session"""
+    return CaseMemberRepository(mock_session)
+
+
+def _set_member(mock_session, member):
+    """Make get_member's statement return member (and the role probe agree)"""
+    mock_session.execute.return_value.scalars.return_value.first.return_value = member
+    mock_session.execute.return_value.scalar.return_value = member.role if member else None
+
+
+class TestCaseMemberRepositoryAccessCache:
+    """Tests for has_access / is_owner role caching"""
+
+    def test_has_access_hits_db_once(self, member_repository, mock_session):
+        """Repeated checks for the same pair are served from cache"""
+        # Arrange
+        _set_member(mock_session, Mock(spec=CaseMember))
+
+        # Act
+        first = member_repository.has_access("case_1", "user_1")
+        second = member_repository.has_access("case_1", "user_1")
+
+        # Assert
+        assert first is True
+        assert second is True
+        assert mock_session.execute.call_count == 1
+
+    def test_has_access_caches_denial(self, member_repository, mock_session):
+        """Non-members are cached as False too"""
+        # Arrange
+        _set_member(mock_session, None)
+
+        # Act & Assert
+        assert member_repository.has_access("case_1", "user_1") is False
+        assert member_repository.has_access("case_1", "user_1") is False
+        assert mock_session.execute.call_count == 1
+
+    def test_is_owner_bypasses_cached_role(self, member_repository, mock_session):
+        """Owner check reads the row even when an owner role is cached (demoted elsewhere)"""
+        # Arrange
+        mock_session.execute.return_value.scalar.return_value = CaseMemberRole.OWNER
+        assert member_repository.has_access("case_1", "user_1") is True
+        mock_session.execute.return_value.scalar.return_value = CaseMemberRole.VIEWER
+
+        # Act & Assert
+        assert member_repository.is_owner("case_1", "user_1") is False
+        assert mock_session.execute.call_count == 2
+        # The fresh role replaces the cached one
+        assert member_repository.get_role("case_1", "user_1") is CaseMemberRole.VIEWER
+        assert mock_session.execute.call_count == 2
+
+    def test_add_member_invalidates(self, member_repository, mock_session):
+        """Adding a member drops the cached denial"""
+        # Arrange
+        _set_member(mock_session, None)
+        assert member_repository.has_access("case_1", "user_1") is False
+
+        # Act
+        member_repository.add_member("case_1", "user_1", role=CaseMemberRole.VIEWER)
+        _set_member(mock_session, Mock(spec=CaseMember))
+
+        # Assert
+        assert member_repository.has_access("case_1", "user_1") is True
+
+    def test_remove_member_invalidates(self, member_repository, mock_session):
+        """Removing a member drops the cached grant"""
+        # Arrange
+        _set_member(mock_session, Mock(spec=CaseMember))
+        assert member_repository.has_access("case_1", "user_1") is True
+
+        # Act
+        member_repository.remove_member("case_1", "user_1")
+        _set_member(mock_session, None)
+
+        # Assert
+        assert member_repository.has_access("case_1", "user_1") is False
+
+
+    def test_stale_role_cached_before_commit_is_dropped_on_commit(self):
+        """A concurrent read that re-caches the old row before commit is invalidated by the commit"""
+        # Arrange
+        session = Session()
+        key = ("case_1", "user_1")
+        case_member_repository._invalidate_role(session, key)
+        # Another request reads the still-committed "not a member" row
+        case_member_repository._role_cache.set(key, None)
+
+        # Act
+        session.commit()
+
+        # Assert
+        assert case_member_repository._role_cache.get(key, "missing") == "missing"
+        assert session.info == {}
+
+
+class TestCaseMemberRepositoryIsOwner:
+    """Tests for is_owner"""
+
+    @pytest.mark.parametrize("role, expected", [
+        (CaseMemberRole.OWNER, True),
+        (CaseMemberRole.MEMBER, False),
+        (None, False),
+    ])
+    def test_is_owner_reads_role_column(self, member_repository, mock_session, role, expected):
+        """Only the role scalar is fetched; no CaseMember is hydrated"""
+        # Arrange
+        mock_session.execute.return_value.scalar.return_value = role
+
+        # Act
+        result = member_repository.is_owner("case_1", "user_1")
+
+        # Assert
+        assert result is expected
+        stmt = mock_session.execute.call_args[0][0]
+        assert [c.name for c in stmt.selected_columns] == ["role"]
+        mock_session.execute.return_value.scalars.assert_not_called()
+
+
+class TestCaseMemberRepositoryAddMembersBatch:
+    """Tests for add_members_batch"""
+
+    @pytest.fixture(autouse=True)
+    def sqlite_bind(self, mock_session):
+        """Upsert construct is picked by dialect name"""
+        mock_session.get_bind.return_value.dialect.name = "sqlite"
+
+    def test_batch_is_single_upsert(self, member_repository, mock_session):
+        """Existing and new members go through one ON CONFLICT statement, no pre-SELECT"""
+        # Arrange
+        updated = Mock(spec=CaseMember)
+        updated.user_id = "user_1"
+        created = Mock(spec=CaseMember)
+        created.user_id = "user_2"
+        mock_session.scalars.return_value = [created, updated]
+
+        # Act
+        result = member_repository.add_members_batch(
+            "case_1",
+            [("user_1", CaseMemberRole.MEMBER), ("user_2", CaseMemberRole.VIEWER)]
+        )
+
+        # Assert
+        mock_session.execute.assert_not_called()
+        mock_session.add.assert_not_called()
+        mock_session.scalars.assert_called_once()
+        sql = str(mock_session.scalars.call_args[0][0].compile(dialect=sqlite.dialect()))
+        assert "ON CONFLICT" in sql
+        assert result == [updated, created]
+
+    def test_duplicate_user_ids_are_added_once(self, member_repository, mock_session):
+        """Repeated user_id in one batch upserts a single row with the last role"""
+        # Arrange
+        created = Mock(spec=CaseMember)
+        created.user_id = "user_1"
+        mock_session.scalars.return_value = [created]
+
+        # Act
+        member_repository.add_members_batch(
+            "case_1",
+            [("user_1", CaseMemberRole.VIEWER), ("user_1", CaseMemberRole.MEMBER)]
+        )
+
+        # Assert
+        params = mock_session.scalars.call_args[0][0].compile(dialect=sqlite.dialect()).params
+        assert params["user_id_m0"] == "user_1"
+        assert params["role_m0"] == CaseMemberRole.MEMBER
+        assert "user_id_m1" not in params
+
+    def test_empty_batch_issues_no_statement(self, member_repository, mock_session):
+        """Nothing to add means no round-trip"""
+        assert member_repository.add_members_batch("case_1", []) == []
+        mock_session.scalars.assert_not_called()
@@ -6,7 +6,7 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 from app.repositories.case_repository import CaseRepository
-from app.db.models import Case
+from app.db.models import Case, CaseMember
 
 
 @pytest.fixture
@@ -41,14 +41,14 @@ def sample_case():
 class TestCaseRepositoryCreate:
     """Tests for create method"""
 
-    @patch("app.repositories.case_repository.uuid")
+    @patch("app.repositories.case_repository.generate_id")
     @patch("app.repositories.case_repository.datetime")
     def test_create_case_success(
-        self, mock_datetime, mock_uuid, case_repository, mock_session
+        self, mock_datetime, mock_generate_id, case_repository, mock_session
     ):
         """Test successful case creation"""
         # Arrange
-        mock_uuid.uuid4.return_value.hex = "abc123def456"
+        mock_generate_id.return_value = "case_abc123def456"
         mock_now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         mock_datetime.now.return_value = mock_now
 
@@ -65,19 +65,20 @@ class TestCaseRepositoryCreate:
 
         # Check the case was created with correct values
         added_case = mock_session.add.call_args[0][0]
+        mock_generate_id.assert_called_once_with("case")
         assert added_case.id == "case_abc123def456"
         assert added_case.title == title
         assert added_case.description == description
         assert added_case.status == "active"
         assert added_case.created_by == created_by
 
-    @patch("app.repositories.case_repository.uuid")
+    @patch("app.repositories.case_repository.generate_id")
     def test_create_case_without_description(
-        self, mock_uuid, case_repository, mock_session
+        self, mock_generate_id, case_repository, mock_session
     ):
         """Test case creation without description"""
         # Arrange
-        mock_uuid.uuid4.return_value.hex = "abc123def456"
+        mock_generate_id.return_value = "case_abc123def456"
 
         title = "새 사건"
         created_by = "user_456"
@@ -125,6 +126,36 @@ class TestCaseRepositoryGetById:
         assert result is None
 
 
+class TestCaseRepositoryGetWithMember:
+    """Tests for get_with_member method"""
+
+    def test_get_with_member_found(self, case_repository, mock_session, sample_case):
+        """Test case and membership are returned from one query"""
+        # Arrange
+        member = Mock(spec=CaseMember)
+        mock_session.execute.return_value.first.return_value = (sample_case, member)
+
+        # Act
+        case, result_member = case_repository.get_with_member("case_123abc", "user_456")
+
+        # Assert
+        assert case == sample_case
+        assert result_member == member
+        mock_session.execute.assert_called_once()
+        assert mock_session.execute.call_args[0][1] == {"case_id": "case_123abc", "user_id": "user_456"}
+
+    def test_get_with_member_case_not_found(self, case_repository, mock_session):
+        """Test missing case returns (None, None)"""
+        # Arrange
+        mock_session.execute.return_value.first.return_value = None
+
+        # Act
+        result = case_repository.get_with_member("nonexistent", "user_456")
+
+        # Assert
+        assert result == (None, None)
+
+
 class TestCaseRepositoryGetAllForUser:
     """Tests for get_all_for_user method"""
 
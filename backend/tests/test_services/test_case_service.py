@@ -91,7 +91,7 @@ class TestCaseServiceCreate:
             role="owner"
         )
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once_with(sample_case)
+        mock_db.refresh.assert_not_called()
         assert result.id == sample_case.id
 
     def test_create_case_without_description(self, case_service, mock_db, sample_case):
@@ -153,15 +153,13 @@ class TestCaseServiceGetById:
         case_id = "case_123abc"
         user_id = "user_456"
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.has_access.return_value = True
+        case_service.case_repo.get_with_member.return_value = (sample_case, Mock(spec=CaseMember))
 
         # Act
         result = case_service.get_case_by_id(case_id, user_id)
 
         # Assert
-        case_service.case_repo.get_by_id.assert_called_once_with(case_id)
-        case_service.member_repo.has_access.assert_called_once_with(case_id, user_id)
+        case_service.case_repo.get_with_member.assert_called_once_with(case_id, user_id)
         assert result.id == case_id
 
     def test_get_case_by_id_not_found(self, case_service):
@@ -170,7 +168,7 @@ class TestCaseServiceGetById:
         case_id = "nonexistent"
         user_id = "user_456"
 
-        case_service.case_repo.get_by_id.return_value = None
+        case_service.case_repo.get_with_member.return_value = (None, None)
 
         # Act & Assert
         with pytest.raises(NotFoundError):
@@ -182,8 +180,7 @@ class TestCaseServiceGetById:
         case_id = "case_123abc"
         user_id = "other_user"
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.has_access.return_value = False
+        case_service.case_repo.get_with_member.return_value = (sample_case, None)
 
         # Act & Assert
         with pytest.raises(PermissionError):
@@ -200,8 +197,7 @@ class TestCaseServiceUpdate:
         user_id = "user_456"
         update_data = CaseUpdate(title="수정된 제목", description="수정된 설명")
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.get_member.return_value = sample_member
+        case_service.case_repo.get_with_member.return_value = (sample_case, sample_member)
 
         # Act
         case_service.update_case(case_id, update_data, user_id)
@@ -218,7 +214,7 @@ class TestCaseServiceUpdate:
         user_id = "user_456"
         update_data = CaseUpdate(title="수정된 제목")
 
-        case_service.case_repo.get_by_id.return_value = None
+        case_service.case_repo.get_with_member.return_value = (None, None)
 
         # Act & Assert
         with pytest.raises(NotFoundError):
@@ -234,8 +230,7 @@ class TestCaseServiceUpdate:
         viewer_member = Mock(spec=CaseMember)
         viewer_member.role = CaseMemberRole.VIEWER
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.get_member.return_value = viewer_member
+        case_service.case_repo.get_with_member.return_value = (sample_case, viewer_member)
 
         # Act & Assert
         with pytest.raises(PermissionError):
@@ -253,8 +248,7 @@ class TestCaseServiceDelete:
 
         sample_member.role = "owner"
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.get_member.return_value = sample_member
+        case_service.case_repo.get_with_member.return_value = (sample_case, sample_member)
 
         # Act
         case_service.delete_case(case_id, user_id)
@@ -271,8 +265,7 @@ class TestCaseServiceDelete:
 
         sample_member.role = "member"
 
-        case_service.case_repo.get_by_id.return_value = sample_case
-        case_service.member_repo.get_member.return_value = sample_member
+        case_service.case_repo.get_with_member.return_value = (sample_case, sample_member)
 
         # Act & Assert
         with pytest.raises(PermissionError):
@@ -295,6 +288,7 @@ class TestCaseServiceMembers:
         case_service.case_repo.get_by_id.return_value = sample_case
         case_service.member_repo.is_owner.return_value = True
         case_service.user_repo.get_by_id.return_value = sample_user
+        case_service.user_repo.get_existing_ids.return_value = {"new_user_1", "new_user_2"}
         case_service.member_repo.has_access.return_value = True
         case_service.member_repo.get_all_members.return_value = []
 
@@ -302,6 +296,8 @@ class TestCaseServiceMembers:
         case_service.add_case_members(case_id, members_to_add, owner_id)
 
         # Assert
+        case_service.user_repo.get_by_id.assert_not_called()  # owner: no requester lookup
+        case_service.user_repo.get_existing_ids.assert_called_once()
         case_service.member_repo.add_members_batch.assert_called_once()
         mock_db.commit.assert_called()
 
@@ -324,6 +320,23 @@ class TestCaseServiceMembers:
         with pytest.raises(PermissionError):
             case_service.add_case_members(case_id, members_to_add, user_id)
 
+    def test_add_members_unknown_user(self, case_service, sample_case):
+        """Test adding a nonexistent user raises NotFoundError before any insert"""
+        # Arrange
+        members_to_add = [
+            CaseMemberAdd(user_id="new_user_1", permission=CaseMemberPermission.READ),
+            CaseMemberAdd(user_id="ghost_user", permission=CaseMemberPermission.READ)
+        ]
+
+        case_service.case_repo.get_by_id.return_value = sample_case
+        case_service.member_repo.is_owner.return_value = True
+        case_service.user_repo.get_existing_ids.return_value = {"new_user_1"}
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            case_service.add_case_members("case_123abc", members_to_add, "owner_user")
+        case_service.member_repo.add_members_batch.assert_not_called()
+
     def test_get_case_members_success(self, case_service, sample_case, sample_member, sample_user):
         """Test getting case members"""
         # Arrange
@@ -332,8 +345,8 @@ class TestCaseServiceMembers:
 
         case_service.case_repo.get_by_id.return_value = sample_case
         case_service.member_repo.has_access.return_value = True
+        sample_member.user = sample_user
         case_service.member_repo.get_all_members.return_value = [sample_member]
-        case_service.user_repo.get_by_id.return_value = sample_user
 
         # Act
         result = case_service.get_case_members(case_id, user_id)
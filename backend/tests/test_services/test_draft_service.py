@@ -6,7 +6,8 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 from io import BytesIO
-from app.services.draft_service import DraftService
+from app.services import draft_service as draft_service_module
+from app.services.draft_service import DraftService, _SYSTEM_PROMPT
 from app.db.schemas import (
     DraftPreviewRequest,
     DraftPreviewResponse,
@@ -17,6 +18,14 @@ from app.db.models import Case
 from app.middleware import NotFoundError, PermissionError, ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_preview_cache():
+    """Isolate tests from the module-level draft preview cache"""
+    draft_service_module._preview_cache.clear()
+    yield
+    draft_service_module._preview_cache.clear()
+
+
 @pytest.fixture
 def mock_db():
     """Mock database session"""
@@ -124,6 +133,142 @@ class TestDraftServicePreview:
         assert result.draft_text == "생성된 초안 내용입니다."
         assert len(result.citations) > 0
         mock_gpt.assert_called_once()
+        assert mock_gpt.call_args.kwargs["prompt_cache_key"] == case_id
+
+    @patch("app.services.draft_service.generate_chat_completion")
+    @patch("app.services.draft_service.search_evidence_by_semantic")
+    @patch("app.services.draft_service.get_evidence_by_case")
+    def test_generate_draft_preview_cached(
+        self,
+        mock_get_evidence,
+        mock_rag_search,
+        mock_gpt,
+        draft_service,
+        sample_case,
+        sample_evidence_list,
+        sample_rag_results
+    ):
+        """Test repeat preview reuses the draft until evidence changes"""
+        # Arrange
+        request = DraftPreviewRequest()
+        draft_service.case_repo.get_by_id.return_value = sample_case
+        draft_service.member_repo.has_access.return_value = True
+        mock_get_evidence.return_value = sample_evidence_list
+        mock_rag_search.return_value = sample_rag_results
+        mock_gpt.return_value = "생성된 초안 내용입니다."
+
+        # Act
+        first = draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        second = draft_service.generate_draft_preview("case_123abc", request, "user_456")
+
+        # Assert - second call skipped GPT (RAG runs ahead of the cache check)
+        assert second == first
+        mock_gpt.assert_called_once()
+
+        # New evidence uploaded -> new key, regenerated
+        mock_get_evidence.return_value = sample_evidence_list + [
+            {"id": "ev_003", "case_id": "case_123abc", "status": "pending"}
+        ]
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        assert mock_gpt.call_count == 2
+
+    @patch("app.services.draft_service.generate_chat_completion")
+    @patch("app.services.draft_service.search_evidence_by_semantic")
+    @patch("app.services.draft_service.get_evidence_by_case")
+    def test_generate_draft_preview_regenerates_after_reprocessing(
+        self,
+        mock_get_evidence,
+        mock_rag_search,
+        mock_gpt,
+        draft_service,
+        sample_case,
+        sample_rag_results
+    ):
+        """Test evidence re-processed to the same status (only processed_at moves) misses the cache"""
+        # Arrange
+        request = DraftPreviewRequest()
+        draft_service.case_repo.get_by_id.return_value = sample_case
+        draft_service.member_repo.has_access.return_value = True
+        mock_rag_search.return_value = sample_rag_results
+        mock_gpt.return_value = "생성된 초안 내용입니다."
+        evidence = {"id": "ev_001", "case_id": "case_123abc", "status": "done",
+                    "created_at": "2024-01-01T00:00:00", "processed_at": "2024-01-01T00:05:00"}
+
+        # Act
+        mock_get_evidence.return_value = [evidence]
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        mock_get_evidence.return_value = [{**evidence, "processed_at": "2024-01-02T09:00:00"}]
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+
+        # Assert
+        assert mock_gpt.call_count == 2
+
+    @patch("app.services.draft_service.generate_chat_completion")
+    @patch("app.services.draft_service.search_evidence_by_semantic")
+    @patch("app.services.draft_service.get_evidence_by_case")
+    def test_generate_draft_preview_keys_rag_search_by_evidence(
+        self,
+        mock_get_evidence,
+        mock_rag_search,
+        mock_gpt,
+        draft_service,
+        sample_case,
+        sample_rag_results
+    ):
+        """Test re-processed evidence changes the RAG search cache token (no stale Qdrant results)"""
+        # Arrange
+        request = DraftPreviewRequest()
+        draft_service.case_repo.get_by_id.return_value = sample_case
+        draft_service.member_repo.has_access.return_value = True
+        mock_rag_search.return_value = sample_rag_results
+        mock_gpt.return_value = "초안"
+        evidence = {"id": "ev_001", "case_id": "case_123abc", "status": "done",
+                    "created_at": "2024-01-01T00:00:00", "processed_at": "2024-01-01T00:05:00"}
+
+        # Act
+        mock_get_evidence.return_value = [evidence]
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        mock_get_evidence.return_value = [{**evidence, "processed_at": "2024-01-02T09:00:00"}]
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+
+        # Assert: the preview cache hit skips Qdrant; the re-processed set gets a new token
+        tokens = [call.kwargs["cache_token"] for call in mock_rag_search.call_args_list]
+        assert len(tokens) == 2
+        assert tokens[0] != tokens[1]
+
+    @patch("app.services.draft_service.generate_chat_completion")
+    @patch("app.services.draft_service.search_evidence_by_semantic")
+    @patch("app.services.draft_service.get_evidence_by_case")
+    def test_generate_draft_preview_template_when_rag_empty(
+        self,
+        mock_get_evidence,
+        mock_rag_search,
+        mock_gpt,
+        draft_service,
+        sample_case,
+        sample_evidence_list
+    ):
+        """Test empty RAG results return a template draft without GPT-4o"""
+        # Arrange
+        request = DraftPreviewRequest(sections=["청구취지", "청구원인"])
+        draft_service.case_repo.get_by_id.return_value = sample_case
+        draft_service.member_repo.has_access.return_value = True
+        mock_get_evidence.return_value = sample_evidence_list
+        mock_rag_search.return_value = []
+
+        # Act
+        result = draft_service.generate_draft_preview("case_123abc", request, "user_456")
+        draft_service.generate_draft_preview("case_123abc", request, "user_456")
+
+        # Assert
+        mock_gpt.assert_not_called()
+        assert "템플릿 전용" in result.draft_text
+        assert sample_case.title in result.draft_text
+        assert "## 청구원인" in result.draft_text
+        assert result.citations == []
+        # Template is not cached: RAG is retried on the next request
+        assert mock_rag_search.call_count == 2
 
     @patch("app.services.draft_service.get_evidence_by_case")
     def test_generate_draft_preview_case_not_found(
@@ -158,9 +303,10 @@ class TestDraftServicePreview:
         with pytest.raises(PermissionError):
             draft_service.generate_draft_preview(case_id, request, user_id)
 
+    @patch("app.services.draft_service.search_evidence_by_semantic", return_value=[])
     @patch("app.services.draft_service.get_evidence_by_case")
     def test_generate_draft_preview_no_evidence(
-        self, mock_get_evidence, draft_service, sample_case
+        self, mock_get_evidence, mock_rag_search, draft_service, sample_case
     ):
         """Test draft preview when case has no evidence"""
         # Arrange
@@ -224,7 +370,7 @@ class TestDraftServicePromptBuilding:
     """Tests for _build_draft_prompt method"""
 
     def test_build_draft_prompt_structure(self, draft_service, sample_case):
-        """Test prompt structure has system and user messages"""
+        """Test prompt is ordered system -> case -> settings -> evidence"""
         # Arrange
         sections = ["청구원인"]
         rag_context = [{"id": "ev_001", "content": "증거 내용"}]
@@ -239,11 +385,25 @@ class TestDraftServicePromptBuilding:
         )
 
         # Assert
-        assert len(messages) == 2
-        assert messages[0]["role"] == "system"
-        assert messages[1]["role"] == "user"
+        assert [m["role"] for m in messages] == ["system", "user", "user", "user"]
+        assert messages[0]["content"] is _SYSTEM_PROMPT
         assert "법률가" in messages[0]["content"]
         assert sample_case.title in messages[1]["content"]
+        assert "청구원인" in messages[2]["content"]
+        assert "ev_001" in messages[3]["content"]
+        assert all("ev_001" not in m["content"] for m in messages[:3])
+
+    def test_build_draft_prompt_prefix_shared_until_evidence(self, draft_service, sample_case):
+        """Test new evidence only changes the last message"""
+        kwargs = dict(case=sample_case, sections=["청구원인"], language="ko", style="formal")
+
+        first = draft_service._build_draft_prompt(rag_context=[], **kwargs)
+        second = draft_service._build_draft_prompt(
+            rag_context=[{"id": "ev_9", "content": "x"}], **kwargs
+        )
+
+        assert first[:3] == second[:3]
+        assert first[3] != second[3]
 
     def test_format_rag_context_empty(self, draft_service):
         """Test RAG context formatting when empty"""
@@ -307,10 +467,11 @@ class TestDraftServiceCitations:
 class TestDraftServiceExport:
     """Tests for export_draft method"""
 
-    @patch.object(DraftService, "generate_draft_preview")
+    @patch("app.services.draft_service.get_evidence_by_case")
+    @patch.object(DraftService, "_build_preview")
     @patch.object(DraftService, "_generate_docx")
     def test_export_draft_docx_success(
-        self, mock_generate_docx, mock_preview, draft_service, sample_case
+        self, mock_generate_docx, mock_preview, mock_get_evidence, draft_service, sample_case
     ):
         """Test successful DOCX export"""
         # Arrange
@@ -339,6 +500,9 @@ class TestDraftServiceExport:
         # Assert
         assert result[1].endswith(".docx")
         mock_generate_docx.assert_called_once()
+        # Access is checked once for the whole export
+        draft_service.case_repo.get_by_id.assert_called_once_with(case_id)
+        draft_service.member_repo.has_access.assert_called_once_with(case_id, user_id)
 
     def test_export_draft_case_not_found(self, draft_service):
         """Test export with non-existent case"""
@@ -417,3 +581,48 @@ class TestDraftServiceDocxGeneration:
             draft_service._generate_docx(sample_case, draft_response)
 
         assert "python-docx" in str(exc_info.value)
+
+
+class TestDraftServicePdf:
+    """Tests for _generate_pdf method"""
+
+    def test_generate_pdf_renders_document(self, draft_service, sample_case):
+        """Test PDF rendering with the module-level stylesheet"""
+        draft_response = DraftPreviewResponse(
+            case_id="case_123abc",
+            draft_text="첫 문단\n\n둘째 문단",
+            citations=[],
+            generated_at=datetime.now(timezone.utc)
+        )
+
+        file_buffer, filename, content_type = draft_service._generate_pdf(sample_case, draft_response)
+
+        assert file_buffer.read(4) == b"%PDF"
+        assert filename.endswith(".pdf")
+        assert content_type == "application/pdf"
+
+    def test_generate_pdf_escapes_markup(self, draft_service, sample_case):
+        """Test LLM text containing markup characters still renders"""
+        draft_response = DraftPreviewResponse(
+            case_id="case_123abc",
+            draft_text="위자료 <청구> & 재산분할\n\n<b 미완성 태그",
+            citations=[],
+            generated_at=datetime.now(timezone.utc)
+        )
+
+        file_buffer, _, _ = draft_service._generate_pdf(sample_case, draft_response)
+
+        assert file_buffer.read(4) == b"%PDF"
+
+    def test_generate_pdf_unavailable(self, draft_service, sample_case):
+        """Test PDF export without reportlab raises ValidationError"""
+        draft_response = DraftPreviewResponse(
+            case_id="case_123abc",
+            draft_text="초안",
+            citations=[],
+            generated_at=datetime.now(timezone.utc)
+        )
+
+        with patch.object(draft_service_module, "PDF_AVAILABLE", False):
+            with pytest.raises(ValidationError):
+                draft_service._generate_pdf(sample_case, draft_response)
@@ -4,6 +4,7 @@ Tests for EvidenceService
 
 import pytest
 from unittest.mock import Mock, patch
+from app.services import evidence_service as evidence_service_module
 from app.services.evidence_service import EvidenceService
 from app.db.schemas import (
     PresignedUrlRequest,
@@ -14,6 +15,14 @@ from app.db.models import Case
 from app.middleware import NotFoundError, PermissionError
 
 
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    """Isolate tests from the module-level parsed summary cache"""
+    evidence_service_module._summary_cache.clear()
+    yield
+    evidence_service_module._summary_cache.clear()
+
+
 @pytest.fixture
 def mock_db():
     """Mock database session"""
@@ -232,6 +241,38 @@ class TestEvidenceServiceGetList:
         assert result[0].id == "ev_001"
         assert result[0].filename == "photo.jpg"
 
+    @patch("app.services.evidence_service.get_evidence_by_case")
+    def test_get_evidence_list_reuses_parse_for_same_items(
+        self, mock_get_evidence, evidence_service, sample_case
+    ):
+        """Test unchanged DynamoDB items are parsed once; new items re-parse"""
+        # Arrange
+        item = {
+            "id": "ev_001",
+            "case_id": "case_123abc",
+            "type": "image",
+            "filename": "photo.jpg",
+            "created_at": "2024-01-01T00:00:00",
+            "status": "pending"
+        }
+        evidence_service.case_repo.get_by_id.return_value = sample_case
+        evidence_service.member_repo.has_access.return_value = True
+
+        # Act - dynamo's cache hands out fresh lists holding the same dicts
+        mock_get_evidence.side_effect = lambda case_id: [item]
+        first = evidence_service.get_evidence_list("case_123abc", "user_456")
+        second = evidence_service.get_evidence_list("case_123abc", "user_456")
+
+        mock_get_evidence.side_effect = lambda case_id: [{**item, "status": "done"}]
+        third = evidence_service.get_evidence_list("case_123abc", "user_456")
+
+        # Assert
+        assert second[0] is first[0]
+        assert second is not first
+        assert third[0].status == "done"
+        # Re-parse reuses the memoized created_at
+        assert third[0].created_at is first[0].created_at
+
     @patch("app.services.evidence_service.get_evidence_by_case")
     def test_get_evidence_list_empty(
         self, mock_get_evidence, evidence_service, sample_case
@@ -305,8 +346,49 @@ class TestEvidenceServiceGetList:
         assert len(result) == 1
         assert result[0].id == "ev_001"
 
-    def test_get_evidence_list_case_not_found(self, evidence_service):
-        """Test getting evidence list for non-existent case"""
+    @patch("app.services.evidence_service.get_evidence_by_case")
+    def test_get_evidence_list_multi_category_filter(
+        self, mock_get_evidence, evidence_service, sample_case
+    ):
+        """Test items matching several requested categories appear once, in list order"""
+        # Arrange
+        def item(evidence_id, categories):
+            return {
+                "id": evidence_id,
+                "case_id": "case_123abc",
+                "type": "text",
+                "filename": f"{evidence_id}.txt",
+                "created_at": "2024-01-01T00:00:00",
+                "article_840_tags": {"categories": categories},
+            }
+
+        mock_get_evidence.return_value = [
+            item("ev_003", ["desertion"]),
+            item("ev_002", []),
+            item("ev_001", ["adultery", "desertion"]),
+        ]
+        evidence_service.case_repo.get_by_id.return_value = sample_case
+        evidence_service.member_repo.has_access.return_value = True
+
+        # Act
+        result = evidence_service.get_evidence_list(
+            "case_123abc", "user_456",
+            categories=[Article840Category.ADULTERY, Article840Category.DESERTION]
+        )
+
+        # Assert
+        assert [summary.id for summary in result] == ["ev_003", "ev_001"]
+
+        # A single (repeated) category reads its prebuilt subset in order
+        result = evidence_service.get_evidence_list(
+            "case_123abc", "user_456",
+            categories=[Article840Category.DESERTION, Article840Category.DESERTION]
+        )
+        assert [summary.id for summary in result] == ["ev_003", "ev_001"]
+
+    @patch("app.services.evidence_service.get_evidence_by_case")
+    def test_get_evidence_list_case_not_found(self, mock_get_evidence, evidence_service):
+        """Test getting evidence list for non-existent case skips DynamoDB"""
         # Arrange
         case_id = "nonexistent"
         user_id = "user_456"
@@ -316,6 +398,7 @@ class TestEvidenceServiceGetList:
         # Act & Assert
         with pytest.raises(NotFoundError):
             evidence_service.get_evidence_list(case_id, user_id)
+        mock_get_evidence.assert_not_called()
 
 
 class TestEvidenceServiceGetDetail:
@@ -0,0 +1,157 @@
+"""
+Tests for DynamoDB evidence list caching
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from app.utils import dynamo
+
+
+@pytest.fixture
+def mock_dynamodb():
+    """Mock DynamoDB client with an isolated evidence cache"""
+    client = MagicMock()
+    client.query.return_value = {
+        "Items": [
+            {"evidence_id": {"S": "ev_1"}, "case_id": {"S": "case_1"}, "created_at": {"S": "2024-01-01T00:00:00"}}
+        ]
+    }
+    dynamo._case_evidence_cache.clear()
+    with patch.object(dynamo, "_get_dynamodb_client", return_value=client):
+        yield client
+    dynamo._case_evidence_cache.clear()
+
+
+class TestEvidenceListCache:
+    """Tests for get_evidence_by_case caching"""
+
+    def test_repeated_reads_query_once(self, mock_dynamodb):
+        """Second read for the same case is served from cache"""
+        first = dynamo.get_evidence_by_case("case_1")
+        second = dynamo.get_evidence_by_case("case_1")
+
+        assert first == second
+        assert first[0]["evidence_id"] == "ev_1"
+        assert mock_dynamodb.query.call_count == 1
+
+    def test_put_invalidates_case(self, mock_dynamodb):
+        """Writing evidence for a case forces the next read to hit DynamoDB"""
+        dynamo.get_evidence_by_case("case_1")
+
+        dynamo.put_evidence_metadata({"id": "ev_2", "case_id": "case_1"})
+        dynamo.get_evidence_by_case("case_1")
+
+        assert mock_dynamodb.query.call_count == 2
+
+    def test_delete_without_case_clears_all(self, mock_dynamodb):
+        """Delete without case_id cannot target a key, so the cache is cleared"""
+        dynamo.get_evidence_by_case("case_1")
+
+        dynamo.delete_evidence_metadata("ev_1")
+
+        assert len(dynamo._case_evidence_cache) == 0
+
+    def test_list_query_projects_summary_attributes(self, mock_dynamodb):
+        """List query asks DynamoDB for summary attributes only"""
+        dynamo.get_evidence_by_case("case_1")
+
+        kwargs = mock_dynamodb.query.call_args.kwargs
+        requested = {kwargs["ExpressionAttributeNames"][p.strip()] for p in kwargs["ProjectionExpression"].split(",")}
+        assert "content" not in requested
+        assert {"evidence_id", "status", "article_840_tags"} <= requested
+
+    def test_list_query_follows_pagination(self, mock_dynamodb):
+        """Every page of a large case is read, not just the first 1 MB"""
+        mock_dynamodb.query.side_effect = [
+            {"Items": [{"evidence_id": {"S": "ev_1"}}], "LastEvaluatedKey": {"evidence_id": {"S": "ev_1"}}},
+            {"Items": [{"evidence_id": {"S": "ev_2"}}]},
+        ]
+
+        results = dynamo.get_evidence_by_case("case_1")
+
+        assert {r["evidence_id"] for r in results} == {"ev_1", "ev_2"}
+        assert mock_dynamodb.query.call_args.kwargs["ExclusiveStartKey"] == {"evidence_id": {"S": "ev_1"}}
+
+
+    def test_list_items_share_interned_strings(self, mock_dynamodb):
+        """Repeated type/status/category values are one string object per value"""
+        def item(evidence_id):
+            return {
+                "evidence_id": {"S": evidence_id},
+                "type": {"S": "".join(["im", "age"])},
+                "status": {"S": "".join(["do", "ne"])},
+                "article_840_tags": {"M": {"categories": {"L": [{"S": "".join(["adult", "ery"])}]}}},
+            }
+        mock_dynamodb.query.return_value = {"Items": [item("ev_1"), item("ev_2")]}
+
+        first, second = dynamo.get_evidence_by_case("case_1")
+
+        assert first["type"] is second["type"]
+        assert first["status"] is second["status"]
+        assert first["article_840_tags"]["categories"][0] is second["article_840_tags"]["categories"][0]
+
+
+class TestClearCaseEvidence:
+    """Tests for clear_case_evidence batch deletion"""
+
+    def test_deletes_in_batches_of_25(self, mock_dynamodb):
+        """Keys are deleted with BatchWriteItem, 25 per call, no per-id DeleteItem"""
+        mock_dynamodb.query.return_value = {
+            "Items": [{"evidence_id": {"S": f"ev_{i}"}} for i in range(30)]
+        }
+        mock_dynamodb.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+        deleted = dynamo.clear_case_evidence("case_1")
+
+        assert deleted == 30
+        sizes = [
+            len(call.kwargs["RequestItems"][dynamo.settings.DDB_EVIDENCE_TABLE])
+            for call in mock_dynamodb.batch_write_item.call_args_list
+        ]
+        assert sizes == [25, 5]
+        mock_dynamodb.delete_item.assert_not_called()
+
+    def test_retries_unprocessed_items(self, mock_dynamodb):
+        """Throttled requests are resent until DynamoDB accepts them"""
+        table = dynamo.settings.DDB_EVIDENCE_TABLE
+        mock_dynamodb.query.return_value = {
+            "Items": [{"evidence_id": {"S": "ev_1"}}, {"evidence_id": {"S": "ev_2"}}]
+        }
+        leftover = [{"DeleteRequest": {"Key": {"evidence_id": {"S": "ev_2"}}}}]
+        mock_dynamodb.batch_write_item.side_effect = [
+            {"UnprocessedItems": {table: leftover}},
+            {"UnprocessedItems": {}},
+        ]
+
+        with patch.object(dynamo.time, "sleep"):
+            deleted = dynamo.clear_case_evidence("case_1")
+
+        assert deleted == 2
+        assert mock_dynamodb.batch_write_item.call_args.kwargs["RequestItems"] == {table: leftover}
+
+
+class TestDynamoSerialization:
+    """Tests for DynamoDB attribute conversion"""
+
+    def test_round_trip(self):
+        """Serialize then deserialize returns the original item"""
+        item = {
+            "evidence_id": "ev_1",
+            "size": 1024,
+            "confidence": 0.85,
+            "done": True,
+            "speaker": None,
+            "article_840_tags": {"categories": ["adultery"], "matched_keywords": []},
+        }
+
+        assert dynamo._deserialize_dynamodb_item(dynamo._serialize_to_dynamodb(item)) == item
+
+    def test_set_and_unknown_types(self):
+        """String/number sets become lists; unsupported tags become None"""
+        item = {"tags": {"SS": ["a", "b"]}, "scores": {"NS": ["1", "2.5"]}, "blob": {"B": b""}}
+
+        assert dynamo._deserialize_dynamodb_item(item) == {
+            "tags": ["a", "b"],
+            "scores": [1, 2.5],
+            "blob": None,
+        }
@@ -0,0 +1,68 @@
+"""
+Tests for OpenAI token utilities
+"""
+
+import pytest
+from unittest.mock import patch
+from app.utils import openai_client
+
+
+@pytest.fixture
+def clear_encodings():
+    """Encodings are cached per process; isolate each test"""
+    openai_client._encodings.clear()
+    openai_client._encoding_failures.clear()
+    yield
+    openai_client._encodings.clear()
+    openai_client._encoding_failures.clear()
+
+
+class _PairEncoding:
+    """Stub encoding: every two characters form one token"""
+
+    def encode(self, text):
+        return [text[i:i + 2] for i in range(0, len(text), 2)]
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+class TestTruncateTokens:
+    """Tests for truncate_tokens"""
+
+    def test_short_text_skips_encoding(self):
+        """Text no longer than the limit in UTF-8 bytes is returned without tokenizing"""
+        with patch.object(openai_client, "_get_encoding") as mock_encoding:
+            assert openai_client.truncate_tokens("짧은", 6) == "짧은"
+        mock_encoding.assert_not_called()
+
+    def test_multi_token_characters_are_tokenized(self):
+        """Characters shorter than the limit can still exceed it in tokens"""
+        with patch.object(openai_client, "_get_encoding", return_value=_PairEncoding()) as mock_encoding:
+            assert openai_client.truncate_tokens("가나다라마바", 3) == "가나다라마바"
+        mock_encoding.assert_called_once()
+
+    def test_cuts_on_token_boundary(self):
+        """Long text keeps its leading max_tokens tokens"""
+        with patch.object(openai_client, "_get_encoding", return_value=_PairEncoding()):
+            assert openai_client.truncate_tokens("가나다라마바", 2) == "가나다라"
+            assert openai_client.truncate_tokens("가나다라", 2) == "가나다라"
+
+    def test_falls_back_to_char_estimate(self):
+        """Without tiktoken the cut uses the chars-per-token estimate"""
+        with patch.object(openai_client, "_get_encoding", return_value=None):
+            assert openai_client.truncate_tokens("가" * 100, 10) == "가" * 20
+
+
+class TestGetEncoding:
+    """Tests for _get_encoding caching"""
+
+    def test_failed_load_is_retried(self, clear_encodings):
+        """A BPE download failure is not cached for the life of the process"""
+        encoding = object()
+        with patch("tiktoken.encoding_for_model", side_effect=[OSError("download failed"), encoding]):
+            assert openai_client._get_encoding("gpt-4o") is None
+            assert openai_client._get_encoding("gpt-4o") is None  # within the retry delay
+            openai_client._encoding_failures.clear()
+            assert openai_client._get_encoding("gpt-4o") is encoding
+            assert openai_client._get_encoding("gpt-4o") is encoding
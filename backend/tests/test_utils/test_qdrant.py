@@ -0,0 +1,89 @@
+"""
+Tests for Qdrant semantic search
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from httpx import Headers
+from qdrant_client.http.exceptions import UnexpectedResponse
+from app.utils import qdrant
+
+
+@pytest.fixture
+def mock_qdrant():
+    """Mock Qdrant client returning one hit, with isolated caches"""
+    client = MagicMock()
+    hit = MagicMock(payload={"id": "ev_1"}, score=0.9)
+    client.query_points.return_value.points = [hit]
+    qdrant._search_cache.clear()
+    qdrant._embed_query.cache_clear()
+    with patch.object(qdrant, "_get_qdrant_client", return_value=client):
+        yield client
+    qdrant._search_cache.clear()
+    qdrant._embed_query.cache_clear()
+
+
+class TestSearchEvidenceBySemantic:
+    """Tests for search_evidence_by_semantic"""
+
+    def test_single_qdrant_round_trip(self, mock_qdrant):
+        """Search goes straight to query_points without listing collections"""
+        with patch.object(qdrant, "generate_embedding", return_value=[0.1, 0.2]):
+            results = qdrant.search_evidence_by_semantic("case_1", "폭언")
+
+        assert results == [{"id": "ev_1", "_score": 0.9}]
+        assert mock_qdrant.query_points.call_args.kwargs["query"] == [0.1, 0.2]
+        mock_qdrant.get_collections.assert_not_called()
+
+    def test_missing_collection_returns_empty(self, mock_qdrant):
+        """Unknown case collection (404 from query_points) yields no results"""
+        mock_qdrant.query_points.side_effect = UnexpectedResponse(
+            404, "Not Found", b"", Headers()
+        )
+
+        with patch.object(qdrant, "generate_embedding", return_value=[0.1]):
+            results = qdrant.search_evidence_by_semantic("case_2", "폭언")
+
+        assert results == []
+
+    def test_repeated_search_served_from_cache(self, mock_qdrant):
+        """Same case/query/top_k hits Qdrant and OpenAI once"""
+        with patch.object(qdrant, "generate_embedding", return_value=[0.1]) as mock_embed:
+            first = qdrant.search_evidence_by_semantic("case_1", "폭언", top_k=10)
+            second = qdrant.search_evidence_by_semantic("case_1", "폭언", top_k=10)
+            qdrant.search_evidence_by_semantic("case_2", "폭언", top_k=10)
+
+        assert first == second
+        assert mock_qdrant.query_points.call_count == 2
+        # Query embedding is case-independent
+        mock_embed.assert_called_once()
+
+    def test_cache_token_separates_results(self, mock_qdrant):
+        """A new cache_token (evidence re-indexed by the AI worker) queries Qdrant again"""
+        with patch.object(qdrant, "generate_embedding", return_value=[0.1]):
+            qdrant.search_evidence_by_semantic("case_1", "폭언", cache_token="v1")
+            qdrant.search_evidence_by_semantic("case_1", "폭언", cache_token="v1")
+            qdrant.search_evidence_by_semantic("case_1", "폭언", cache_token="v2")
+
+        assert mock_qdrant.query_points.call_count == 2
+
+    def test_index_invalidates_case_results(self, mock_qdrant):
+        """Indexing a document forces the next search to query Qdrant"""
+        with patch.object(qdrant, "generate_embedding", return_value=[0.1]):
+            qdrant.search_evidence_by_semantic("case_1", "폭언")
+            qdrant.index_evidence_document("case_1", {"id": "ev_2", "vector": [0.3]})
+            qdrant.search_evidence_by_semantic("case_1", "폭언")
+
+        assert mock_qdrant.query_points.call_count == 2
+
+
+class TestIndexEvidenceDocument:
+    """Tests for index_evidence_document payloads"""
+
+    def test_snippet_stored_at_index_time(self, mock_qdrant):
+        """Citation snippet is cut once on write and kept in the payload"""
+        qdrant.index_evidence_document("case_1", {"id": "ev_1", "content": "가" * 250, "vector": [0.1]})
+
+        payload = mock_qdrant.upsert.call_args.kwargs["points"][0].payload
+        assert payload["snippet"] == "가" * qdrant.SNIPPET_CHARS + "..."
+        assert payload["content"] == "가" * 250